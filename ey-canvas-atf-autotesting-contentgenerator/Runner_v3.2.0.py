@@ -2,9 +2,14 @@ import argparse
 import os
 import sys
 
+from Tests.Utils.StartupProfiler import StartupProfiler
+
+# Started before the framework imports so they are part of the breakdown
+startup_profiler = StartupProfiler.start() if "--profile-startup" in sys.argv else None
+
 from Core.framework.init_runner import Init_Runner
 
-from Tests.Utils.ContentCleanup import APIDeleteContentById
+from Tests.Utils.RunWorkspace import RunWorkspace
 from Tests.custom_methods.CommonMethods import CommonMethods as CM
  
 parser = argparse.ArgumentParser(description='CT ADO Scriptless Test Execution',
@@ -84,7 +89,17 @@ parser.add_argument("--object_locator", default=False, type=bool, help="Automati
 
 # Argument - Meta data regeneration
 parser.add_argument("--refresh_metadata", default=False, type=bool, help="Refresh meta data")
+
+# Arguments - Startup profiling
+parser.add_argument("--profile-startup", action="store_true",
+                    help="Print the import time per module before executing the tests and fail the execution if it "
+                         "is over the startup budget")
+parser.add_argument("--startup_budget", default=None, type=float,
+                    help="Maximum seconds of imports before executing the tests, STARTUP_IMPORT_BUDGET or "
+                         f"{StartupProfiler.DEFAULT_BUDGET} by default (0 disables the check)")
 init_run = Init_Runner()
+startup_within_budget = True
+workspace = None
 
 try:
     args = init_run.custom_arg_parser(parser)
@@ -102,29 +117,12 @@ try:
     app_variables = CM.get_app_env_variable(args.environment)
 
 
-    #Removing temp files
-    try:
-        os.remove("Tests/filesForTests/temp.json")
-    except Exception:
-        pass
-    try:
-        os.remove("Tests/filesForTests/temp_engagements.json")
-    except Exception:
-        pass
-    try:
-        os.remove("Tests/filesForTests/temp_test_information.json")
-    except Exception:
-        pass
-    try:
-        os.remove("Tests/filesForTests/temp_api/token_handler.json")
-    except Exception:
-        pass
- 
-
+    #Temp files of this execution, shared with the test execution through the ATF_RUN_ID environment variable
+    RunWorkspace.remove_stale_runs()
+    workspace = RunWorkspace.get_instance()
 
     #Generating temp config files from templates
-    CM.create_temp_config_file("Tests/filesForTests/Config/engagements.json", "Tests/filesForTests/temp_engagements.json")
-    CM.create_temp_config_file("Tests/filesForTests/Config/test_information.json", "Tests/filesForTests/temp_test_information.json")
+    CM.create_temp_config_files()
    
     #Setting up environment variables
     CM.set_value_in_temp_variable("Environment", args.environment)
@@ -147,16 +145,6 @@ try:
     else:
         CM.set_value_in_temp_variable("global_execution_type", "testsuite")
     
-    if (args.mode == "testcase"  or args.mode =="testsuite"):
-        temp_file_name = 'Scriptless Execution.' + args.name  
-        CM._initialization_of_temp_engagement_information_json_file(temp_file_name,global_Id,local_Id)
-        CM._initialization_of_temp_engagement_information_json_file("Scriptless Execution.Custom suite",global_Id,local_Id)
-        #Retrieving type of execution
-        if (args.mode == "testcase" ):
-            CM.set_value_in_temp_variable("global_execution_type", "testcase")
-        else:
-            CM.set_value_in_temp_variable("global_execution_type", "testsuite")
-
     if (args.mode == "testcase"  or args.mode =="testsuite"):
         temp_file_name = 'Scriptless Execution.' + args.name  
         CM._initialization_of_temp_engagement_information_json_file(temp_file_name,global_Id,local_Id)
@@ -164,16 +152,30 @@ try:
 
     if not init_run.check_os_env_vars():
         print("\033[93m" + "[WARNING] MISSING ENVIRONMENT VARIABLES!!! TEST EXECUTION MAY FAIL" + "\033[0m")
+    if args.mode != "testcase":
+        for warning in CM.get_test_dependency_graph().get_warnings():
+            print("\033[93m" + f"[WARNING] INVALID TEST DEPENDENCIES: {warning}" + "\033[0m")
+
     init_run.custom_generator()
+    CM.flush_temp_files()
+    if startup_profiler:
+        startup_within_budget = startup_profiler.report(args.startup_budget)
     status = init_run.execute_testcases(args)
 except Exception as e:
     status = 1
     init_run.get_error_details()
 
 if app_variables["deleteEntity"].lower() == 'true':
+    # Imported here so the API and token modules are only loaded by the executions that clean up content
+    from Tests.Utils.ContentCleanup import APIDeleteContentById
     APIDeleteContentById(environment=args.environment, prefix_file_name='Scriptless Execution.')
 
 
 CM._delete_temp_files('Scriptless Execution.')
 CM._delete_directory_files()
+# Only the process that created the workspace removes it, get_instance would create a new one once it is removed
+if workspace is not None and workspace.owner:
+    workspace.teardown()
+if status == 0 and not startup_within_budget:
+    sys.exit(1)
 sys.exit(init_run.get_error_details()) if status > 0 else sys.exit(0)
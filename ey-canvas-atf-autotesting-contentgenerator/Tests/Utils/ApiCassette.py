@@ -0,0 +1,306 @@
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+class CassetteResponse:
+    """
+    Replayed HTTP response with the attributes of requests.Response used by the framework
+    """
+
+    def __init__(self, status_code: int, text: str, headers: Optional[dict] = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class ApiCassette:
+    """
+    Record and replay of the API calls of an execution.
+
+    In record mode every request sent by BaseAPIClass.make_api_request and APIMethods.api_request is stored with its
+    response in a cassette file per suite (CASSETTES_DIR/<suite>.json); in replay mode the responses are returned
+    from the cassette without calling the API, optionally waiting the recorded time (latency simulation).
+
+    Interactions are indexed by method, path, query and a hash of the body, but not by host, so a cassette recorded in
+    an environment can be replayed in any other one or served by the local stand-in server of this module:
+        python -m Tests.Utils.ApiCassette serve "Tests/filesForTests/cassettes/UI_DashBoard_SmokeTest.json" --port 8080
+    Identical requests are replayed in the order they were recorded. Authorization headers are never stored, and in
+    replay mode the API classes send REPLAY_TOKEN instead of requesting tokens.
+
+    Every record has the status code and body text of the HTTP response, served as they are by the stand-in server;
+    callers that return another object (E.g: the scriptless response dict) store it next to them to replay it.
+
+    The mode is selected with the API_CASSETTE_MODE environment variable (off, record or replay) and the latency of
+    the replay with API_CASSETTE_LATENCY (recorded, a number of seconds, or 0 by default).
+    """
+    MODE_OFF = "off"
+    MODE_RECORD = "record"
+    MODE_REPLAY = "replay"
+    CASSETTES_DIR = os.path.join("Tests", "filesForTests", "cassettes")
+    REPLAY_TOKEN = "api-cassette-replay"
+
+    _instance: Optional['ApiCassette'] = None
+    _instance_lock = threading.Lock()
+    # Last HTTP response received by the thread through a session of capture_responses
+    _captured = threading.local()
+
+    def __init__(self, mode: str = MODE_OFF, file_path: Optional[str] = None, latency: str = "0"):
+        self.mode = mode
+        self.file_path = file_path
+        self.latency = latency
+        self._interactions: Dict[str, List[dict]] = {}
+        self._replay_positions: Dict[str, int] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.mode == self.MODE_REPLAY:
+            self._load()
+
+    @classmethod
+    def configure(cls, name: str, mode: Optional[str] = None, latency: Optional[str] = None) -> 'ApiCassette':
+        """
+        Selects the cassette of the execution
+        Args:
+            name (str): Name of the suite or test case, used as file name of the cassette
+            mode (str): off, record or replay, API_CASSETTE_MODE if not provided
+            latency (str): recorded or seconds to wait in replay, API_CASSETTE_LATENCY if not provided
+        """
+        mode = (mode or os.environ.get("API_CASSETTE_MODE", cls.MODE_OFF)).lower()
+        latency = latency or os.environ.get("API_CASSETTE_LATENCY", "0")
+        file_name = re.sub(r'[^\w\-. ]', '_', name or "default") + ".json"
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.save()
+            cls._instance = ApiCassette(mode, os.path.join(os.getcwd(), cls.CASSETTES_DIR, file_name), latency)
+            if mode != cls.MODE_OFF:
+                print(f"[INFO] API cassette in {mode} mode: {cls._instance.file_path}")
+            return cls._instance
+
+    @classmethod
+    def get_instance(cls) -> 'ApiCassette':
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = ApiCassette()
+            return cls._instance
+
+    @classmethod
+    def is_replaying(cls) -> bool:
+        return cls.get_instance().mode == cls.MODE_REPLAY
+
+    @classmethod
+    def capture_responses(cls, session):
+        """
+        Keeps the last HTTP response received through a requests.Session in record mode, so the raw status and body
+        of a request sent by a client that wraps its responses (E.g: the scriptless REST client) can be recorded
+        """
+        if cls.get_instance().mode != cls.MODE_RECORD:
+            return
+        hooks = session.hooks.setdefault("response", [])
+        if cls._capture_response not in hooks:
+            hooks.append(cls._capture_response)
+
+    @classmethod
+    def pop_captured_response(cls):
+        """
+        Returns:
+            requests.Response: last response captured in the current thread since the request started, None if none
+        """
+        response = getattr(cls._captured, "response", None)
+        cls._captured.response = None
+        return response
+
+    @classmethod
+    def _capture_response(cls, response, *args, **kwargs):
+        cls._captured.response = response
+        return response
+
+    @classmethod
+    def intercept(cls, method: str, url: str, params: Optional[dict], body: Any, send: Callable[[], Any],
+                  to_record: Callable[[Any], dict] = None, from_record: Callable[[dict], Any] = None) -> Any:
+        """
+        Sends a request through the cassette of the execution
+        Args:
+            method (str): HTTP method
+            url (str): Url of the request, with or without query string
+            params (dict): Query params not included in the url
+            body: JSON body of the request
+            send: Function sending the request and returning its response
+            to_record: Function converting the response into a JSON serializable dict, the response itself by default
+            from_record: Function converting a recorded dict back into a response, the dict itself by default
+        Returns:
+            the response of send, or the recorded one in replay mode
+        """
+        cassette = cls.get_instance()
+        if cassette.mode == cls.MODE_OFF:
+            return send()
+
+        key = cls.get_key(method, url, params, body)
+        if cassette.mode == cls.MODE_REPLAY:
+            record = cassette._next_record(key)
+            cassette._simulate_latency(record)
+            response = record["response"]
+            return from_record(response) if from_record else response
+
+        cls._captured.response = None
+        started = time.monotonic()
+        response = send()
+        elapsed = time.monotonic() - started
+        if response is not None:
+            cassette._add_record(key, to_record(response) if to_record else response, elapsed)
+        return response
+
+    @staticmethod
+    def get_key(method: str, url: str, params: Optional[dict] = None, body: Any = None) -> str:
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True) + [(str(name), str(value))
+                                                                   for name, value in (params or {}).items()]
+        key = f"{method.upper()} {parts.path}"
+        if query:
+            key += "?" + urlencode(sorted(query))
+        if body not in (None, "", {}):
+            body_hash = hashlib.sha1(json.dumps(body, sort_keys=True, default=str).encode()).hexdigest()[:12]
+            key += f" #{body_hash}"
+        return key
+
+    def save(self):
+        """
+        Writes the recorded interactions to the cassette file
+        """
+        with self._lock:
+            if self.mode != self.MODE_RECORD or not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.file_path), prefix=".",
+                                                          suffix=".tmp")
+            with os.fdopen(file_descriptor, 'w') as temp_file:
+                json.dump({"version": 1, "interactions": self._interactions}, temp_file, separators=(",", ":"),
+                          default=str)
+            os.replace(temp_path, self.file_path)
+            self._dirty = False
+
+    def _add_record(self, key: str, response: Any, elapsed: float):
+        with self._lock:
+            self._interactions.setdefault(key, []).append({"response": _to_json(_scrub(response)),
+                                                           "elapsed": round(elapsed, 3)})
+            self._dirty = True
+
+    def _next_record(self, key: str) -> dict:
+        with self._lock:
+            records = self._interactions.get(key)
+            if not records:
+                raise KeyError(f"Request '{key}' is not recorded in the cassette {self.file_path}")
+            position = self._replay_positions.get(key, 0)
+            # Once the recorded responses are used, the last one keeps being replayed
+            self._replay_positions[key] = position + 1
+            record = records[min(position, len(records) - 1)]
+        return {"response": _from_json(record["response"]), "elapsed": record.get("elapsed", 0)}
+
+    def _simulate_latency(self, record: dict):
+        if self.latency == "recorded":
+            delay = record["elapsed"]
+        else:
+            try:
+                delay = float(self.latency)
+            except ValueError:
+                delay = 0
+        if delay > 0:
+            time.sleep(delay)
+
+    def _load(self):
+        with open(self.file_path) as json_file:
+            self._interactions = json.load(json_file)["interactions"]
+
+
+def _scrub(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: "***" if str(key).lower() == "authorization" else _scrub(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_scrub(item) for item in value]
+    return value
+
+
+def _to_json(response: Any) -> Any:
+    # Dicts are stored as pairs so the integer keys of the scriptless responses survive the JSON file
+    if isinstance(response, dict):
+        return {"pairs": [[key, item] for key, item in response.items()]}
+    return {"value": response}
+
+
+def _from_json(record: dict) -> Any:
+    if "pairs" in record:
+        return {key: item for key, item in record["pairs"]}
+    return record["value"]
+
+
+def serve(cassette_path: str, port: int = 8080, latency: str = "0"):
+    """
+    Serves a cassette as a local stand-in of the API, E.g: to benchmark the framework without the environment latency.
+    Point universalAPIEndpoint/artemisAPIEndpoint of env.xml to http://localhost:<port> to use it.
+    """
+    cassette = ApiCassette(ApiCassette.MODE_REPLAY, os.path.abspath(cassette_path), latency)
+
+    class CassetteHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _replay(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw_body) if raw_body else None
+            except ValueError:
+                body = raw_body.decode(errors="replace")
+            try:
+                record = cassette._next_record(ApiCassette.get_key(self.command, self.path, None, body))
+            except KeyError as e:
+                status_code, text = 404, json.dumps({"errors": str(e)})
+            else:
+                cassette._simulate_latency(record)
+                response = record["response"]
+                status_code = int(response.get("status_code", response.get("responseStatusCode", 200)))
+                text = response.get("text") if "text" in response else json.dumps(response, default=str)
+            payload = (text or "").encode()
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = _replay
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), CassetteHandler)
+    print(f"[INFO] Serving {cassette_path} on http://127.0.0.1:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+atexit.register(lambda: ApiCassette.get_instance().save())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API cassette tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Serve a cassette as a local stand-in of the API")
+    serve_parser.add_argument("cassette", help="Path of the cassette file")
+    serve_parser.add_argument("--port", type=int, default=8080)
+    serve_parser.add_argument("--latency", default="0", help="recorded or seconds to wait per response")
+    arguments = parser.parse_args()
+    serve(arguments.cassette, arguments.port, arguments.latency)
@@ -0,0 +1,95 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from Tests.Utils.HttpSessionPool import HttpSessionPool
+from Tests.Utils.TestStats import TestStats
+
+
+class BatchRequestExecutor:
+    """
+    Runs independent API requests concurrently and returns their responses in the order of the requests.
+
+    Every request is described by a dict with the keyword arguments of the request function, E.g:
+        {"method": "GET", "url": "https://.../api/v1/Channels", "headers": headers}
+    The number of requests in flight is bounded per executor (max_workers) and per host (max_per_host). The per host
+    limit is shared by the executors of the process using the same max_per_host, so concurrent batches never send more
+    requests to a host than there are connections in its keep-alive pool of HttpSessionPool (the default limit).
+
+    A batch sent from a request function that is already sending to one of its hosts (a nested batch) runs its
+    requests one by one in the calling thread, and the requests to that host use the connection of the outer request
+    instead of waiting for another one; waiting would deadlock once every permit of the host is held by outer requests.
+    """
+    DEFAULT_MAX_WORKERS = 8
+
+    # (host, max_per_host) -> semaphore shared by the executors with the same limit for the host
+    _host_limits: Dict[Tuple[str, int], threading.Semaphore] = {}
+    _host_limits_lock = threading.Lock()
+    # Hosts whose permit is held by the request running in the thread, E.g: the outer request of a nested batch
+    _local = threading.local()
+
+    def __init__(self, request_function: Callable[..., Any], max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_per_host: Optional[int] = None):
+        """
+        Args:
+            request_function: Function sending one request, E.g: BaseAPIClass.make_api_request
+            max_workers (int): Maximum number of requests in flight
+            max_per_host (int): Maximum number of requests in flight to the same host
+        """
+        self.request_function = request_function
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host or HttpSessionPool.get_pool_maxsize())
+
+    def run(self, request_specs: List[dict]) -> List[Any]:
+        """
+        Args:
+            request_specs: List of dicts with the keyword arguments of the request function, each one with an url
+        Returns:
+            list with the response of every request, in the same order as request_specs
+        Raises:
+            Exception: The first error raised by a request, once every request has finished
+        """
+        if not request_specs:
+            return []
+        if len(request_specs) == 1:
+            return [self.request_function(**request_specs[0])]
+
+        test_name = TestStats.get_current_test()
+        held_hosts = self._get_held_hosts()
+        if any(self._get_host(request_spec["url"]) in held_hosts for request_spec in request_specs):
+            return [self._send(request_spec, test_name, held_hosts) for request_spec in request_specs]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(request_specs))) as executor:
+            futures = [executor.submit(self._send, request_spec, test_name, held_hosts)
+                       for request_spec in request_specs]
+        return [future.result() for future in futures]
+
+    def _send(self, request_spec: dict, test_name: str, held_hosts: FrozenSet[str]) -> Any:
+        # The retries and waits of the request count for the test that sent the batch
+        TestStats.start_test(test_name)
+        host = self._get_host(request_spec["url"])
+        if host in held_hosts:
+            return self.request_function(**request_spec)
+
+        with self._get_host_limit(host):
+            BatchRequestExecutor._local.held_hosts = held_hosts | {host}
+            try:
+                return self.request_function(**request_spec)
+            finally:
+                BatchRequestExecutor._local.held_hosts = held_hosts
+
+    def _get_host_limit(self, host: str) -> threading.Semaphore:
+        key = (host, self.max_per_host)
+        with BatchRequestExecutor._host_limits_lock:
+            if key not in BatchRequestExecutor._host_limits:
+                BatchRequestExecutor._host_limits[key] = threading.Semaphore(self.max_per_host)
+            return BatchRequestExecutor._host_limits[key]
+
+    @staticmethod
+    def _get_held_hosts() -> FrozenSet[str]:
+        return getattr(BatchRequestExecutor._local, "held_hosts", frozenset())
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        return urlsplit(url).netloc
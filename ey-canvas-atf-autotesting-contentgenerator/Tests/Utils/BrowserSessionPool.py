@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class BrowserSessionPool:
+    """
+    Warm browser sessions of the worker (process), already logged in, reused between tests.
+
+    acquire returns an idle session opened for the same key (E.g: url and user) or starts one with the factory, which
+    launches the browser (LogInMethods uses the Launch Browser keyword, so the configured browser and options of the
+    library apply) and walks the SSO flow. release resets the session (cookies, storage, cache) and keeps it for
+    the next test, up to MAX_IDLE_SESSIONS idle sessions per key (BROWSER_POOL_SIZE environment variable). A session
+    is quit instead of reused after MAX_TESTS_PER_SESSION tests (BROWSER_SESSION_MAX_TESTS), or if its reset fails,
+    so a degraded browser does not last the whole execution.
+    """
+    MAX_IDLE_SESSIONS = int(os.environ.get("BROWSER_POOL_SIZE", 2))
+    MAX_TESTS_PER_SESSION = int(os.environ.get("BROWSER_SESSION_MAX_TESTS", 20))
+
+    _instance: Optional['BrowserSessionPool'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_idle_sessions: int = MAX_IDLE_SESSIONS, max_tests_per_session: int = MAX_TESTS_PER_SESSION):
+        self.max_idle_sessions = max_idle_sessions
+        self.max_tests_per_session = max_tests_per_session
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple, List[Any]] = {}
+        # id of the driver -> {"key", "driver", "uses"}
+        self._sessions: Dict[int, Dict[str, Any]] = {}
+        self._stats = {"launched": 0, "reused": 0, "recycled": 0, "discarded": 0, "launch_time": 0.0}
+
+    @classmethod
+    def get_instance(cls) -> 'BrowserSessionPool':
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = BrowserSessionPool()
+            return cls._instance
+
+    def acquire(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """
+        Args:
+            key (tuple): Sessions are only reused for the same key, E.g: (url, credential user name)
+            factory: Function launching and logging in a new browser, returns the driver
+        Returns:
+            WebDriver: a logged in browser, owned by the caller until it is released
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                driver = idle.pop()
+                self._sessions[id(driver)]["uses"] += 1
+                self._stats["reused"] += 1
+                return driver
+
+        started = time.monotonic()
+        driver = factory()
+        with self._lock:
+            self._sessions[id(driver)] = {"key": key, "driver": driver, "uses": 1}
+            self._stats["launched"] += 1
+            self._stats["launch_time"] += time.monotonic() - started
+        return driver
+
+    def release(self, driver: Any, reset: Optional[Callable[[Any], None]] = None):
+        """
+        Gives back a session at the end of a test. It is reset and kept idle, or quit if it reached
+        max_tests_per_session, its reset failed or there are enough idle sessions
+        Args:
+            reset: Function clearing the state left by the test in the browser
+        """
+        with self._lock:
+            session = self._sessions.get(id(driver))
+        if session is None:
+            # Not started by the pool
+            self._quit(driver)
+            return
+
+        if session["uses"] >= self.max_tests_per_session:
+            self._remove(driver, "recycled")
+            return
+        if reset is not None:
+            try:
+                reset(driver)
+            except Exception as e:
+                print(f"[WARN] The browser session could not be reset, it is closed: {e}")
+                self._remove(driver, "discarded")
+                return
+        with self._lock:
+            idle = self._idle.setdefault(session["key"], [])
+            if len(idle) < self.max_idle_sessions:
+                idle.append(driver)
+                return
+        self._remove(driver, "recycled")
+
+    def discard(self, driver: Any):
+        """
+        Quits a session that should not be reused, E.g: the browser of a failed test
+        """
+        self._remove(driver, "discarded")
+
+    def close_all(self):
+        """
+        Quits every session started by the pool, called when the execution ends
+        """
+        with self._lock:
+            drivers = [session["driver"] for session in self._sessions.values()]
+            self._sessions.clear()
+            self._idle.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["launch_time"] = round(stats["launch_time"], 2)
+            stats["open"] = len(self._sessions)
+            return stats
+
+    def _remove(self, driver: Any, reason: str):
+        with self._lock:
+            session = self._sessions.pop(id(driver), None)
+            if session is not None:
+                idle = self._idle.get(session["key"], [])
+                if driver in idle:
+                    idle.remove(driver)
+                self._stats[reason] += 1
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver: Any):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[WARN] The browser session could not be closed: {e}")
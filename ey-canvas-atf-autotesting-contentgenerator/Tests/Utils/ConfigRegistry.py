@@ -0,0 +1,95 @@
+import os
+import threading
+import xml.etree.ElementTree as ET
+from typing import Dict, Tuple
+
+
+class ConfigRegistry:
+    """
+    In-process registry of the scriptless configuration files (env.xml and var.xml).
+
+    Each file is parsed once into dictionaries and kept in memory; the parsed content is reused until
+    the modification time of the file changes, so a lookup costs a single os.stat instead of a file
+    read and a full scan. The registry is shared by every thread of the process.
+    """
+    ENV_FILE = os.path.join("Tests", "resources", "env", "env.xml")
+    VARIABLES_FILE = os.path.join("Tests", "resources", "variable", "var.xml")
+
+    _lock = threading.Lock()
+    _files: Dict[str, Tuple[float, dict]] = {}
+
+    @classmethod
+    def get_environment_variables(cls, environment: str) -> Dict[str, str]:
+        """
+        Returns the app parameters of an environment defined in env.xml
+        Args:
+            environment (str): Name of the environment as in the envname attribute, E.g: UAT3
+        Returns:
+            dict with the parameter names and values, empty if the environment is not defined
+        """
+        environments = cls._get_parsed_file(cls.ENV_FILE, cls._parse_environments)
+        return dict(environments.get(environment, {}))
+
+    @classmethod
+    def get_variable(cls, variable_name: str) -> str:
+        """
+        Returns the value of a variable defined in var.xml
+        Args:
+            variable_name (str): Name of the variable
+        Returns:
+            str with the value of the variable
+        Raises:
+            Exception: If the variable is not defined in the variables file
+        """
+        variables = cls._get_parsed_file(cls.VARIABLES_FILE, cls._parse_variables)
+        if variable_name not in variables:
+            raise Exception(f"There was not a variable named {variable_name} in the variables file")
+        return variables[variable_name]
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every parsed file so the next lookup reads them again from disk
+        """
+        with cls._lock:
+            cls._files.clear()
+
+    @classmethod
+    def _get_parsed_file(cls, relative_path: str, parse_function) -> dict:
+        """
+        Returns the parsed content of a configuration file, parsing it again only if it changed on disk
+        Args:
+            relative_path (str): Path of the file relative to the working directory
+            parse_function: Function that receives the root element and returns the parsed content
+        Returns:
+            dict with the parsed content of the file
+        """
+        path = os.path.join(os.getcwd(), relative_path)
+        modification_time = os.stat(path).st_mtime
+
+        with cls._lock:
+            cached = cls._files.get(path)
+            if cached is not None and cached[0] == modification_time:
+                return cached[1]
+
+            parsed_content = parse_function(ET.parse(path).getroot())
+            cls._files[path] = (modification_time, parsed_content)
+            return parsed_content
+
+    @staticmethod
+    def _parse_environments(root) -> Dict[str, Dict[str, str]]:
+        environments = {}
+        for env in root.iter("env"):
+            parameters = {}
+            for parameter in env.iter("parameter"):
+                if parameter.get("type") == "app":
+                    parameters[parameter.get("name")] = parameter.get("value", "")
+            environments[env.get("envname")] = parameters
+        return environments
+
+    @staticmethod
+    def _parse_variables(root) -> Dict[str, str]:
+        variables = {}
+        for variable in root.iter("variable"):
+            variables.setdefault(variable.get("name"), variable.get("value", ""))
+        return variables
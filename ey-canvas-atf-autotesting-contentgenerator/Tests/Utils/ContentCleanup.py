@@ -1,109 +1,274 @@
+import json
 import os
 import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from Tests.Utils.RetryPolicy import RetryPolicy
+from Tests.Utils.RunWorkspace import RunWorkspace
+from Tests.Utils.StateStore import StateStore
 from Tests.custom_methods.APIMethods import APIMethods
 from Tests.custom_methods.CommonMethods import CommonMethods
 from Tests.custom_methods.TokenMethods import TokenMethods
 
 
+class CleanupLedger:
+    """
+    Progress of the content cleanup of an environment, written after every step so a cleanup interrupted by a crash
+    or a killed agent is resumed by the next execution in the same environment.
+
+    Every entity goes from STATE_PENDING to STATE_DELETED (DELETE sent) to STATE_DONE (deletion approved), with the
+    channel, language and service line of the entity once they are known, so a resumed entity continues from the step
+    it reached. Entities still failing after MAX_ATTEMPTS executions are dropped from the ledger.
+
+    Executions of the same environment share the file: every change takes an OS file lock and is applied to the
+    current content of the file, and the entities being cleaned are claimed by the execution, so a concurrent
+    execution skips them until they are released or the claim is older than CLAIM_TIMEOUT seconds.
+    """
+    LEDGER_FILE = os.path.join("Tests", "filesForTests", "cleanup_ledger_{environment}.json")
+    STATE_PENDING = "pending"
+    STATE_DELETED = "deleted"
+    STATE_DONE = "done"
+    MAX_ATTEMPTS = 3
+    CLAIM_TIMEOUT = 30 * 60
+
+    def __init__(self, environment: str, file_path: Optional[str] = None):
+        self.environment = environment
+        self.file_path = file_path or os.path.join(os.getcwd(), self.LEDGER_FILE.format(environment=environment))
+        self.owner = uuid.uuid4().hex
+        self._lock = threading.Lock()
+
+    def add(self, key: str, entry: dict):
+        """
+        Adds an entity to clean up, an entity already in the ledger keeps its progress
+        """
+        with self._edit() as entries:
+            if key not in entries:
+                entries[key] = dict(entry, state=self.STATE_PENDING, attempts=0)
+
+    def update(self, key: str, **values) -> dict:
+        with self._edit() as entries:
+            entries[key].update(values)
+            return dict(entries[key])
+
+    def claim_unfinished(self) -> List[Tuple[str, dict]]:
+        """
+        Claims the unfinished entities not claimed by another execution
+        Returns:
+            list of (key, entry) of the claimed entities
+        """
+        claimed = []
+        now = time.time()
+        with self._edit() as entries:
+            for key, entry in entries.items():
+                if entry["state"] == self.STATE_DONE:
+                    continue
+                if entry.get("owner") not in (None, self.owner) and now - entry["claimed_at"] < self.CLAIM_TIMEOUT:
+                    continue
+                entry.update(owner=self.owner, claimed_at=now)
+                claimed.append((key, dict(entry)))
+        return claimed
+
+    def close(self):
+        """
+        Releases the entities claimed by this execution, removes the finished ones and the ones out of attempts,
+        and the file if nothing is left
+        """
+        with self._edit() as entries:
+            for key, entry in list(entries.items()):
+                if entry.get("owner") not in (None, self.owner):
+                    continue
+                entry.pop("owner", None)
+                entry.pop("claimed_at", None)
+                if entry["state"] == self.STATE_DONE:
+                    del entries[key]
+                elif entry["attempts"] >= self.MAX_ATTEMPTS:
+                    print(f"[WARN] -- The {entry['module']} entity with Id {entry['entity_id']} could not be deleted "
+                          f"after {entry['attempts']} attempts: {entry.get('error')}")
+                    del entries[key]
+
+    @contextmanager
+    def _edit(self):
+        """
+        Yields the current entries of the file under the thread and file locks, and saves them afterwards
+        """
+        with self._lock, StateStore.lock_file(self.file_path):
+            try:
+                with open(self.file_path) as json_file:
+                    entries: Dict[str, dict] = json.load(json_file)
+            except (OSError, ValueError):
+                entries = {}
+            yield entries
+            if entries:
+                self._save(entries)
+            elif os.path.exists(self.file_path):
+                os.remove(self.file_path)
+
+    def _save(self, entries: Dict[str, dict]):
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.file_path), prefix=".", suffix=".tmp")
+        with os.fdopen(file_descriptor, 'w') as temp_file:
+            json.dump(entries, temp_file, indent=2)
+        os.replace(temp_path, self.file_path)
+
+
 class APIDeleteContentById:
+    """
+    Deletes the content created by the suites of the execution and approves its deletion.
+
+    The ids of every suite config file of the run are collected first into the CleanupLedger, together with the
+    entities left by an interrupted cleanup. Then the entities are cleaned concurrently, up to MAX_WORKERS at a time
+    (CLEANUP_MAX_WORKERS environment variable). The lookups of an entity are batched too, so the batches share
+    MAX_REQUESTS (CLEANUP_MAX_REQUESTS environment variable) between the entities being cleaned and the requests in
+    flight never exceed it. Each request is retried with CLEANUP_RETRY_POLICY. The steps are safe to repeat: an entity
+    that is already deleted (404) goes on to the approval.
+    """
+    MAX_WORKERS = int(os.environ.get("CLEANUP_MAX_WORKERS", 4))
+    MAX_REQUESTS = int(os.environ.get("CLEANUP_MAX_REQUESTS", 8))
+    CLEANUP_RETRY_POLICY = RetryPolicy(retries=3, base_delay=1, max_delay=10, deadline=60)
+
+    # Content deleted for every module of the suite config files
+    ENTITY_TYPES = {
+        "Group Audit": {
+            "name": "instruction",
+            "get_endpoint": "/api/v1/GroupInstruction/",
+            "delete_endpoint": "/api/v1/GroupInstruction/{entity_id}",
+            "approve_endpoint": "/api/v1/groupinstruction/approve",
+            "data_entity_id": 36
+        },
+        "PSPIndexes": {
+            "name": "psp index",
+            "get_endpoint": "/api/v1/pspindex/",
+            "delete_endpoint": "/api/v1/PSPIndex/{entity_id}?DeleteType=delete&channelId={channel_id}"
+                               "&languageId=1&serviceLineId={service_line_id}",
+            "approve_endpoint": "/api/v1/pSPIndex/approve",
+            "data_entity_id": 33
+        }
+    }
 
     def __init__(self, environment, prefix_file_name):
 
-        universal_token = TokenMethods.get_token("CanvasAutomationUser1")
+        universal_token = TokenMethods.get_token("CanvasAutomationUser1", environment)
         if universal_token:
             self.token = 'Bearer ' + universal_token
+            self.environment = environment
             self.env_variables = CommonMethods.get_app_env_variable(environment)
-            files = os.listdir(tempfile.gettempdir())
-            self.suite_names = [os.path.splitext(file)[0] for file in files if file.startswith(prefix_file_name)]
-            self._delete_instruction()
-            self._delete_psp_index()
-
+            files = RunWorkspace.get_instance().get_files(prefix_file_name)
+            self.suite_names = [os.path.splitext(file)[0] for file in files]
+            self.ledger = CleanupLedger(environment)
+            self._channels_and_service_lines = None
+            self._batch_workers = self.MAX_REQUESTS
+            self._lock = threading.Lock()
+            self._collect_entities()
+            self._run_cleanup()
 
         else:
             print(f'[WARN] The token is Not valid the instruction were not Deleted')
 
-    def _delete_instruction(self):
+    def _collect_entities(self):
         """
-        Deletes all global and local instructions stored in the JSON configuration file.
+        Adds the global and local ids of every suite config file to the ledger, reading each file once
         """
-
         for suite_name in self.suite_names:
-
-            module_name = CommonMethods.get_engagement_information_from_suite_config(suite_name, 'Content', 'module')
-            config_instruction_id = CommonMethods.get_engagement_information_from_suite_config(suite_name, 'Content',
-                                                                                               'global_Id')
-            auth = self.token
-            env_variables = self.env_variables
-
-            if config_instruction_id != '' and module_name == "Group Audit":
-                print(f"[INFO] {suite_name}  File name for deletion")
-                self.delete_and_approve_deleted_instruction(auth=auth, env_variables=env_variables,
-                                                            config_instruction_id=config_instruction_id)
-
-            config_instruction_id = CommonMethods.get_engagement_information_from_suite_config(suite_name, 'Content',
-                                                                                               'local_Id')
-
-            if config_instruction_id != '' and module_name == "Group Audit":
-                self.delete_and_approve_deleted_instruction(auth=auth, env_variables=env_variables,
-                                                            config_instruction_id=config_instruction_id)
-
-    def delete_and_approve_deleted_instruction(self, env_variables, config_instruction_id, auth):
-
-        get_instruction = self.get_entity_response(endpoint='/api/v1/GroupInstruction/',
-                                                   config_id=config_instruction_id)
-        if get_instruction is not None:
-
-            channel_id = get_instruction['responseBody']['entityList'][0]['authoredChannelId']
-            language_id = get_instruction['responseBody']['entityList'][0]['authoredLanguageId']
-            service_line_id = get_instruction['responseBody']['entityList'][0]['serviceLineId']
-
-            delete_response = APIMethods.api_request('DELETE', url=env_variables[
-                                                                       'universalAPIEndpoint'] + '/api/v1/GroupInstruction/' + config_instruction_id,
-                                                     params='', headers="", body='', cookies='', files='', auth=auth,
-                                                     timeout='', allow_redirects='', proxies='', verify=False,
-                                                     stream='',
-                                                     cert='')
-
-            approved_deleted_response = self.approve_deleted_entity(config_id=config_instruction_id,
-                                                                    channel_id=channel_id,
-                                                                    language_id=language_id,
-                                                                    endpoint='/api/v1/groupinstruction/approve',
-                                                                    service_line_id=service_line_id, data_entity_id=36)
-
-            if approved_deleted_response['responseStatusCode'] == 201 and delete_response['responseStatusCode'] == 200:
-                print(f'[INFO] -- The instruction with Id {config_instruction_id} was DELETED')
-        else:
-            print(f'[INFO] -- The instruction with Id {config_instruction_id} was DELETED during Execution')
+            try:
+                content = StateStore.for_file(RunWorkspace.get_instance().get_path(suite_name + ".json")).get('Content')
+                content = content or {}
+            except (OSError, KeyError, ValueError) as e:
+                print(f"[WARN] {suite_name} could not be read for deletion: {e}")
+                continue
+
+            module_name = content.get('module')
+            if module_name not in self.ENTITY_TYPES:
+                continue
+            print(f"[INFO] {suite_name}  File name for deletion")
+            for id_name in ('global_Id', 'local_Id'):
+                entity_id = content.get(id_name)
+                if entity_id:
+                    self.ledger.add(f"{self.environment}:{module_name}:{entity_id}",
+                                    {"environment": self.environment, "module": module_name,
+                                     "entity_id": str(entity_id), "suite": suite_name})
+
+    def _run_cleanup(self):
+        entries = self.ledger.claim_unfinished()
+        if not entries:
+            self.ledger.close()
+            return
+        started = time.monotonic()
+        workers = max(1, min(self.MAX_WORKERS, len(entries)))
+        self._batch_workers = max(1, self.MAX_REQUESTS // workers)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                cleaned = list(executor.map(lambda item: self._clean_entity(*item), entries))
+        finally:
+            self.ledger.close()
+        print(f"[INFO] Content cleanup: {cleaned.count(True)} of {len(entries)} entities deleted in "
+              f"{time.monotonic() - started:.1f} seconds")
+
+    def _clean_entity(self, key: str, entry: dict) -> bool:
+        """
+        Deletes an entity and approves its deletion, continuing from the state of the ledger
+        Returns:
+            bool: True if the entity is deleted and approved (or was deleted during the execution)
+        """
+        entity_type = self.ENTITY_TYPES[entry["module"]]
+        entity_id = entry["entity_id"]
+        entry = self.ledger.update(key, attempts=entry["attempts"] + 1)
+        try:
+            if entry["state"] == CleanupLedger.STATE_PENDING:
+                if "channel_id" not in entry:
+                    entity = self.get_entity_response(endpoint=entity_type["get_endpoint"], config_id=entity_id)
+                    if entity is None:
+                        print(f'[INFO] -- The {entity_type["name"]} with Id {entity_id} was DELETED during Execution')
+                        self.ledger.update(key, state=CleanupLedger.STATE_DONE)
+                        return True
+                    authored = entity['responseBody']['entityList'][0]
+                    entry = self.ledger.update(key, channel_id=authored['authoredChannelId'],
+                                               language_id=authored['authoredLanguageId'],
+                                               service_line_id=authored['serviceLineId'])
+
+                delete_url = self.env_variables['universalAPIEndpoint'] + entity_type["delete_endpoint"].format(
+                    entity_id=entity_id, channel_id=entry["channel_id"], service_line_id=entry["service_line_id"])
+                delete_response = self._send_request('DELETE', delete_url)
+                # A 404 means a previous attempt already deleted it
+                if delete_response['responseStatusCode'] not in (200, 204, 404):
+                    raise ValueError(f"DELETE returned {delete_response['responseStatusCode']}")
+                entry = self.ledger.update(key, state=CleanupLedger.STATE_DELETED)
+
+            approved_deleted_response = self.approve_deleted_entity(config_id=entity_id,
+                                                                    channel_id=entry["channel_id"],
+                                                                    language_id=entry["language_id"],
+                                                                    endpoint=entity_type["approve_endpoint"],
+                                                                    service_line_id=entry["service_line_id"],
+                                                                    data_entity_id=entity_type["data_entity_id"])
+            if approved_deleted_response['responseStatusCode'] not in (200, 201):
+                raise ValueError(f"Approval returned {approved_deleted_response['responseStatusCode']}")
+        except Exception as e:
+            self.ledger.update(key, error=str(e))
+            print(f'[WARN] -- The {entity_type["name"]} with Id {entity_id} was not deleted, '
+                  f'it will be retried by the next execution: {e}')
+            return False
+
+        self.ledger.update(key, state=CleanupLedger.STATE_DONE)
+        print(f'[INFO] -- The {entity_type["name"]} with Id {entity_id} was DELETED')
+        return True
 
     def get_entity_response(self, endpoint, config_id):
 
         url_endpoint = self.env_variables['universalAPIEndpoint'] + endpoint + config_id + '?channelId='
+        channel, service_line = self._get_channels_and_service_lines()
 
-        channel = APIMethods.api_request(method='GET',
-                                         url=self.env_variables['universalAPIEndpoint'] + '/api/v1/Channels',
-                                         params='',
-                                         headers="", body='', cookies='', files='', auth=self.token,
-                                         timeout='',
-                                         allow_redirects='', proxies='', verify=False, stream='',
-                                         cert='')
-        service_line = APIMethods.api_request(method='GET',
-                                              url=self.env_variables['universalAPIEndpoint'] + '/api/v1/ServiceLine',
-                                              params='',
-                                              headers="", body='', cookies='', files='', auth=self.token,
-                                              timeout='',
-                                              allow_redirects='', proxies='', verify=False, stream='',
-                                              cert='')
-
+        # The channels of a service line are requested at once, the next service line only if none has the entity
         for service_id in range(1, len(service_line['responseBody']) + 1):
-            for channel_id in range(1, len(channel['responseBody']) + 1):
-
-                get_entity = APIMethods.api_request('GET', url=url_endpoint + str(
-                    channel_id) + "&languageId=1&serviceLineId=" + str(service_id),
-                                                    params='',
-                                                    headers="", body='', cookies='', files='', auth=self.token,
-                                                    timeout='',
-                                                    allow_redirects='', proxies='', verify=False, stream='',
-                                                    cert='')
+            entities = APIMethods.batch_api_request([
+                {"method": 'GET', "url": url_endpoint + str(channel_id) + "&languageId=1&serviceLineId=" + str(service_id),
+                 "auth": self.token}
+                for channel_id in range(1, len(channel['responseBody']) + 1)
+            ], max_workers=self._batch_workers)
+            for get_entity in entities:
                 try:
                     if get_entity['responseBody']['entityList'] != []:
                         return get_entity
@@ -112,80 +277,37 @@ class APIDeleteContentById:
 
     def approve_deleted_entity(self, config_id, channel_id, language_id, service_line_id, data_entity_id, endpoint):
 
-        pending_approval = APIMethods.api_request('PUT', url=self.env_variables[
-                                                                 'universalAPIEndpoint'] + '/api/v1/EntityStatus',
-                                                  params='', headers="",
-                                                  body={"selectedEntities": [config_id],
-                                                        "channelId": channel_id,
-                                                        "languageId": language_id,
-                                                        "serviceLineId": service_line_id,
-                                                        "entityStatusTypeId": "4",
-                                                        "dataEntityId": data_entity_id},
-                                                  cookies='', files='', auth=self.token,
-                                                  timeout='', allow_redirects='', proxies='', verify=False,
-                                                  stream='', cert='')
-
-        approved_response = APIMethods.api_request('POST', url=self.env_variables['universalAPIEndpoint'] + endpoint,
-                                                   params='', headers="",
-                                                   body={"dataEntityUIDs": [config_id],
-                                                         "channelId": channel_id,
-                                                         "languageId": language_id,
-                                                         "serviceLineId": service_line_id},
-                                                   cookies='', files='', auth=self.token, timeout='',
-                                                   allow_redirects='', proxies='',
-                                                   verify=False, stream='', cert='')
-
-        return approved_response
-
-    def _delete_psp_index(self):
-
-        for suite_name in self.suite_names:
-
-            module_name = CommonMethods.get_engagement_information_from_suite_config(suite_name, 'Content', 'module')
-            config_psp_index_id = CommonMethods.get_engagement_information_from_suite_config(suite_name, 'Content',
-                                                                                             'global_Id')
-
-            if config_psp_index_id != '' and module_name == "PSPIndexes":
-                print(f"[INFO] {suite_name} File name for deletion")
-                self.delete_and_approve_deleted_psp_index(auth=self.token, env_variables=self.env_variables,
-                                                          config_psp_index_id=config_psp_index_id)
-
-            config_psp_index_id = CommonMethods.get_engagement_information_from_suite_config(suite_name, 'Content',
-                                                                                             'local_Id')
+        self._send_request('PUT', self.env_variables['universalAPIEndpoint'] + '/api/v1/EntityStatus',
+                           body={"selectedEntities": [config_id],
+                                 "channelId": channel_id,
+                                 "languageId": language_id,
+                                 "serviceLineId": service_line_id,
+                                 "entityStatusTypeId": "4",
+                                 "dataEntityId": data_entity_id})
 
-            if config_psp_index_id != '' and module_name == "PSPIndexes":
-                self.delete_and_approve_deleted_psp_index(auth=self.token, env_variables=self.env_variables,
-                                                          config_psp_index_id=config_psp_index_id)
+        approved_response = self._send_request('POST', self.env_variables['universalAPIEndpoint'] + endpoint,
+                                               body={"dataEntityUIDs": [config_id],
+                                                     "channelId": channel_id,
+                                                     "languageId": language_id,
+                                                     "serviceLineId": service_line_id})
 
-    def delete_and_approve_deleted_psp_index(self, env_variables, config_psp_index_id, auth):
-
-        get_psp_index = self.get_entity_response(endpoint='/api/v1/pspindex/', config_id=config_psp_index_id)
-
-        if get_psp_index is not None:
-
-            channel_id = get_psp_index['responseBody']['entityList'][0]['authoredChannelId']
-            language_id = get_psp_index['responseBody']['entityList'][0]['authoredLanguageId']
-            service_line_id = get_psp_index['responseBody']['entityList'][0]['serviceLineId']
-
-            delete_url = env_variables[
-                             'universalAPIEndpoint'] + '/api/v1/PSPIndex/' + config_psp_index_id + '?DeleteType=delete&channelId=' + str(
-                channel_id) + "&languageId=1&serviceLineId=" + str(service_line_id)
-
-            delete_response = APIMethods.api_request('DELETE', url=delete_url,
-                                                     params='',
-                                                     headers="", body='', cookies='', files='', auth=auth,
-                                                     timeout='', allow_redirects='', proxies='', verify=False,
-                                                     stream='',
-                                                     cert='')
-
-            approved_deleted_response = self.approve_deleted_entity(config_id=config_psp_index_id,
-                                                                    channel_id=channel_id,
-                                                                    language_id=language_id,
-                                                                    endpoint='/api/v1/pSPIndex/approve',
-                                                                    service_line_id=service_line_id, data_entity_id=33)
-
-            if approved_deleted_response['responseStatusCode'] == 201 and delete_response['responseStatusCode'] == 200:
-                print(f'[INFO] -- The psp index with Id {config_psp_index_id} was DELETED')
+        return approved_response
 
-        else:
-            print(f'[INFO] -- The psp index with Id {config_psp_index_id} was DELETED during Execution')
+    def _get_channels_and_service_lines(self):
+        # The same for every entity, requested once per cleanup
+        with self._lock:
+            if self._channels_and_service_lines is None:
+                self._channels_and_service_lines = APIMethods.batch_api_request([
+                    {"method": 'GET', "url": self.env_variables['universalAPIEndpoint'] + '/api/v1/Channels',
+                     "auth": self.token},
+                    {"method": 'GET', "url": self.env_variables['universalAPIEndpoint'] + '/api/v1/ServiceLine',
+                     "auth": self.token}
+                ], max_workers=self._batch_workers)
+            return self._channels_and_service_lines
+
+    def _send_request(self, method, url, body=''):
+        return self.CLEANUP_RETRY_POLICY.run(
+            lambda: APIMethods.api_request(method, url=url, params='', headers="", body=body, cookies='', files='',
+                                           auth=self.token, timeout='', allow_redirects='', proxies='', verify=False,
+                                           stream='', cert=''),
+            host=urlsplit(url).netloc, method=method)
@@ -0,0 +1,157 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class DomQuery:
+    """
+    Reads the state of many elements in one WebDriver round trip.
+
+    Every find_element, .text or is_displayed() of a WebElement is an HTTP request to the driver, so reading a table
+    of 50 rows costs 50+ requests. DomQuery sends a single execute_script that evaluates all the locators (or all the
+    elements) in the browser and returns their count, visibility, text and attributes in one JSON payload:
+        DomQuery.query(driver, ["xpath://tr", "css:.error"], text=True)
+        DomQuery.describe(driver, rows, sub_locator="xpath:.//td[2]")
+
+    Locators use the scriptless syntax (E.g: "xpath://div", "css:.row", "id:main"), a locator without prefix is an
+    xpath. The text is the rendered text of visible elements, as WebElement.text returns it, and "" for hidden ones.
+    """
+    STRATEGIES = {"xpath": "xpath", "css": "css", "css selector": "css", "id": "id", "name": "name",
+                  "class": "class", "class name": "class", "tag": "tag", "tag name": "tag"}
+
+    _LOCATOR_PATTERN = re.compile(r"^(xpath|css selector|css|id|name|class name|class|tag name|tag):(.*)$", re.DOTALL)
+
+    _SCRIPT = """
+        var request = arguments[0];
+        function isVisible(element) {
+            if (!element.isConnected) { return false; }
+            var style = window.getComputedStyle(element);
+            if (style.display === 'none' || style.visibility === 'hidden' || style.visibility === 'collapse' ||
+                    parseFloat(style.opacity) === 0) { return false; }
+            return element.getClientRects().length > 0;
+        }
+        function find(strategy, value, parent) {
+            var root = parent || document;
+            var found = [];
+            if (strategy === 'xpath') {
+                var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (var i = 0; i < snapshot.snapshotLength; i++) { found.push(snapshot.snapshotItem(i)); }
+            } else if (strategy === 'css') {
+                found = Array.prototype.slice.call(root.querySelectorAll(value));
+            } else if (strategy === 'id') {
+                found = Array.prototype.slice.call(root.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+            } else if (strategy === 'name') {
+                found = Array.prototype.slice.call(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+            } else if (strategy === 'class') {
+                found = Array.prototype.slice.call(root.getElementsByClassName(value));
+            } else if (strategy === 'tag') {
+                found = Array.prototype.slice.call(root.getElementsByTagName(value));
+            }
+            return found.filter(function (node) { return node.nodeType === 1; });
+        }
+        function describe(element) {
+            var visible = isVisible(element);
+            var result = {visible: visible};
+            if (request.text) {
+                result.text = visible ? (element.innerText || '').replace(/\\u00a0/g, ' ').trim() : '';
+            }
+            if (request.attributes.length) {
+                result.attributes = {};
+                request.attributes.forEach(function (name) { result.attributes[name] = element.getAttribute(name); });
+            }
+            if (request.elements) { result.element = element; }
+            return result;
+        }
+        if (request.mode === 'elements') {
+            return request.targets.map(function (element) {
+                if (request.sub_locator) {
+                    var sub_elements = find(request.sub_locator[0], request.sub_locator[1], element);
+                    if (!sub_elements.length) { return {found: false, visible: false}; }
+                    element = sub_elements[0];
+                }
+                var result = describe(element);
+                result.found = true;
+                return result;
+            });
+        }
+        return request.targets.map(function (target) {
+            var found = find(target[0], target[1], request.parent);
+            return {count: found.length, items: request.count_only ? [] : found.map(describe)};
+        });
+    """
+
+    @staticmethod
+    def parse_locator(locator: str) -> Tuple[str, str]:
+        """
+        Returns:
+            tuple: (strategy, value) of a scriptless locator, E.g: ("css", ".row") for "css:.row"
+        """
+        locator = locator.replace("\n", "")
+        match = DomQuery._LOCATOR_PATTERN.match(locator)
+        if match is None:
+            return "xpath", locator
+        return DomQuery.STRATEGIES[match.group(1)], match.group(2)
+
+    @staticmethod
+    def query(driver, locators: Sequence[str], text: bool = False, attributes: Sequence[str] = (),
+              elements: bool = False, parent=None, count_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Evaluates all the locators in one round trip
+        Args:
+            driver (WebDriver): current web driver
+            locators (list): Locators in scriptless syntax
+            text (bool): Return the text of every element found
+            attributes (list): Names of the attributes returned for every element found
+            elements (bool): Return the WebElements found too
+            parent (WebElement): Element the locators are relative to, the document if not provided
+            count_only (bool): Only return the count of every locator
+        Returns:
+            list: for every locator, a dict with its "count", if any element is "displayed" and its "items"
+            (E.g: {"visible": True, "text": "Row 1", "attributes": {"id": "row1"}, "element": WebElement})
+        """
+        request = {"mode": "locators", "targets": [list(DomQuery.parse_locator(locator)) for locator in locators],
+                   "text": text, "attributes": list(attributes), "elements": elements, "parent": parent,
+                   "count_only": count_only}
+        results = driver.execute_script(DomQuery._SCRIPT, request)
+        for result in results:
+            result["displayed"] = any(item["visible"] for item in result["items"])
+        return results
+
+    @staticmethod
+    def describe(driver, webelements: Sequence, text: bool = True, attributes: Sequence[str] = (),
+                 sub_locator: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Reads the visibility, text and attributes of many WebElements, or of their first sub-element matching
+        sub_locator (E.g: the label of every row of a list), in one round trip
+        Returns:
+            list: for every element, a dict with "found" (False if it has no sub-element), "visible", "text" and
+            "attributes"
+        """
+        if not webelements:
+            return []
+        request = {"mode": "elements", "targets": list(webelements), "text": text, "attributes": list(attributes),
+                   "elements": False,
+                   "sub_locator": list(DomQuery.parse_locator(sub_locator)) if sub_locator else None}
+        return driver.execute_script(DomQuery._SCRIPT, request)
+
+    @staticmethod
+    def count(driver, locator: str) -> int:
+        return DomQuery.query(driver, [locator], count_only=True)[0]["count"]
+
+    @staticmethod
+    def first_present(driver, locators: Sequence[str]) -> int:
+        """
+        Returns:
+            int: index of the first locator with elements in the page, -1 if none has
+        """
+        for index, result in enumerate(DomQuery.query(driver, locators, count_only=True)):
+            if result["count"]:
+                return index
+        return -1
+
+    @staticmethod
+    def get_texts(driver, webelements: Sequence) -> List[str]:
+        """
+        Returns:
+            list: text of every WebElement, as WebElement.text
+        """
+        return [item["text"] for item in DomQuery.describe(driver, webelements)]
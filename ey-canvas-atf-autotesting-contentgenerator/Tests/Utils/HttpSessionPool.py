@@ -0,0 +1,137 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpSessionPool:
+    """
+    Shared keep-alive HTTP connections for the API keywords.
+
+    Every host (E.g: universalAPIEndpoint and artemisAPIEndpoint of the current environment) gets one HTTPAdapter,
+    that is one urllib3 connection pool, shared by all the threads of the process. Each thread sends its requests
+    with its own requests.Session mounted on the shared adapters, so a connection and its TLS session are reused by
+    the next request to the same host instead of being opened again. The sessions reject every Set-Cookie, so no
+    cookie received by a test is sent by the next test of the thread; cookies passed to request() are still sent.
+
+    The pool size is taken from the HTTP_POOL_MAXSIZE environment variable or set with configure(),
+    E.g: from the --thread_count of the execution.
+    """
+    DEFAULT_POOL_MAXSIZE = 10
+
+    _lock = threading.Lock()
+    _adapters: Dict[str, HTTPAdapter] = {}
+    _local = threading.local()
+    _pool_maxsize = int(os.environ.get("HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE))
+    _pool_block = False
+    _requests_count = 0
+
+    @classmethod
+    def configure(cls, pool_maxsize: Optional[int] = None, pool_block: Optional[bool] = None):
+        """
+        Sets the limits of the connection pools created from now on
+        Args:
+            pool_maxsize (int): Maximum number of connections kept alive per host, E.g: the number of parallel tests
+            pool_block (bool): Wait for a free connection instead of opening a temporary one when the pool is full
+        """
+        with cls._lock:
+            if pool_maxsize is not None:
+                cls._pool_maxsize = max(1, int(pool_maxsize))
+            if pool_block is not None:
+                cls._pool_block = pool_block
+
+    @classmethod
+    def get_pool_maxsize(cls) -> int:
+        return cls._pool_maxsize
+
+    @classmethod
+    def request(cls, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request reusing the pooled connections of the host
+        Args:
+            method (str): HTTP method, E.g: GET
+            url (str): Full url of the request
+            **kwargs: Any argument of requests.Session.request, E.g: headers, json, verify, proxies
+        Returns:
+            requests.Response
+        """
+        session = cls.get_session(url)
+        with cls._lock:
+            cls._requests_count += 1
+        return session.request(method=method, url=url, **kwargs)
+
+    @classmethod
+    def get_session(cls, url: str) -> requests.Session:
+        """
+        Returns the session of the current thread with the shared adapter of the host of the url mounted
+        """
+        session = getattr(cls._local, "session", None)
+        if session is None:
+            session = cls._local.session = requests.Session()
+            session.headers["Connection"] = "keep-alive"
+            # Tests of the same thread share the session, not its cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        cls._mount_host(session, url)
+        return session
+
+    @classmethod
+    def mount(cls, session: requests.Session, url: str):
+        """
+        Mounts the shared adapter of the host of the url on another session, E.g: the session of a REST client
+        """
+        cls._mount_host(session, url)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """
+        Returns the connection reuse counters: hosts, requests sent through the pool,
+        connections opened and requests that reused an open connection
+        """
+        with cls._lock:
+            adapters = list(cls._adapters.values())
+            requests_count = cls._requests_count
+        connections = 0
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+        return {
+            "hosts": len(adapters),
+            "requests": requests_count,
+            "connections": connections,
+            "reused_connections": max(0, requests_count - connections)
+        }
+
+    @classmethod
+    def close(cls):
+        """
+        Closes every pooled connection
+        """
+        with cls._lock:
+            adapters = list(cls._adapters.values())
+            cls._adapters.clear()
+        for adapter in adapters:
+            adapter.close()
+
+    @classmethod
+    def _mount_host(cls, session: requests.Session, url: str):
+        parts = urlsplit(url)
+        prefix = f"{parts.scheme}://{parts.netloc}/"
+        adapter = cls._get_adapter(prefix)
+        if session.adapters.get(prefix) is not adapter:
+            session.mount(prefix, adapter)
+
+    @classmethod
+    def _get_adapter(cls, prefix: str) -> HTTPAdapter:
+        with cls._lock:
+            adapter = cls._adapters.get(prefix)
+            if adapter is None:
+                adapter = cls._adapters[prefix] = HTTPAdapter(pool_connections=1, pool_maxsize=cls._pool_maxsize,
+                                                              pool_block=cls._pool_block)
+            return adapter
@@ -0,0 +1,156 @@
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class LabelLookup:
+    """
+    Indexed access to the labels of channel_language_list.json (channel, language, service_line, service_org,
+    module and user).
+
+    The file is loaded once and every label gets an id -> name and a name -> id dictionary, so a translation is a
+    single dictionary lookup instead of a file read and a scan. The indexes are rebuilt only when the size or
+    modification time of the file changes, and are shared by every thread of the process.
+
+    The labels are stored as id -> name in the file, except user that is stored as email -> id.
+    """
+    LABELS_FILE = os.path.join("Tests", "filesForTests", "Config", "channel_language_list.json")
+    LABELS = ("channel", "language", "service_line", "service_org", "module", "user")
+    _NAME_KEYED_LABELS = ("user",)
+
+    _lock = threading.Lock()
+    _signature: Optional[Tuple[int, int]] = None
+    _labels: Optional[Dict[str, dict]] = None
+    _indexes: Dict[str, Dict[str, dict]] = {}
+
+    @classmethod
+    def exists(cls) -> bool:
+        return cls._get_indexes() is not None
+
+    @classmethod
+    def has_labels(cls, label: str) -> bool:
+        """
+        Returns True if the file has values for a label
+        """
+        indexes = cls._get_indexes()
+        return indexes is not None and bool(indexes.get(label, {}).get("by_id"))
+
+    @classmethod
+    def get_name(cls, label: str, label_id) -> Optional[str]:
+        """
+        Args:
+            label (str): One of LABELS, E.g: channel
+            label_id: Id of the value as stored in the file, E.g: "1"
+        Returns:
+            the name of the value, None if it is not in the file
+        """
+        return cls._get_index(label, "by_id").get(label_id)
+
+    @classmethod
+    def get_id(cls, label: str, label_name: str):
+        """
+        Args:
+            label (str): One of LABELS, E.g: language
+            label_name (str): Name of the value, E.g: English
+        Returns:
+            the id of the value (the first one if several values have the same name), None if it is not in the file
+        """
+        return cls._get_index(label, "by_name").get(label_name)
+
+    @classmethod
+    def get_names(cls, label: str, label_ids: Iterable) -> List[Optional[str]]:
+        """
+        Translates several ids of a label at once, E.g: the channels of a localization matrix
+        """
+        index = cls._get_index(label, "by_id")
+        return [index.get(label_id) for label_id in label_ids]
+
+    @classmethod
+    def get_ids(cls, label: str, label_names: Iterable[str]) -> List:
+        """
+        Translates several names of a label at once, E.g: the languages of a localization matrix
+        """
+        index = cls._get_index(label, "by_name")
+        return [index.get(label_name) for label_name in label_names]
+
+    @classmethod
+    def set_labels(cls, label: str, values: dict):
+        """
+        Replaces the values of a label in the file, creating it with every label empty if it does not exist
+        Args:
+            label (str): One of LABELS
+            values (dict): Values in the format of the file, id -> name (email -> id for user)
+        """
+        path = cls._get_path()
+        with cls._lock:
+            cls._reload_if_changed(path)
+            labels = dict(cls._labels) if cls._labels is not None else {name: {} for name in cls.LABELS}
+            # JSON keys are strings, the index is built from the same content the file will have
+            labels[label] = json.loads(json.dumps(values))
+
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, 'w') as temp_file:
+                    json.dump(labels, temp_file)
+                os.replace(temp_path, path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            cls._set_labels(labels, cls._get_signature(path))
+
+    @classmethod
+    def _get_index(cls, label: str, index_name: str) -> dict:
+        indexes = cls._get_indexes()
+        if indexes is None:
+            return {}
+        return indexes.get(label, {}).get(index_name, {})
+
+    @classmethod
+    def _get_indexes(cls) -> Optional[Dict[str, Dict[str, dict]]]:
+        path = cls._get_path()
+        with cls._lock:
+            cls._reload_if_changed(path)
+            return cls._indexes if cls._labels is not None else None
+
+    @classmethod
+    def _reload_if_changed(cls, path: str):
+        signature = cls._get_signature(path)
+        if signature == cls._signature:
+            return
+        if signature is None:
+            cls._set_labels(None, None)
+            return
+        with open(path) as json_file:
+            cls._set_labels(json.load(json_file), signature)
+
+    @classmethod
+    def _set_labels(cls, labels: Optional[Dict[str, dict]], signature: Optional[Tuple[int, int]]):
+        indexes = {}
+        for label, values in (labels or {}).items():
+            if label in cls._NAME_KEYED_LABELS:
+                by_name = dict(values)
+                by_id = {label_id: label_name for label_name, label_id in values.items()}
+            else:
+                by_id = dict(values)
+                by_name = {}
+                for label_id, label_name in values.items():
+                    by_name.setdefault(label_name, label_id)
+            indexes[label] = {"by_id": by_id, "by_name": by_name}
+        cls._labels = labels
+        cls._indexes = indexes
+        cls._signature = signature
+
+    @staticmethod
+    def _get_signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _get_path(cls) -> str:
+        return os.path.join(os.getcwd(), cls.LABELS_FILE)
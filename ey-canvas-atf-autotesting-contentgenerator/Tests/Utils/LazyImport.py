@@ -0,0 +1,48 @@
+import importlib
+import threading
+from typing import Any, Optional
+
+
+class LazyImport:
+    """
+    Module, or attribute of a module, imported the first time it is used.
+
+    Heavy dependencies (selenium, msal, autoit, scriptless...) are declared at module level with it instead of an
+    import statement, so importing a framework module does not load them for executions that never call the methods
+    using them, E.g: API only runs or --update_files.
+        SM = LazyImport("Tests.custom_methods.SeleniumMethods", "SeleniumMethods")
+        SM.click_webelement(webelement)  # SeleniumMethods (and selenium) are imported here
+
+    Attribute access and calls are forwarded to the imported object. Do not use it for base classes or exceptions
+    caught in except clauses, those need the real class when the module is imported.
+    """
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        """
+        Imports the module and returns it, or its attribute
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    module = importlib.import_module(self._module_name)
+                    self._target = getattr(module, self._attribute) if self._attribute else module
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set in __init__, dunders are not forwarded (copy, pickle...)
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        target = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        return f"<LazyImport {target} ({'loaded' if self._target is not None else 'not loaded'})>"
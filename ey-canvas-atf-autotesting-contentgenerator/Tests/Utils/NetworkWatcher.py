@@ -0,0 +1,88 @@
+from typing import List, Optional
+
+from Tests.Utils.WaitEngine import WaitEngine
+
+
+class NetworkWatcher:
+    """
+    Network log of the page, captured in the browser by a PerformanceObserver.
+
+    The first call on a page installs the observer, which keeps only the entries whose name matches a registered
+    pattern (a part of the URL, or a regex). Every call registers its pattern, checking the entries received before
+    it once, and returns the entries matching it. So polling for a request transfers the matching entries instead of
+    the whole window.performance.getEntries() list, which grows to thousands of entries on long SPA sessions.
+    A new page load starts with a new observer, as window.performance does.
+
+    Regex patterns are evaluated in the browser (JavaScript RegExp, same syntax as re for the usual patterns).
+    """
+
+    _SCRIPT = """
+        var request = arguments[0];
+        var watcher = window.__atfNetworkWatcher;
+        if (!watcher) {
+            watcher = window.__atfNetworkWatcher = {patterns: {}, matches: {}, seen: {}, observing: false};
+            watcher.add = function (key, entry) {
+                var id = entry.entryType + '|' + entry.name + '|' + entry.startTime;
+                if (watcher.patterns[key](entry.name) && !watcher.seen[key][id]) {
+                    watcher.seen[key][id] = true;
+                    watcher.matches[key].push(entry.toJSON());
+                }
+            };
+            watcher.scan = function (key) {
+                performance.getEntries().forEach(function (entry) { watcher.add(key, entry); });
+            };
+            try {
+                new PerformanceObserver(function (list) {
+                    list.getEntries().forEach(function (entry) {
+                        Object.keys(watcher.patterns).forEach(function (key) { watcher.add(key, entry); });
+                    });
+                }).observe({entryTypes: ['resource', 'navigation']});
+                watcher.observing = true;
+            } catch (error) {
+                watcher.observing = false;
+            }
+        }
+        var key = (request.regex ? 'regex:' : 'name:') + request.pattern;
+        if (!watcher.patterns[key]) {
+            var pattern = request.pattern;
+            if (request.regex) {
+                var expression = new RegExp(pattern);
+                watcher.patterns[key] = function (name) { return expression.test(name); };
+            } else {
+                watcher.patterns[key] = function (name) { return name.indexOf(pattern) !== -1; };
+            }
+            watcher.matches[key] = [];
+            watcher.seen[key] = {};
+            watcher.scan(key);
+        } else if (!watcher.observing) {
+            watcher.scan(key);
+        }
+        return watcher.matches[key];
+    """
+
+    @staticmethod
+    def find(driver, pattern: str, regex: bool = False) -> List[dict]:
+        """
+        Args:
+            driver (WebDriver): current web driver
+            pattern (str): Part of the request URL, or a regex if regex is True
+        Returns:
+            list: performance entries of the requests matching the pattern, E.g:
+            [{"name": "https://.../api/v1/Channels", "responseStatus": 200, "duration": 85.1, ...}]
+        """
+        return driver.execute_script(NetworkWatcher._SCRIPT, {"pattern": pattern, "regex": regex}) or []
+
+    @staticmethod
+    def wait_for(driver, pattern: str, regex: bool = False, status: Optional[int] = None,
+                 timeout: float = 20) -> Optional[dict]:
+        """
+        Waits for a request matching the pattern, and with the expected response status if provided
+        Returns:
+            dict: the first matching performance entry, None if there was none before the timeout
+        """
+        def check():
+            entries = NetworkWatcher.find(driver, pattern, regex)
+            if status is not None:
+                entries = [entry for entry in entries if int(entry.get("responseStatus", 0)) == int(status)]
+            return entries[0] if entries else None
+        return WaitEngine.until_or_default(check, timeout)
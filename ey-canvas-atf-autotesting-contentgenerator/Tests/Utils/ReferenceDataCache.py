@@ -0,0 +1,199 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from Tests.Utils.logging.LoggerFactory import Logger
+
+logger = Logger(__name__).get_logger()
+
+
+class ReferenceDataCache:
+    """
+    Response cache for the read-only reference endpoints of the API (channels, languages, service lines,
+    service organisations, modules, metadata tags...).
+
+    Responses are identified by environment, url, params and user, kept for TTL seconds and shared by all the threads
+    of the process; concurrent requests of the same missing response wait for a single API call. When the response
+    has an ETag, an expired entry is revalidated with If-None-Match and reused if the API answers 304.
+
+    Entries can be persisted in PERSIST_FILE to be reused by the next executions, enabled with the
+    REFERENCE_CACHE_PERSIST environment variable. The TTL can be changed with REFERENCE_CACHE_TTL (seconds).
+    """
+    DEFAULT_TTL = 1800
+    PERSIST_FILE = os.path.join("Tests", "filesForTests", "reference_data_cache.json")
+
+    _instance: Optional['ReferenceDataCache'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ttl: Optional[float] = None, persist: Optional[bool] = None):
+        self.ttl = float(ttl if ttl is not None else os.environ.get("REFERENCE_CACHE_TTL", self.DEFAULT_TTL))
+        if persist is None:
+            persist = os.environ.get("REFERENCE_CACHE_PERSIST", "false").lower() == "true"
+        self.persist = persist
+        self._entries: Dict[str, dict] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._notified = set()
+        self._lock = threading.Lock()
+        self._metrics = {"hits": 0, "misses": 0, "revalidated": 0, "errors": 0}
+        if self.persist:
+            self._load()
+
+    @classmethod
+    def get_instance(cls) -> 'ReferenceDataCache':
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = ReferenceDataCache()
+            return cls._instance
+
+    def get(self, environment: str, url: str, user: str, fetch: Callable[[dict], Any], params: Optional[dict] = None,
+            on_change: Optional[Callable[[Any], None]] = None) -> Any:
+        """
+        Returns the cached response of a reference endpoint, calling the API only when needed
+        Args:
+            environment (str): Environment of the execution, E.g: UAT3
+            url (str): Url of the endpoint
+            user (str): user_name_token of the request, E.g: CanvasAutomationUser1
+            fetch: Function doing the request, receives the extra headers to send (If-None-Match) and returns the
+                   response dict of make_api_request
+            params (dict): Query params of the request
+            on_change: Optional function called with the response the first time it is used in this process and
+                       every time its content changes, E.g: to store the labels in channel_language_list.json
+        Returns:
+            a copy of the response dict, None if the request failed
+        """
+        key = json.dumps([environment, url, sorted((params or {}).items()), user], default=str)
+
+        with self._get_key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and time.time() < entry["expires"]:
+                self._increment("hits")
+            else:
+                entry = self._refresh(key, entry, fetch)
+                if entry is None:
+                    return None
+
+            if on_change is not None and (key, entry["version"]) not in self._notified:
+                if entry["version"] is not None:
+                    self._notified.add((key, entry["version"]))
+                on_change(copy.deepcopy(entry["response"]))
+            return copy.deepcopy(entry["response"])
+
+    def get_lookup(self, environment: str, url: str, user: str, params: Optional[dict] = None,
+                   id_field: str = "id", name_field: str = "name") -> Optional[Dict[str, dict]]:
+        """
+        Returns id <-> name maps of a cached response, built once per response
+        Returns:
+            dict with the keys by_id and by_name, None if the response is not cached
+        """
+        key = json.dumps([environment, url, sorted((params or {}).items()), user], default=str)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            lookups = entry.setdefault("lookups", {})
+            if (id_field, name_field) not in lookups:
+                items = [item for item in self._get_items(entry["response"])
+                         if isinstance(item, dict) and id_field in item and name_field in item]
+                lookups[(id_field, name_field)] = {
+                    "by_id": {item[id_field]: item[name_field] for item in items},
+                    "by_name": {item[name_field]: item[id_field] for item in items}
+                }
+            return lookups[(id_field, name_field)]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._notified.clear()
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._metrics)
+
+    def _refresh(self, key: str, entry: Optional[dict], fetch: Callable[[dict], Any]) -> Optional[dict]:
+        extra_headers = {"If-None-Match": entry["etag"]} if entry is not None and entry.get("etag") else {}
+        response = fetch(extra_headers)
+        status_code = self._get_status_code(response)
+
+        if status_code == 304 and entry is not None:
+            self._increment("revalidated")
+            entry = dict(entry, expires=time.time() + self.ttl)
+        elif status_code == 200:
+            self._increment("misses")
+            version = entry["version"] + 1 if entry is not None else 0
+            entry = {"response": response, "etag": self._get_etag(response), "version": version,
+                     "expires": time.time() + self.ttl}
+        else:
+            # Errors are returned to the caller but never cached
+            self._increment("errors")
+            return {"response": response, "version": None} if response is not None else None
+
+        with self._lock:
+            self._entries[key] = entry
+        if self.persist:
+            self._save()
+        return entry
+
+    def _load(self):
+        try:
+            with open(self.PERSIST_FILE) as json_file:
+                persisted = json.load(json_file)
+        except (OSError, ValueError):
+            return
+        for key, entry in persisted.items():
+            # Keys are stored as pairs, JSON objects would turn integer keys of the response into strings
+            entry["response"] = dict(entry["response"]) if isinstance(entry["response"], list) else entry["response"]
+            self._entries[key] = entry
+
+    def _save(self):
+        with self._lock:
+            persisted = {key: {"response": list(entry["response"].items()) if isinstance(entry["response"], dict)
+                               else entry["response"],
+                               "etag": entry.get("etag"), "version": entry["version"], "expires": entry["expires"]}
+                         for key, entry in self._entries.items()}
+            try:
+                file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.PERSIST_FILE), prefix=".",
+                                                              suffix=".tmp")
+                with os.fdopen(file_descriptor, 'w') as temp_file:
+                    json.dump(persisted, temp_file, default=str)
+                os.replace(temp_path, self.PERSIST_FILE)
+            except (OSError, TypeError) as e:
+                logger.warning(f"Reference data cache could not be persisted: {str(e)}")
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+    def _increment(self, metric: str):
+        with self._lock:
+            self._metrics[metric] += 1
+
+    @staticmethod
+    def _get_status_code(response) -> Optional[int]:
+        if isinstance(response, dict):
+            return response.get("status_code")
+        return None
+
+    @staticmethod
+    def _get_etag(response) -> Optional[str]:
+        headers = response.get("headers") if isinstance(response, dict) else None
+        if not isinstance(headers, dict):
+            return None
+        for header_name, header_value in headers.items():
+            if header_name.lower() == "etag":
+                return header_value
+        return None
+
+    @staticmethod
+    def _get_items(response) -> list:
+        if isinstance(response, list):
+            return response
+        if isinstance(response, dict) and isinstance(response.get(0), list):
+            return response[0]
+        return []
@@ -0,0 +1,256 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from Tests.Utils.TestStats import TestStats
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised without calling the API when the circuit breaker of a host is open
+    """
+
+
+class RetriesExhaustedError(Exception):
+    """
+    Raised by RetryPolicy.run when every attempt failed, with the last result or exception of the function
+    """
+
+    def __init__(self, message: str, last_result: Any = None, last_exception: Optional[Exception] = None):
+        super().__init__(message)
+        self.last_result = last_result
+        self.last_exception = last_exception
+
+
+class RetryStats(TestStats):
+    """
+    Retries and time slept waiting for them, per test and for the whole execution
+    """
+    COUNTERS = {"retries": 0, "sleep_time": 0.0}
+
+    @classmethod
+    def record(cls, sleep_time: float):
+        cls.add(retries=1, sleep_time=sleep_time)
+
+
+class CircuitBreaker:
+    """
+    Stops calling a host that keeps failing: after FAILURE_THRESHOLD consecutive failures the circuit opens and every
+    call fails immediately for RESET_TIMEOUT seconds, then a single call is let through and closes the circuit if it
+    succeeds.
+    """
+    FAILURE_THRESHOLD = 5
+    RESET_TIMEOUT = 30
+
+    _breakers: Dict[str, 'CircuitBreaker'] = {}
+    _breakers_lock = threading.Lock()
+
+    def __init__(self, host: str):
+        self.host = host
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_host(cls, host: str) -> 'CircuitBreaker':
+        with cls._breakers_lock:
+            if host not in cls._breakers:
+                cls._breakers[host] = CircuitBreaker(host)
+            return cls._breakers[host]
+
+    def before_call(self):
+        """
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.RESET_TIMEOUT or self._trial_running:
+                raise CircuitOpenError(f"Circuit open for {self.host} after {self._failures} consecutive failures")
+            self._trial_running = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._failures >= self.FAILURE_THRESHOLD:
+                if self._opened_at is None:
+                    print(f"[WARN] Circuit opened for {self.host} after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """
+    Retries a function with exponential backoff and jitter.
+
+    Results with a transient status code (RETRY_STATUSES) are retried, waiting what the Retry-After header asks for
+    when present; other 4xx responses and exceptions carrying them are never retried. When the HTTP method of the
+    call is given and it is not idempotent (E.g: POST, PATCH), a 5xx may come from a request the server processed,
+    so only 429 and 503 responses with a Retry-After header are retried. The total time spent, sleeps included, is
+    bounded by the deadline, and calls to a host can go through its CircuitBreaker.
+    """
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    # Statuses of requests that were not processed, retried for any method when the response has a Retry-After
+    RETRY_AFTER_STATUSES = (429, 503)
+
+    def __init__(self, retries: int = 3, base_delay: float = 2, max_delay: float = 30, backoff: float = 2,
+                 jitter: float = 0.5, deadline: Optional[float] = None, exceptions: Tuple = (Exception,),
+                 retry_statuses: Tuple[int, ...] = RETRY_STATUSES):
+        """
+        Args:
+            retries (int): Maximum number of attempts
+            base_delay (float): Delay in seconds before the second attempt, multiplied by backoff for every other one
+            max_delay (float): Maximum delay in seconds between attempts
+            backoff (float): Multiplier of the delay after every attempt
+            jitter (float): Fraction of the delay randomized (0 to 1), so parallel tests do not retry at the same time
+            deadline (float): Maximum seconds for all the attempts, no limit if None
+            exceptions (tuple): Exceptions that trigger a retry, others are raised immediately
+            retry_statuses (tuple): Status codes of the result that trigger a retry
+        """
+        self.retries = max(1, int(retries))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.exceptions = exceptions
+        self.retry_statuses = retry_statuses
+
+    def run(self, function: Callable[[], Any], conditional: Optional[Callable[[Any], bool]] = None,
+            host: Optional[str] = None, method: Optional[str] = None, return_transient_result: bool = True) -> Any:
+        """
+        Args:
+            function: Function to call without arguments
+            conditional: Optional function receiving the result and returning True if it has to be retried
+            host (str): Host of the call to use its circuit breaker, E.g: eycanvascoreapi-euw-uat3.eyua.net
+            method (str): HTTP method of the call, E.g: POST, its status codes are only retried if it is idempotent
+                          or the response has a Retry-After header
+            return_transient_result (bool): Return the last result when its status code is still transient after the
+                                            last attempt, instead of raising RetriesExhaustedError
+        Returns:
+            the result of the first successful attempt, or the last result when the status code is still transient
+            after the last attempt and return_transient_result is True
+        Raises:
+            RetriesExhaustedError: If every attempt raised an exception, met the conditional or, when
+                                   return_transient_result is False, had a transient status code
+            CircuitOpenError: If the circuit breaker of the host is open
+            Exception: Exceptions not in exceptions, or carrying a response with a non transient 4xx status code
+        """
+        breaker = CircuitBreaker.for_host(host) if host else None
+        started = time.monotonic()
+        last_result = None
+        last_exception = None
+        return_last_result = False
+
+        for attempt in range(self.retries):
+            if breaker:
+                breaker.before_call()
+            try:
+                result = function()
+            except self.exceptions as e:
+                response = getattr(e, "response", None)
+                status_code = self._get_status_code(response)
+                if status_code is not None and not self._is_transient(status_code, method, response):
+                    if breaker:
+                        # A 5xx that is not retried still counts as a failure of the host
+                        if status_code in self.retry_statuses:
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
+                    raise
+                if breaker:
+                    breaker.record_failure()
+                last_result, last_exception = None, e
+                retry_after = self._get_retry_after(response)
+                print(f"Error: {e}. Attempt {attempt + 1} of {self.retries}.")
+            else:
+                status_code = self._get_status_code(result)
+                transient = status_code is not None and self._is_transient(status_code, method, result)
+                condition_met = bool(conditional and conditional(result))
+                if breaker:
+                    if status_code in self.retry_statuses:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if not transient and not condition_met:
+                    return result
+                last_result, last_exception = result, None
+                # A response that is still transient after the last attempt is returned to the caller as it is
+                return_last_result = not condition_met
+                retry_after = self._get_retry_after(result)
+                reason = f"status code {status_code}" if transient else "condition for retry met"
+                print(f"Retrying, {reason}. Attempt {attempt + 1} of {self.retries}.")
+
+            if attempt + 1 == self.retries:
+                break
+            delay = self.get_delay(attempt, retry_after)
+            if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+                print(f"Retry deadline of {self.deadline} seconds reached")
+                break
+            print(f"Retrying in {delay:.1f} seconds...")
+            RetryStats.record(delay)
+            time.sleep(delay)
+
+        if last_exception is None and return_last_result and return_transient_result:
+            return last_result
+        raise RetriesExhaustedError("Max retries exceeded", last_result, last_exception)
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns the seconds to wait after an attempt (0 based), the Retry-After of the response has priority
+        """
+        if retry_after is not None:
+            return min(max(0.0, retry_after), self.max_delay)
+        delay = min(self.max_delay, self.base_delay * self.backoff ** attempt)
+        return delay * (1 - self.jitter * random.random())
+
+    def _is_transient(self, status_code: int, method: Optional[str] = None, response=None) -> bool:
+        if status_code not in self.retry_statuses:
+            return False
+        if method is None or method.upper() in self.IDEMPOTENT_METHODS:
+            return True
+        return status_code in self.RETRY_AFTER_STATUSES and self._get_retry_after(response) is not None
+
+    @staticmethod
+    def _get_status_code(response) -> Optional[int]:
+        if response is None:
+            return None
+        if isinstance(response, dict):
+            status_code = response.get("status_code", response.get("responseStatusCode"))
+        else:
+            status_code = getattr(response, "status_code", None)
+        try:
+            return int(status_code) if status_code is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_retry_after(response) -> Optional[float]:
+        if response is None:
+            return None
+        headers = response.get("headers") if isinstance(response, dict) else getattr(response, "headers", None)
+        if not headers:
+            return None
+        retry_after = next((value for name, value in headers.items() if name.lower() == "retry-after"), None)
+        if retry_after is None:
+            return None
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,182 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+
+class RunWorkspace:
+    """
+    Directory with the temporary files of a single execution, E.g: the suite config files
+    (Scriptless Execution.<suite>.json) that were written in the system temp folder.
+
+    Every execution gets its own directory under <temp>/RUNS_DIR_NAME, so concurrent executions on the same agent never
+    read or delete each other's files. The id of the run is shared with the processes started by the runner through
+    the RUN_ID_VARIABLE environment variable; the process that created the directory owns it and tears it down.
+
+    Created files are appended to a manifest in the directory, one JSON line per file, so listing and removing the
+    files of the run costs as many operations as files were created instead of scanning the temp folder. The state
+    files of the execution (STATE_FILES) are kept in the directory too, and removed with it, together with the lock
+    files StateStore creates next to the files in process mode.
+    """
+    RUNS_DIR_NAME = "canvas_atf_runs"
+    RUN_ID_VARIABLE = "ATF_RUN_ID"
+    MANIFEST_FILE = "manifest.jsonl"
+    STALE_RUN_AGE = 2 * 24 * 3600
+
+    # State files of the execution, read and written through get_path by CommonMethods, TokenMethods and the Token
+    # pysondb model
+    STATE_FILES = (
+        "temp.json",
+        "temp_engagements.json",
+        "temp_test_information.json",
+        "token_handler.json",
+        "Token.json"
+    )
+
+    _instance: Optional['RunWorkspace'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, run_id: str, owner: bool = False, root: Optional[str] = None):
+        self.run_id = run_id
+        self.owner = owner
+        self.directory = os.path.join(root or os.path.join(tempfile.gettempdir(), self.RUNS_DIR_NAME), run_id)
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def get_instance(cls) -> 'RunWorkspace':
+        """
+        Returns the workspace of the execution, creating it (and becoming its owner) if no run id was inherited
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                run_id = os.environ.get(cls.RUN_ID_VARIABLE)
+                owner = not run_id
+                if owner:
+                    run_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{uuid.uuid4().hex[:6]}"
+                    os.environ[cls.RUN_ID_VARIABLE] = run_id
+                cls._instance = RunWorkspace(run_id, owner)
+                if owner:
+                    print(f"[INFO] Run workspace: {cls._instance.directory}")
+            return cls._instance
+
+    def get_path(self, name: str) -> str:
+        """
+        Returns the path of a file of the run, E.g: get_path("Scriptless Execution.Smoke.json")
+        """
+        return os.path.join(self.directory, name)
+
+    def copy_template(self, template_path: str, name: str) -> str:
+        """
+        Copies a template into the run directory and adds it to the manifest
+        Returns:
+            str: path of the copy
+        """
+        path = self.get_path(name)
+        shutil.copyfile(template_path, path)
+        self.track(name)
+        return path
+
+    def track(self, name: str):
+        """
+        Adds a file of the run directory to the manifest
+        """
+        entry = json.dumps({"name": name, "created": time.time(), "pid": os.getpid()})
+        with self._lock:
+            # Appending a line keeps the entries of other processes of the run
+            with open(self.get_path(self.MANIFEST_FILE), "a") as manifest:
+                manifest.write(entry + "\n")
+
+    def get_files(self, prefix: str = "") -> List[str]:
+        """
+        Returns the names of the existing files of the manifest starting with prefix, in creation order
+        """
+        names = []
+        seen = set()
+        for name in self._read_manifest():
+            if name.startswith(prefix) and name not in seen and os.path.exists(self.get_path(name)):
+                names.append(name)
+            seen.add(name)
+        return names
+
+    def remove(self, name: str) -> bool:
+        """
+        Removes a file of the run directory, and the lock file StateStore creates next to it in process mode
+        Returns:
+            bool: False if the file did not exist
+        """
+        try:
+            os.remove(self.get_path(name) + ".lock")
+        except FileNotFoundError:
+            pass
+        try:
+            os.remove(self.get_path(name))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def remove_state_files(self):
+        """
+        Removes the STATE_FILES of the run, E.g: before the listener creates them again from their templates
+        """
+        for name in self.STATE_FILES:
+            try:
+                self.remove(name)
+            except OSError as e:
+                print(f"[WARN] {name} could not be removed: {e}")
+
+    def teardown(self):
+        """
+        Removes the files of the manifest, the state files and the run directory
+        """
+        self.remove_state_files()
+        for name in self.get_files():
+            try:
+                self.remove(name)
+            except OSError as e:
+                print(f"[WARN] {name} could not be removed: {e}")
+        try:
+            os.remove(self.get_path(self.MANIFEST_FILE))
+        except FileNotFoundError:
+            pass
+        try:
+            os.rmdir(self.directory)
+        except OSError:
+            print(f"[WARN] Run workspace {self.directory} has untracked files, it is not removed")
+        with RunWorkspace._instance_lock:
+            if RunWorkspace._instance is self:
+                RunWorkspace._instance = None
+                if self.owner and os.environ.get(self.RUN_ID_VARIABLE) == self.run_id:
+                    del os.environ[self.RUN_ID_VARIABLE]
+
+    @classmethod
+    def remove_stale_runs(cls, max_age: float = STALE_RUN_AGE):
+        """
+        Removes the directories of runs older than max_age seconds, left by executions that were killed
+        """
+        runs_dir = os.path.join(tempfile.gettempdir(), cls.RUNS_DIR_NAME)
+        if not os.path.isdir(runs_dir):
+            return
+        limit = time.time() - max_age
+        for entry in os.scandir(runs_dir):
+            if entry.is_dir() and entry.stat().st_mtime < limit:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _read_manifest(self) -> List[str]:
+        try:
+            with open(self.get_path(self.MANIFEST_FILE)) as manifest:
+                lines = manifest.readlines()
+        except FileNotFoundError:
+            return []
+        names = []
+        for line in lines:
+            try:
+                names.append(json.loads(line)["name"])
+            except (ValueError, KeyError):
+                # A line being written by another process
+                continue
+        return names
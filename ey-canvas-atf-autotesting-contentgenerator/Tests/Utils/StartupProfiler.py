@@ -0,0 +1,128 @@
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class StartupProfiler:
+    """
+    Import time of every module loaded while the execution starts, used by the --profile-startup option of the runner.
+
+    While started, the import statements of the process go through a wrapper of builtins.__import__ that measures the
+    modules imported for the first time: cumulative time (the module and the imports it triggers) and self time (the
+    module alone). The report lists the slowest modules and packages and checks the total against a budget, so a new
+    eager import of selenium, msal, robot or pysondb in a framework module shows up as a startup regression.
+
+    The budget is DEFAULT_BUDGET seconds unless STARTUP_IMPORT_BUDGET or the runner option --startup_budget says
+    otherwise.
+    """
+    DEFAULT_BUDGET = 5.0
+
+    def __init__(self):
+        self._records: Dict[str, Dict[str, float]] = {}
+        self._children_time: List[float] = []
+        self._total = 0.0
+        self._original_import = None
+        self._started = None
+
+    @classmethod
+    def start(cls) -> 'StartupProfiler':
+        profiler = StartupProfiler()
+        profiler._original_import = builtins.__import__
+        profiler._started = time.perf_counter()
+        builtins.__import__ = profiler._import
+        return profiler
+
+    def stop(self):
+        if self._original_import is not None and builtins.__import__ == self._import:
+            builtins.__import__ = self._original_import
+
+    def get_total(self) -> float:
+        """
+        Returns the seconds spent importing modules since the profiler started
+        """
+        return self._total
+
+    def get_modules(self) -> List[Tuple[str, float, float]]:
+        """
+        Returns:
+            list of (module, cumulative seconds, self seconds), slowest first
+        """
+        return sorted(((name, record["cumulative"], record["self"]) for name, record in self._records.items()),
+                      key=lambda module: module[1], reverse=True)
+
+    def get_packages(self) -> List[Tuple[str, float]]:
+        """
+        Returns:
+            list of (top level package, self seconds of all its modules), slowest first, E.g: ("selenium", 0.8)
+        """
+        packages: Dict[str, float] = {}
+        for name, _, self_time in self.get_modules():
+            package = name.split(".")[0]
+            packages[package] = packages.get(package, 0.0) + self_time
+        return sorted(packages.items(), key=lambda package: package[1], reverse=True)
+
+    def report(self, budget: Optional[float] = None, top: int = 25) -> bool:
+        """
+        Stops the profiler and prints the import time breakdown
+        Args:
+            budget (float): Maximum seconds of imports allowed, STARTUP_IMPORT_BUDGET or DEFAULT_BUDGET if not provided
+            top (int): Number of modules and packages listed
+        Returns:
+            bool: False if the imports took longer than the budget
+        """
+        self.stop()
+        if budget is None:
+            budget = float(os.environ.get("STARTUP_IMPORT_BUDGET", self.DEFAULT_BUDGET))
+        elapsed = time.perf_counter() - self._started
+        modules = self.get_modules()
+
+        print(f"[INFO] Startup: {len(modules)} modules imported in {self._total:.3f}s "
+              f"({elapsed:.3f}s since the runner started)")
+        print(f"[INFO] {'cumulative':>10} {'self':>8}  module")
+        for name, cumulative, self_time in modules[:top]:
+            print(f"[INFO] {cumulative:>9.3f}s {self_time:>7.3f}s  {name}")
+        print(f"[INFO] {'self':>10}  package")
+        for package, self_time in self.get_packages()[:top]:
+            print(f"[INFO] {self_time:>9.3f}s  {package}")
+
+        if budget > 0 and self._total > budget:
+            print(f"[ERROR] Startup imports took {self._total:.3f}s, over the budget of {budget:.3f}s. "
+                  f"Check the slowest modules above for new eager imports")
+            return False
+        print(f"[INFO] Startup imports within the budget of {budget:.3f}s")
+        return True
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module_name = self._resolve_name(name, globals, level)
+        # Imports of other threads would break the nesting of the measures, only the main thread is profiled
+        if module_name is None or module_name in sys.modules or threading.current_thread() is not \
+                threading.main_thread():
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._children_time.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - started
+            children_time = self._children_time.pop()
+            record = self._records.setdefault(module_name, {"cumulative": 0.0, "self": 0.0})
+            record["cumulative"] += cumulative
+            record["self"] += max(0.0, cumulative - children_time)
+            if self._children_time:
+                self._children_time[-1] += cumulative
+            else:
+                self._total += cumulative
+
+    @staticmethod
+    def _resolve_name(name: str, globals: Optional[dict], level: int) -> Optional[str]:
+        if level == 0:
+            return name
+        try:
+            return importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+        except (ImportError, ValueError):
+            return None
@@ -0,0 +1,299 @@
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class StateStore:
+    """
+    In-memory store for the JSON state files shared by the keywords of an execution
+    (temp.json, temp_engagements.json, temp_test_information.json and the suite config files).
+
+    Every file is loaded once into memory and read from there. Writes lock only the top-level key being
+    modified and are flushed to disk in the background (write-behind) using an atomic rename, so parallel
+    threads neither serialize on nor corrupt the same file. Changes made to the file by someone else
+    (E.g: a runner copying a template over it or deleting it) are detected by its size and modification time.
+
+    Two modes are available, selected with the STATE_STORE_MODE environment variable:
+        thread (default): State is shared by the threads of one process, flushed with write-behind.
+        process: Every operation takes an OS file lock, reloads the file if another process changed it
+                 and writes through immediately. Use it when suites run in separate processes (E.g: pabot).
+    """
+    MODE_THREAD = "thread"
+    MODE_PROCESS = "process"
+    FLUSH_DELAY = 0.2
+
+    _stores: Dict[str, 'StateStore'] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, file_path: str, mode: str = MODE_THREAD):
+        self.file_path = os.path.abspath(file_path)
+        self.mode = mode
+        self._document: Optional[dict] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._document_lock = threading.RLock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    @classmethod
+    def for_file(cls, file_path: str) -> 'StateStore':
+        """
+        Returns the store of a JSON file, creating it on first use
+        Args:
+            file_path (str): Path of the JSON file, absolute or relative to the working directory
+        Returns:
+            StateStore shared by every caller of the process for that file
+        """
+        absolute_path = os.path.abspath(file_path)
+        with cls._stores_lock:
+            if absolute_path not in cls._stores:
+                mode = os.environ.get("STATE_STORE_MODE", cls.MODE_THREAD).lower()
+                cls._stores[absolute_path] = StateStore(absolute_path, mode)
+            return cls._stores[absolute_path]
+
+    @classmethod
+    def flush_all(cls):
+        """
+        Writes every pending change of every store to disk, E.g: before launching another process that reads the files
+        """
+        with cls._stores_lock:
+            stores = list(cls._stores.values())
+        for store in stores:
+            store.flush()
+
+    @classmethod
+    def invalidate_file(cls, file_path: str):
+        """
+        Drops the in-memory content of a file that was replaced or removed outside of the store
+        Args:
+            file_path (str): Path of the JSON file
+        """
+        with cls._stores_lock:
+            store = cls._stores.get(os.path.abspath(file_path))
+        if store is not None:
+            store.invalidate()
+
+    def exists(self) -> bool:
+        with self._transaction():
+            return self._document is not None
+
+    def get_all(self) -> dict:
+        """
+        Returns a copy of the whole document
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        with self._transaction():
+            return copy.deepcopy(self._require_document())
+
+    def get(self, key: str) -> Any:
+        """
+        Returns a copy of the value of a top-level key
+        Raises:
+            FileNotFoundError: If the file does not exist
+            KeyError: If the key is not in the document
+        """
+        with self._transaction():
+            return copy.deepcopy(self._require_document()[key])
+
+    def set(self, key: str, value: Any, create: bool = False) -> Any:
+        """
+        Sets the value of a top-level key
+        Args:
+            key (str): Top-level key
+            value: JSON serializable value
+            create (bool): Start from an empty document if the file does not exist
+        Returns:
+            the value that was set
+        """
+        return self.update(key, lambda _: value, create=create)
+
+    def update(self, key: str, update_function: Callable[[Any], Any], create: bool = False) -> Any:
+        """
+        Atomically replaces the value of a top-level key with the result of a function of its current value.
+        Only updates of the same key wait for each other.
+        Args:
+            key (str): Top-level key
+            update_function: Receives a copy of the current value (None if missing) and returns the new value
+            create (bool): Start from an empty document if the file does not exist
+        Returns:
+            the new value
+        """
+        if self.mode == self.MODE_PROCESS:
+            # Other processes do not share the key locks, so the whole update runs under the file lock
+            with self._transaction() as write_through:
+                return self._apply_update(key, update_function, create, write_through)
+
+        with self._get_key_lock(key):
+            with self._transaction():
+                if self._document is None and not create:
+                    self._require_document()
+                current_value = copy.deepcopy((self._document or {}).get(key))
+
+            new_value = update_function(current_value)
+
+            with self._transaction() as write_through:
+                return self._apply_update(key, lambda _: new_value, True, write_through)
+
+    def replace_all(self, document: dict):
+        """
+        Replaces the whole document
+        Args:
+            document (dict): New JSON serializable document
+        """
+        with self._transaction() as write_through:
+            self._document = copy.deepcopy(document)
+            self._mark_dirty(write_through)
+
+    def flush(self):
+        """
+        Writes pending changes to disk using a temporary file and an atomic rename
+        """
+        with self._document_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty or self._document is None:
+                return
+            if self.mode == self.MODE_PROCESS:
+                with self._file_lock():
+                    self._write_document()
+                return
+            # Do not resurrect a file that was replaced or removed since the last write
+            self._reload_if_changed()
+            if self._dirty:
+                self._write_document()
+
+    def invalidate(self):
+        with self._document_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._document = None
+            self._signature = None
+            self._dirty = False
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Holds the document lock (and the OS file lock in process mode) with the document in sync with disk.
+        Yields True when changes have to be written through before the transaction ends.
+        """
+        with self._document_lock:
+            if self.mode == self.MODE_PROCESS:
+                with self._file_lock():
+                    self._reload_if_changed()
+                    yield True
+                    if self._dirty:
+                        self._write_document()
+            else:
+                self._reload_if_changed()
+                yield False
+
+    def _reload_if_changed(self):
+        signature = self._get_disk_signature()
+        if self._document is not None and signature == self._signature:
+            return
+        if self._document is None and signature is None:
+            return
+        if self._dirty:
+            print(f'[WARN] {self.file_path} was changed outside of the state store, pending changes are discarded')
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        self._dirty = False
+        self._signature = signature
+        if signature is None:
+            self._document = None
+            return
+        with open(self.file_path) as json_file:
+            self._document = json.load(json_file)
+
+    def _apply_update(self, key: str, update_function: Callable[[Any], Any], create: bool, write_through: bool) -> Any:
+        if self._document is None:
+            if not create:
+                self._require_document()
+            self._document = {}
+        new_value = update_function(copy.deepcopy(self._document.get(key)))
+        self._document[key] = copy.deepcopy(new_value)
+        self._mark_dirty(write_through)
+        return new_value
+
+    def _require_document(self) -> dict:
+        if self._document is None:
+            raise FileNotFoundError(f"No such file: '{self.file_path}'")
+        return self._document
+
+    def _mark_dirty(self, write_through: bool):
+        self._dirty = True
+        if write_through or self._flush_timer is not None:
+            return
+        self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _write_document(self):
+        directory = os.path.dirname(self.file_path)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'w') as temp_file:
+                json.dump(self._document, temp_file)
+            os.replace(temp_path, self.file_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._signature = self._get_disk_signature()
+        self._dirty = False
+
+    def _get_disk_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._document_lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+    @contextmanager
+    def _file_lock(self):
+        with StateStore.lock_file(self.file_path):
+            yield
+
+    @staticmethod
+    @contextmanager
+    def lock_file(file_path: str):
+        """
+        Holds an OS lock on file_path + ".lock", shared with the other processes of the machine
+        """
+        with open(file_path + ".lock", "a+") as lock_file:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name == "nt":
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+atexit.register(StateStore.flush_all)
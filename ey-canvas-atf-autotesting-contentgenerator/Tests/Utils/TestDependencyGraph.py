@@ -0,0 +1,104 @@
+from typing import Callable, Dict, List
+
+STATUS_NOT_RUNNED = "NOT RUNNED"
+STATUS_RUNNING = "RUNNING"
+STATUS_PASSED = "PASSED"
+
+
+class TestDependencyGraph:
+    """
+    Dependencies of the tests described in test_information.json, indexed by id.
+
+    Every test has an id, a list of required test ids (requiredForExecution) and a list of optional groups
+    (optionals); a group is met when at least one of its tests passed or is not part of the execution.
+    The tests are indexed once by id, so dependency checks only look at the direct dependencies of a test
+    instead of scanning the whole file.
+
+    Unknown ids are reported when a check needs them, as before. get_warnings lists the problems of the whole
+    file (repeated and unknown ids, circular dependencies) without stopping the execution.
+    """
+
+    def __init__(self, test_information: dict):
+        """
+        Args:
+            test_information (dict): Content of test_information.json, test name -> test configuration
+        """
+        self._names_by_id: Dict[int, str] = {}
+        self._warnings: List[str] = []
+        for test_name, test_config in test_information.items():
+            if test_config["id"] in self._names_by_id:
+                # The first test with the id is the one found, as when the file was scanned
+                self._warnings.append(f"Test id {test_config['id']} is used by "
+                                      f"'{self._names_by_id[test_config['id']]}' and '{test_name}'")
+                continue
+            self._names_by_id[test_config["id"]] = test_name
+
+        self._required: Dict[str, List[int]] = {}
+        self._optionals: Dict[str, List[List[int]]] = {}
+        for test_name, test_config in test_information.items():
+            self._required[test_name] = list(test_config["requiredForExecution"])
+            self._optionals[test_name] = [list(group) for group in test_config["optionals"]]
+
+    def get_name_by_id(self, test_id: int) -> str:
+        return self._get_name(test_id)
+
+    def are_dependencies_met(self, test_name: str, get_status: Callable[[str], str]) -> bool:
+        """
+        Checks the dependencies of a test with the rules of the test_information file: a required test must not
+        be RUNNING and every optional group needs a test that passed or was not run.
+        Args:
+            test_name (str): Name of the test to check
+            get_status: Function returning the current status of a test by name
+        Returns:
+            True if the test can be executed
+        Raises:
+            ValueError: If a dependency id is not in the test_information file
+        """
+        for required_id in self._required[test_name]:
+            if get_status(self._get_name(required_id)) == STATUS_RUNNING:
+                return False
+        for group in self._optionals[test_name]:
+            if not any(get_status(self._get_name(optional_id)) in (STATUS_PASSED, STATUS_NOT_RUNNED)
+                       for optional_id in group):
+                return False
+        return True
+
+    def get_warnings(self) -> List[str]:
+        """
+        Returns the problems of the test_information file: repeated ids, unknown dependency ids and tests
+        depending on each other in a cycle
+        """
+        warnings = list(self._warnings)
+        dependencies: Dict[str, List[str]] = {}
+        for test_name in self._required:
+            dependencies[test_name] = []
+            for test_id in self._get_dependency_ids(test_name):
+                if test_id in self._names_by_id:
+                    dependencies[test_name].append(self._names_by_id[test_id])
+                else:
+                    warnings.append(f"Test with Id {test_id} required by '{test_name}' was not found in the "
+                                    f"test_information file")
+
+        # Tests left once every test whose dependencies can all run first has been removed are in a cycle
+        pending = dict(dependencies)
+        removed = True
+        while removed:
+            removed = False
+            for test_name, test_dependencies in list(pending.items()):
+                if not any(dependency in pending for dependency in test_dependencies):
+                    del pending[test_name]
+                    removed = True
+        if pending:
+            warnings.append(f"Circular dependency between the tests: {', '.join(pending)}")
+        return warnings
+
+    def _get_name(self, test_id: int) -> str:
+        if test_id not in self._names_by_id:
+            raise ValueError(f"Test with Id {test_id} was not found in the test_information file")
+        return self._names_by_id[test_id]
+
+    def _get_dependency_ids(self, test_name: str) -> List[int]:
+        dependency_ids = list(self._required[test_name])
+        for group in self._optionals[test_name]:
+            dependency_ids.extend(group)
+        return dependency_ids
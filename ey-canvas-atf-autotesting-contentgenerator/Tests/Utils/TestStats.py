@@ -0,0 +1,53 @@
+import threading
+from typing import Dict
+
+
+class TestStats:
+    """
+    Counters per test and for the whole execution, E.g: RetryStats and WaitStats.
+
+    Every subclass declares its counters in COUNTERS (name -> initial value) and gets its own table of tests. The
+    current test is kept per thread and shared by every subclass, so tests running in parallel threads record their
+    own counters; threads started by a test (E.g: BatchRequestExecutor) take the test of the thread that started them
+    with start_test.
+    """
+    COUNTERS: Dict[str, float] = {}
+
+    _local = threading.local()
+    _lock: threading.Lock
+    _tests: Dict[str, Dict[str, float]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._lock = threading.Lock()
+        cls._tests = {}
+
+    @staticmethod
+    def start_test(test_name: str):
+        TestStats._local.test_name = test_name
+
+    @staticmethod
+    def get_current_test() -> str:
+        return getattr(TestStats._local, "test_name", "")
+
+    @classmethod
+    def add(cls, **values: float):
+        """
+        Adds the values to the counters of the current test of the thread, E.g: add(retries=1, sleep_time=2.5)
+        """
+        test_name = cls.get_current_test()
+        with cls._lock:
+            stats = cls._tests.setdefault(test_name, dict(cls.COUNTERS))
+            for name, value in values.items():
+                stats[name] += value
+
+    @classmethod
+    def get_test_stats(cls, test_name: str) -> Dict[str, float]:
+        with cls._lock:
+            return dict(cls._tests.get(test_name, cls.COUNTERS))
+
+    @classmethod
+    def get_totals(cls) -> Dict[str, float]:
+        with cls._lock:
+            totals = {name: sum(stats[name] for stats in cls._tests.values()) for name in cls.COUNTERS}
+        return {name: round(value, 2) if isinstance(value, float) else value for name, value in totals.items()}
@@ -0,0 +1,201 @@
+import os
+import time
+from typing import Any, Callable, Optional, Sized, Tuple
+
+from Tests.Utils.TestStats import TestStats
+
+
+class WaitTimeoutError(Exception):
+    """
+    Raised by WaitEngine when the condition is not met before the deadline
+    """
+
+    def __init__(self, message: str, elapsed: float = 0.0, last_exception: Optional[Exception] = None):
+        super().__init__(message)
+        self.elapsed = elapsed
+        self.last_exception = last_exception
+
+
+class WaitStats(TestStats):
+    """
+    Number of waits and seconds spent waiting, per test and for the whole execution
+    """
+    COUNTERS = {"waits": 0, "wait_time": 0.0, "timeouts": 0}
+
+    @classmethod
+    def record(cls, latency: float, timed_out: bool):
+        cls.add(waits=1, wait_time=latency, timeouts=int(timed_out))
+
+
+class Condition:
+    """
+    Function checked by WaitEngine, met when it returns a truthy value.
+
+    Conditions can be combined, E.g: any of two locators, or all the tabs and the element of a page:
+        Condition.any_of(lambda: driver.find_elements(By.XPATH, first), lambda: driver.find_elements(By.XPATH, second))
+        Condition.count(lambda: driver.find_elements(By.XPATH, locator), expected=3)
+    """
+
+    def __init__(self, function: Callable[[], Any], description: str = ""):
+        self.function = function
+        self.description = description or getattr(function, "__name__", "condition")
+
+    def __call__(self) -> Any:
+        return self.function()
+
+    @staticmethod
+    def any_of(*functions: Callable[[], Any]) -> 'Condition':
+        """
+        Met when one of the functions is, checked in order
+        Returns (when met):
+            tuple: (index of the function, 0 based, value returned by it)
+        """
+        def check():
+            for index, function in enumerate(functions):
+                value = function()
+                if value:
+                    return index, value
+            return None
+        return Condition(check, "any of " + ", ".join(Condition._describe(function) for function in functions))
+
+    @staticmethod
+    def all_of(*functions: Callable[[], Any]) -> 'Condition':
+        """
+        Met when all the functions are
+        Returns (when met):
+            list: the values returned by every function
+        """
+        def check():
+            values = []
+            for function in functions:
+                value = function()
+                if not value:
+                    return None
+                values.append(value)
+            return values
+        return Condition(check, "all of " + ", ".join(Condition._describe(function) for function in functions))
+
+    @staticmethod
+    def count(function: Callable[[], Sized], expected: Optional[int] = None, minimum: Optional[int] = None,
+              maximum: Optional[int] = None) -> 'Condition':
+        """
+        Met when the number of items returned by the function (E.g: driver.find_elements) is expected, or between
+        minimum and maximum
+        Returns (when met):
+            the items returned by the function, or True if there are none (E.g: waiting for 0 elements)
+        """
+        def check():
+            items = function()
+            amount = len(items)
+            if expected is not None and amount != expected:
+                return None
+            if minimum is not None and amount < minimum:
+                return None
+            if maximum is not None and amount > maximum:
+                return None
+            return items or True
+        limits = [f"{name} {value}" for name, value in (("==", expected), (">=", minimum), ("<=", maximum))
+                  if value is not None]
+        return Condition(check, f"count of {Condition._describe(function)} {' and '.join(limits)}")
+
+    @staticmethod
+    def _describe(function: Callable) -> str:
+        return function.description if isinstance(function, Condition) else getattr(function, "__name__", "condition")
+
+
+class WaitEngine:
+    """
+    Waits for conditions polling with a monotonic deadline.
+
+    The condition is checked right away. Then the interval between checks starts at POLL_INTERVAL and grows up to
+    MAX_POLL_INTERVAL (WAIT_MAX_POLL_INTERVAL environment variable). So a wait returns less than 100ms after its
+    condition is met, without flooding the driver during long waits. The time of every wait is recorded in WaitStats.
+    """
+    POLL_INTERVAL = 0.025
+    MAX_POLL_INTERVAL = float(os.environ.get("WAIT_MAX_POLL_INTERVAL", 0.1))
+    POLL_BACKOFF = 1.5
+
+    @classmethod
+    def until(cls, condition: Callable[[], Any], timeout: float, message: Optional[str] = None,
+              ignored_exceptions: Tuple = (), poll_interval: Optional[float] = None) -> Any:
+        """
+        Args:
+            condition: Function or Condition, met when it returns a truthy value
+            timeout (float): Maximum seconds to wait
+            message (str): Message of the error raised on timeout
+            ignored_exceptions (tuple): Exceptions of the condition considered as not met, E.g: StaleElementReference
+            poll_interval (float): First interval between checks, POLL_INTERVAL by default
+        Returns:
+            the value returned by the condition when it was met
+        Raises:
+            WaitTimeoutError: If the condition was not met before the timeout
+        """
+        started = time.monotonic()
+        met, value, last_exception = cls._poll(condition, started + max(0.0, float(timeout)), ignored_exceptions,
+                                               poll_interval)
+        return cls._finish(condition, started, met, value, last_exception, message)
+
+    @classmethod
+    def until_or_default(cls, condition: Callable[[], Any], timeout: float, default: Any = None,
+                         ignored_exceptions: Tuple = ()) -> Any:
+        """
+        Same as until, but returns default instead of raising when the condition is not met
+        """
+        try:
+            return cls.until(condition, timeout, ignored_exceptions=ignored_exceptions)
+        except WaitTimeoutError:
+            return default
+
+    @classmethod
+    def repeat_until(cls, action: Callable[[], Any], condition: Callable[[], Any], timeout: float,
+                     action_interval: float, message: Optional[str] = None, ignored_exceptions: Tuple = ()) -> Any:
+        """
+        Repeats an action (E.g: a click) until a condition is met, waiting up to action_interval seconds for the
+        condition after every action, so the wait ends as soon as the condition is met instead of after the interval
+        Returns:
+            the value returned by the condition when it was met
+        Raises:
+            WaitTimeoutError: If the condition was not met before the timeout
+        """
+        started = time.monotonic()
+        deadline = started + max(0.0, float(timeout))
+        while True:
+            action()
+            met, value, last_exception = cls._poll(condition, min(time.monotonic() + float(action_interval), deadline),
+                                                   ignored_exceptions)
+            if met or time.monotonic() >= deadline:
+                return cls._finish(condition, started, met, value, last_exception, message)
+
+    @classmethod
+    def _poll(cls, condition: Callable[[], Any], deadline: float, ignored_exceptions: Tuple = (),
+              poll_interval: Optional[float] = None) -> Tuple[bool, Any, Optional[Exception]]:
+        """
+        Checks the condition until it is met or the monotonic deadline passes, the last check is done at the deadline
+        Returns:
+            tuple: (met, value returned by the condition, last ignored exception)
+        """
+        interval = poll_interval or cls.POLL_INTERVAL
+        last_exception = None
+        while True:
+            try:
+                value = condition()
+            except ignored_exceptions as e:
+                value, last_exception = None, e
+            if value:
+                return True, value, last_exception
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False, value, last_exception
+            time.sleep(min(interval, remaining))
+            interval = min(interval * cls.POLL_BACKOFF, max(cls.MAX_POLL_INTERVAL, interval))
+
+    @staticmethod
+    def _finish(condition: Callable[[], Any], started: float, met: bool, value: Any,
+                last_exception: Optional[Exception], message: Optional[str]) -> Any:
+        elapsed = time.monotonic() - started
+        WaitStats.record(elapsed, timed_out=not met)
+        if met:
+            return value
+        description = condition.description if isinstance(condition, Condition) else "condition"
+        raise WaitTimeoutError(message or f"Waited {elapsed:.1f} seconds, {description} was not met", elapsed,
+                               last_exception)
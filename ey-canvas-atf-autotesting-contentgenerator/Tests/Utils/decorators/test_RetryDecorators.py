@@ -0,0 +1,49 @@
+import unittest
+from unittest import mock
+
+from Tests.Utils.decorators.RetryDecorators import retry_with_condition
+
+DEFAULT = {"status_code": -1}
+
+
+class RetryWithConditionTest(unittest.TestCase):
+    """
+    Run from the repository root: python -m unittest Tests.Utils.decorators.test_RetryDecorators
+    """
+
+    def setUp(self):
+        patch = mock.patch("Tests.Utils.RetryPolicy.time.sleep")
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_returns_the_default_value_when_the_status_code_is_still_transient(self):
+        responses = iter([{"status_code": 500}, {"status_code": 503}, {"status_code": 502}])
+
+        @retry_with_condition(retries=3, retry_delay=0, default_return_value=DEFAULT, error_message="Still failing")
+        def request():
+            return next(responses)
+
+        with mock.patch("builtins.print") as print_mock:
+            self.assertEqual(request(), DEFAULT)
+        print_mock.assert_any_call("Still failing")
+
+    def test_returns_the_default_value_when_the_condition_is_still_met(self):
+        @retry_with_condition(retries=2, retry_delay=0, conditional=lambda response: response["status_code"] == 404,
+                              default_return_value=DEFAULT)
+        def request():
+            return {"status_code": 404}
+
+        self.assertEqual(request(), DEFAULT)
+
+    def test_returns_the_first_successful_response(self):
+        responses = iter([{"status_code": 500}, {"status_code": 200}])
+
+        @retry_with_condition(retries=3, retry_delay=0, default_return_value=DEFAULT)
+        def request():
+            return next(responses)
+
+        self.assertEqual(request(), {"status_code": 200})
+
+
+if __name__ == "__main__":
+    unittest.main()
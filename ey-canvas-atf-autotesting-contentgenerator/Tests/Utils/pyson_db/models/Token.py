@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from enum import Enum
+from Tests.Utils.RunWorkspace import RunWorkspace
 from Tests.Utils.pyson_db.PysonDbModelBase import PysonDbModelBase
 
 
@@ -12,6 +13,8 @@ class Token(PysonDbModelBase):
 
     def __init__(self,):
         PysonDbModelBase.__init__(self)
+        # Tokens are kept per execution, concurrent executions on the same agent do not share them
+        self.db_location = RunWorkspace.get_instance().directory
         self.token = ""
         self.creation_time = datetime.now().strftime("%m/%d/%Y, %H:%M:%S")
         self.expiration_time = (datetime.now() + timedelta(minutes = 40)).strftime("%m/%d/%Y, %H:%M:%S")
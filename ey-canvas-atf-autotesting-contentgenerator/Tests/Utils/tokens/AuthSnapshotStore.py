@@ -0,0 +1,250 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+from Tests.Utils.WaitEngine import WaitEngine
+
+
+class _SnapshotCipher:
+    """
+    Encrypts the snapshots: with Fernet if AUTH_SNAPSHOT_KEY has a key (Fernet.generate_key()), with the Windows
+    data protection API (bound to the Windows account of the agent) otherwise. Without either, snapshots are disabled,
+    they are never written in plain text.
+    """
+    KEY_VARIABLE = "AUTH_SNAPSHOT_KEY"
+
+    def __init__(self):
+        self._fernet = None
+        key = os.environ.get(self.KEY_VARIABLE)
+        if key:
+            from cryptography.fernet import Fernet
+            self._fernet = Fernet(key.encode())
+        self.enabled = self._fernet is not None or os.name == "nt"
+
+    def encrypt(self, data: bytes) -> bytes:
+        if self._fernet is not None:
+            return self._fernet.encrypt(data)
+        return self._dpapi(data, protect=True)
+
+    def decrypt(self, data: bytes) -> bytes:
+        if self._fernet is not None:
+            return self._fernet.decrypt(data)
+        return self._dpapi(data, protect=False)
+
+    @staticmethod
+    def _dpapi(data: bytes, protect: bool) -> bytes:
+        import ctypes
+        import ctypes.wintypes
+
+        class DataBlob(ctypes.Structure):
+            _fields_ = [("cbData", ctypes.wintypes.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
+
+        buffer = ctypes.create_string_buffer(data, len(data))
+        blob_in = DataBlob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+        blob_out = DataBlob()
+        function = ctypes.windll.crypt32.CryptProtectData if protect else ctypes.windll.crypt32.CryptUnprotectData
+        if not function(ctypes.byref(blob_in), None, None, None, None, 0, ctypes.byref(blob_out)):
+            raise ctypes.WinError()
+        try:
+            return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+        finally:
+            ctypes.windll.kernel32.LocalFree(blob_out.pbData)
+
+
+class AuthSnapshotStore:
+    """
+    Encrypted snapshots of the authentication of a browser, per user, so later browsers start logged in without the
+    interactive SSO flow.
+
+    A snapshot has every cookie of the browser (the application and the identity provider ones, through CDP) and the
+    local storage of the application, including the MSAL cache entries read by
+    TokenMethods._get_correct_token_from_local_storage. It expires with the first MSAL access token, REFRESH_AHEAD
+    before it, and never lasts more than MAX_AGE seconds (AUTH_SNAPSHOT_MAX_AGE environment variable).
+
+    restore injects the cookies, seeds the local storage before the scripts of the application run and loads the
+    page. Once the page is loaded it waits SETTLE_TIME seconds, so MSAL can redirect to the identity provider when the
+    session is not valid anymore, and checks that the browser is still on the application with a live MSAL access
+    token, as TokenMethods._get_correct_token_from_local_storage reads it. Otherwise the snapshot is removed, the
+    restored cookies and storage are cleared and the caller falls back to the full SSO flow.
+    """
+    SNAPSHOTS_DIR = os.path.join("Tests", "filesForTests", "auth_snapshots")
+    MAX_AGE = int(os.environ.get("AUTH_SNAPSHOT_MAX_AGE", 8 * 3600))
+    REFRESH_AHEAD = 5 * 60
+    RESTORE_TIMEOUT = 15
+    SETTLE_TIME = 3
+
+    # Fields of Network.getAllCookies accepted by Network.setCookies
+    _COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority")
+
+    _SEED_SCRIPT = """
+        (function (origin, items) {
+            if (window.location.origin !== origin || window.sessionStorage.getItem('__atfAuthSnapshot')) { return; }
+            Object.keys(items).forEach(function (key) { window.localStorage.setItem(key, items[key]); });
+            window.sessionStorage.setItem('__atfAuthSnapshot', '1');
+        })(%s, %s);
+    """
+
+    _instance: Optional['AuthSnapshotStore'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or os.path.join(os.getcwd(), self.SNAPSHOTS_DIR)
+        self._cipher = _SnapshotCipher()
+        self._lock = threading.Lock()
+        if not self._cipher.enabled:
+            print(f"[WARN] Auth snapshots are disabled, set {_SnapshotCipher.KEY_VARIABLE} to encrypt them")
+
+    @classmethod
+    def get_instance(cls) -> 'AuthSnapshotStore':
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = AuthSnapshotStore()
+            return cls._instance
+
+    def capture(self, driver, user: str) -> bool:
+        """
+        Saves the authentication of a logged in browser, opened on the application
+        Args:
+            driver (WebDriver): Chromium browser (Edge or Chrome), CDP is needed to read the identity provider cookies
+            user (str): credential user name, E.g: CanvasAutomationUser1
+        Returns:
+            bool: False if snapshots are disabled or the browser has no MSAL access token
+        """
+        if not self._cipher.enabled or not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        origin = driver.execute_script("return window.location.origin;")
+        local_storage = self._read_local_storage(driver)
+        expires_on = self._get_access_token_expiration(local_storage)
+        if expires_on is None:
+            return False
+        snapshot = {
+            "user": user,
+            "origin": origin,
+            "created": time.time(),
+            "expires": min(expires_on - self.REFRESH_AHEAD, time.time() + self.MAX_AGE),
+            "cookies": driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"],
+            "local_storage": local_storage
+        }
+        self._save(user, snapshot)
+        print(f"[INFO] Auth snapshot of {user} saved, valid until {time.ctime(snapshot['expires'])}")
+        return True
+
+    def restore(self, driver, user: str, url: str) -> bool:
+        """
+        Logs in a new browser with the snapshot of the user and opens url
+        Returns:
+            bool: False if there is no valid snapshot or the browser was not logged in with it
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        snapshot = self.get(user)
+        if snapshot is None or urlsplit(url).netloc != urlsplit(snapshot["origin"]).netloc:
+            return False
+
+        cookies = [{field: cookie[field] for field in self._COOKIE_FIELDS if field in cookie}
+                   for cookie in snapshot["cookies"]]
+        for cookie in cookies:
+            # Session cookies have no expiration
+            if cookie.get("expires", -1) <= 0:
+                cookie.pop("expires", None)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": self._SEED_SCRIPT % (json.dumps(snapshot["origin"]), json.dumps(snapshot["local_storage"]))})
+        try:
+            driver.get(url)
+            restored = WaitEngine.until_or_default(
+                lambda: driver.current_url.startswith(snapshot["origin"])
+                and driver.execute_script("return document.readyState") == "complete",
+                self.RESTORE_TIMEOUT, default=False)
+            if restored:
+                # MSAL redirects to the identity provider after the page is loaded when the session is not valid
+                redirected = WaitEngine.until_or_default(
+                    lambda: not driver.current_url.startswith(snapshot["origin"]), self.SETTLE_TIME, default=False)
+                restored = not redirected and self._has_live_access_token(driver)
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+        if not restored:
+            print(f"[WARN] The auth snapshot of {user} did not log in the browser, it is removed")
+            self.invalidate(user)
+            self._clear_restored_data(driver, snapshot["origin"], url)
+        return restored
+
+    def get(self, user: str) -> Optional[dict]:
+        """
+        Returns the snapshot of the user, None if there is none or it expired
+        """
+        if not self._cipher.enabled:
+            return None
+        try:
+            with open(self._get_path(user), "rb") as snapshot_file:
+                snapshot = json.loads(self._cipher.decrypt(snapshot_file.read()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[WARN] The auth snapshot of {user} could not be read, it is removed: {e}")
+            self.invalidate(user)
+            return None
+        if time.time() >= snapshot["expires"]:
+            self.invalidate(user)
+            return None
+        return snapshot
+
+    def invalidate(self, user: str):
+        try:
+            os.remove(self._get_path(user))
+        except FileNotFoundError:
+            pass
+
+    def _save(self, user: str, snapshot: dict):
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                temp_file.write(self._cipher.encrypt(json.dumps(snapshot).encode()))
+            os.replace(temp_path, self._get_path(user))
+
+    def _get_path(self, user: str) -> str:
+        # User names can be e-mails or DOMAIN\user
+        return os.path.join(self.directory, re.sub(r"[^\w.-]", "_", user) + ".snapshot")
+
+    def _has_live_access_token(self, driver) -> bool:
+        expires_on = self._get_access_token_expiration(self._read_local_storage(driver))
+        return expires_on is not None and expires_on > time.time()
+
+    @staticmethod
+    def _clear_restored_data(driver, origin: str, url: str):
+        """
+        Removes the cookies and storage of the snapshot and loads url again, so the SSO flow starts from scratch
+        """
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.get(url)
+
+    @staticmethod
+    def _read_local_storage(driver) -> dict:
+        return driver.execute_script(
+            "var items = {};"
+            "for (var i = 0; i < window.localStorage.length; i++) {"
+            "    var key = window.localStorage.key(i); items[key] = window.localStorage.getItem(key);"
+            "}"
+            "return items;") or {}
+
+    @staticmethod
+    def _get_access_token_expiration(local_storage: dict) -> Optional[float]:
+        """
+        Returns the expiration (epoch seconds) of the first MSAL access token of the local storage to expire
+        """
+        expirations = []
+        for value in local_storage.values():
+            try:
+                entry = json.loads(value)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(entry, dict) and entry.get("credentialType") == "AccessToken" and "expiresOn" in entry:
+                expirations.append(float(entry["expiresOn"]))
+        return min(expirations) if expirations else None
@@ -0,0 +1,278 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+from Tests.Utils.logging.LoggerFactory import Logger
+
+logger = Logger(__name__).get_logger()
+
+TIME_FORMAT = "%m/%d/%Y, %H:%M:%S"
+
+
+class _Flight:
+    """
+    A token request in progress, shared by every thread asking for the same token
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry: Optional[dict] = None
+        self.error: Optional[Exception] = None
+
+
+class TokenCache:
+    """
+    Single token cache of the framework, replacing the separate TokensUsers, token_handler.json and pysondb caches.
+
+    Tokens are identified by user, token name and location url and stored in two tiers:
+        L1: in-memory dictionary shared by all the threads of the process
+        L2: the pysondb Token.json file in the RunWorkspace directory, shared by the processes of the execution
+
+    A token is refreshed ahead of its expiration_time (REFRESH_AHEAD), and requests are single-flight: when N threads
+    need the same missing or expired token only one of them calls the provider, the others wait for its result.
+    While a still valid token is being refreshed, the other threads keep using the current one.
+    """
+    REFRESH_AHEAD = timedelta(minutes=5)
+    DEFAULT_DURATION = timedelta(minutes=40)
+
+    _instance: Optional['TokenCache'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, use_file_tier: bool = True):
+        self.use_file_tier = use_file_tier
+        self._entries: Dict[Tuple, dict] = {}
+        self._flights: Dict[Tuple, _Flight] = {}
+        self._lock = threading.Lock()
+        self._metrics = {"l1_hits": 0, "l2_hits": 0, "misses": 0, "refreshes": 0, "provider_calls": 0,
+                         "shared_requests": 0, "errors": 0}
+
+    @classmethod
+    def get_instance(cls) -> 'TokenCache':
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = TokenCache()
+            return cls._instance
+
+    def get_token(self, user: str, token_name: str, location_url: Optional[str],
+                  provider: Callable[[], dict]) -> str:
+        """
+        Returns a valid token, requesting a new one from the provider only when needed
+        Args:
+            user: user_name_token in the format of the .env file E.g: CanvasAutomationUser1
+            token_name: Name of the token E.g: CGTOKEN
+            location_url: Url of the API the token is for
+            provider: Function getting a new token, returns a dict with the keys "token", "resource_name" and
+                      optionally "expiration_time" (datetime)
+        Returns:
+            the token value
+        """
+        key = self._get_key(user, token_name, location_url)
+        now = datetime.now()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry["expiration_time"] - self.REFRESH_AHEAD:
+                self._metrics["l1_hits"] += 1
+                return entry["token"]
+
+        if entry is None and self.use_file_tier:
+            entry = self._load_from_file(key)
+            if entry is not None:
+                with self._lock:
+                    self._entries.setdefault(key, entry)
+                if now < entry["expiration_time"] - self.REFRESH_AHEAD:
+                    self._increment("l2_hits")
+                    return entry["token"]
+
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+                self._metrics["misses" if entry is None else "refreshes"] += 1
+            elif entry is not None and now < entry["expiration_time"]:
+                # Another thread is refreshing, the current token is still valid
+                self._metrics["l1_hits"] += 1
+                return entry["token"]
+            else:
+                self._metrics["shared_requests"] += 1
+
+        if is_leader:
+            self._fly(key, flight, provider)
+
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.entry["token"]
+
+    def put_token(self, user: str, token_name: str, token: str, location_url: Optional[str] = None,
+                  resource_name: str = "", duration: Optional[timedelta] = None):
+        """
+        Stores a token obtained outside of get_token, E.g: from the browser local storage
+        """
+        now = datetime.now()
+        entry = {
+            "user": user,
+            "token_name": self._get_token_name(token_name),
+            "location_url": location_url or None,
+            "resource_name": resource_name,
+            "token": token,
+            "creation_time": now,
+            "expiration_time": now + (duration or self.DEFAULT_DURATION)
+        }
+        key = self._get_key(user, token_name, location_url)
+        with self._lock:
+            self._entries[key] = entry
+        if self.use_file_tier:
+            self._save_to_file(entry)
+
+    def find_token(self, user: str, token_name: str, location_url: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the valid token stored for the user, token name and location url, without requesting a new one.
+        The file tier is read when the token is not in memory, E.g: in a process that did not get the token itself
+        Returns:
+            the token value, None if there is no valid token
+        """
+        key = self._get_key(user, token_name, location_url)
+        now = datetime.now()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and now < entry["expiration_time"]:
+            self._increment("l1_hits")
+            return entry["token"]
+
+        if self.use_file_tier:
+            entry = self._load_from_file(key)
+            if entry is not None and now < entry["expiration_time"]:
+                with self._lock:
+                    self._entries[key] = entry
+                self._increment("l2_hits")
+                return entry["token"]
+        return None
+
+    def find_any_token(self, user: str, token_name: str) -> Optional[str]:
+        """
+        Returns a valid token stored for the user and token name for any location url, without requesting a new one,
+        E.g: when the caller does not know the url the token was requested for
+        Returns:
+            the token value, None if there is no valid token
+        """
+        token_name = self._get_token_name(token_name)
+        now = datetime.now()
+        with self._lock:
+            for key, entry in self._entries.items():
+                if key[:2] == (user, token_name) and now < entry["expiration_time"]:
+                    self._metrics["l1_hits"] += 1
+                    return entry["token"]
+
+        if self.use_file_tier:
+            try:
+                records = self._get_file_db().getByQuery({"user": user, "token_name": token_name})
+            except Exception as e:
+                logger.debug(f"Token not available in the file tier: {str(e)}")
+                return None
+            for record in reversed(records):
+                entry = self._load_from_file((user, token_name, record.get("location_url")))
+                if entry is not None and now < entry["expiration_time"]:
+                    with self._lock:
+                        self._entries[self._get_key(user, token_name, entry["location_url"])] = entry
+                    self._increment("l2_hits")
+                    return entry["token"]
+        return None
+
+    def invalidate(self, user: str, token_name: str, location_url: Optional[str] = None):
+        with self._lock:
+            self._entries.pop(self._get_key(user, token_name, location_url), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Returns the cache counters: l1_hits, l2_hits, misses, refreshes (ahead of or after expiration),
+        provider_calls, shared_requests (threads that waited for another thread's request) and errors
+        """
+        with self._lock:
+            return dict(self._metrics)
+
+    def _fly(self, key: Tuple, flight: _Flight, provider: Callable[[], dict]):
+        try:
+            self._increment("provider_calls")
+            result = provider()
+            duration = None
+            if result.get("expiration_time"):
+                duration = result["expiration_time"] - datetime.now()
+            self.put_token(user=key[0], token_name=key[1], token=result["token"], location_url=key[2],
+                           resource_name=result.get("resource_name", ""), duration=duration)
+            with self._lock:
+                flight.entry = self._entries[key]
+        except Exception as e:
+            self._increment("errors")
+            logger.error(f"Error getting token {key[1]} for user {key[0]}: {str(e)}")
+            flight.error = e
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _load_from_file(self, key: Tuple) -> Optional[dict]:
+        try:
+            records = self._get_file_db().getByQuery({"user": key[0], "token_name": key[1], "location_url": key[2]})
+        except Exception as e:
+            logger.debug(f"Token not available in the file tier: {str(e)}")
+            return None
+        if not records:
+            return None
+        record = records[-1]
+        try:
+            return {
+                "user": record["user"],
+                "token_name": record["token_name"],
+                "location_url": record["location_url"],
+                "resource_name": record.get("resource_name", ""),
+                "token": record["token"],
+                "creation_time": datetime.strptime(record["creation_time"], TIME_FORMAT),
+                "expiration_time": datetime.strptime(record["expiration_time"], TIME_FORMAT)
+            }
+        except (KeyError, ValueError) as e:
+            logger.debug(f"Ignoring invalid token record in the file tier: {str(e)}")
+            return None
+
+    def _save_to_file(self, entry: dict):
+        from Tests.Utils.tokens.TokenAPI import TokenAPI
+
+        body = dict(entry)
+        body["creation_time"] = entry["creation_time"].strftime(TIME_FORMAT)
+        body["expiration_time"] = entry["expiration_time"].strftime(TIME_FORMAT)
+        try:
+            token_db = self._get_file_db()
+            records = token_db.getByQuery({"user": entry["user"], "token_name": entry["token_name"],
+                                           "location_url": entry["location_url"]})
+            if records:
+                token_db.updateById(records[-1]["id"], {**records[-1], **body})
+            else:
+                TokenAPI().post_token(body)
+                records = token_db.getByQuery({"user": entry["user"], "token_name": entry["token_name"],
+                                               "location_url": entry["location_url"]})
+                token_db.updateById(records[-1]["id"], {**records[-1], **body})
+        except Exception as e:
+            logger.error(f"Error saving token {entry['token_name']} for user {entry['user']} in the file tier: {str(e)}")
+
+    def _get_file_db(self):
+        from Tests.Utils.pyson_db.models.Token import Token
+
+        return Token().get_token_db("Token")
+
+    def _increment(self, metric: str):
+        with self._lock:
+            self._metrics[metric] += 1
+
+    @staticmethod
+    def _get_key(user: str, token_name: str, location_url: Optional[str]) -> Tuple:
+        return user, TokenCache._get_token_name(token_name), location_url or None
+
+    @staticmethod
+    def _get_token_name(token_name) -> str:
+        # TokenNames members and their plain values (E.g: "CGTOKEN" from the XML keywords) are the same token
+        return str(getattr(token_name, "value", token_name))
@@ -0,0 +1,171 @@
+import ast
+import os
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from Tests.Utils.logging.LoggerFactory import Logger
+from Tests.Utils.tokens.TokenNames import TokenNames
+
+logger = Logger(__name__).get_logger()
+
+DATA_REFERENCE_PATTERN = re.compile(r"^<%data:([^%]+)%>$")
+
+
+class TokenPrewarmer:
+    """
+    Acquires the tokens a suite needs before its tests start.
+
+    The suite (or single test case) XML is scanned statically for app-modules that receive both a user_name_token
+    and a token_name parameter, E.g: "Get MSAL Token". Data references (<%data:tokenUser1%>) are resolved with the
+    dataset rows of the test cases, and every distinct user/token pair is requested concurrently through
+    TokenMethodsV2, filling the TokenCache (memory and pysondb Token store) so the first test of every worker
+    does not wait for MSAL.
+    """
+    TEST_SUITES_DIR = os.path.join("Tests", "test_suites")
+    TEST_CASES_DIR = os.path.join("Tests", "test_cases")
+    DATASET_DIR = os.path.join("Tests", "resources", "dataset")
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+        self._datasets: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+    def collect_from_suite(self, suite_file: str, suite_name: str = "") -> Set[Tuple[str, str]]:
+        """
+        Returns the distinct (user_name_token, token_name) pairs used by the test cases of a suite
+        Args:
+            suite_file (str): Test suite file name in Tests/test_suites
+            suite_name (str): Name of the suite inside the file, all suites if empty
+        """
+        root = ET.parse(self._get_path(self.TEST_SUITES_DIR, suite_file)).getroot()
+        test_cases_by_file: Dict[str, List[Tuple[str, str]]] = {}
+
+        for suite in root.iter("test-suite"):
+            if suite_name and suite.get("name") != suite_name:
+                continue
+            for test_case in suite.iter("test-case"):
+                if test_case.get("skip", "false").lower() == "true":
+                    continue
+                test_cases_by_file.setdefault(test_case.get("test-case-file"), []).append(
+                    (test_case.get("test-case-name"), test_case.get("test-case-index", "")))
+
+        token_requests = set()
+        for test_case_file, test_cases in test_cases_by_file.items():
+            token_requests.update(self._collect_from_test_case_file(test_case_file, test_cases))
+        return token_requests
+
+    def collect_from_test_case(self, test_case_file: str, test_case_name: str,
+                               data_index: str = "") -> Set[Tuple[str, str]]:
+        """
+        Returns the distinct (user_name_token, token_name) pairs used by a single test case
+        """
+        return self._collect_from_test_case_file(test_case_file, [(test_case_name, data_index)])
+
+    def prewarm(self, token_requests: Set[Tuple[str, str]], environment: Optional[str] = None) -> Dict[str, int]:
+        """
+        Acquires all the tokens concurrently, failures are logged and left to the tests to retry
+        Args:
+            token_requests: (user_name_token, token_name) pairs as returned by the collect methods
+            environment (str): Environment of the execution, E.g: UAT3
+        Returns:
+            dict with the number of acquired and failed tokens
+        """
+        from Tests.custom_methods.TokenMethodsV2 import TokenMethodsV2
+
+        def acquire(token_request):
+            user_name_token, token_name = token_request
+            try:
+                token_name = TokenNames(token_name)
+            except ValueError:
+                logger.info(f"Token {token_name} of {user_name_token} is not a TokenNames value, it is not pre-warmed")
+                return False
+            try:
+                TokenMethodsV2().get_token(token_name=token_name, user_name_token=user_name_token,
+                                           environment=environment)
+                return True
+            except Exception as e:
+                logger.warning(f"Token pre-warming failed for {token_name} of {user_name_token}: {str(e)}")
+                return False
+
+        if not token_requests:
+            return {"acquired": 0, "failed": 0}
+
+        logger.info(f"Pre-warming {len(token_requests)} tokens: {sorted(token_requests)}")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(token_requests))) as executor:
+            results = list(executor.map(acquire, sorted(token_requests)))
+        return {"acquired": results.count(True), "failed": results.count(False)}
+
+    def _collect_from_test_case_file(self, test_case_file: str,
+                                     test_cases: List[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        root = ET.parse(self._get_path(self.TEST_CASES_DIR, test_case_file)).getroot()
+        test_case_elements = {test_case.get("name"): test_case for test_case in root.iter("test-case")}
+        token_requests = set()
+
+        for test_case_name, data_index in test_cases:
+            test_case = test_case_elements.get(test_case_name)
+            if test_case is None:
+                continue
+            rows = self._get_data_rows(test_case, data_index)
+            for user_name_token, token_name in self._get_token_parameters(test_case):
+                for row in rows:
+                    user = self._resolve(user_name_token, row)
+                    token = self._resolve(token_name, row)
+                    if user and token:
+                        token_requests.add((user, token))
+        return token_requests
+
+    @staticmethod
+    def _get_token_parameters(test_case) -> List[Tuple[str, str]]:
+        token_parameters = []
+        for input_parameters in test_case.iter("input-parameters"):
+            values = {parameter.get("name"): parameter.get("value", "")
+                      for parameter in input_parameters.findall("parameter")}
+            if "user_name_token" in values and "token_name" in values:
+                token_parameters.append((values["user_name_token"], values["token_name"]))
+        return token_parameters
+
+    def _get_data_rows(self, test_case, data_index: str) -> List[Dict[str, str]]:
+        data_file = test_case.get("data_file", "")
+        if not data_file:
+            return [{}]
+
+        if data_index:
+            row_ids = [data_index]
+        else:
+            try:
+                row_ids = list(ast.literal_eval(test_case.get("data_index", "") or "[]"))
+            except (ValueError, SyntaxError):
+                row_ids = []
+
+        dataset = self._get_dataset(data_file)
+        return [dataset[row_id] for row_id in row_ids if row_id in dataset] or [{}]
+
+    def _get_dataset(self, data_file: str) -> Dict[str, Dict[str, str]]:
+        if data_file not in self._datasets:
+            rows = {}
+            try:
+                root = ET.parse(self._get_path(self.DATASET_DIR, data_file)).getroot()
+                for row in root.findall("row"):
+                    values = {column.tag: column.text or "" for column in row}
+                    rows[values.get("ID")] = values
+            except (OSError, ET.ParseError) as e:
+                logger.warning(f"Dataset {data_file} could not be read for token pre-warming: {str(e)}")
+            self._datasets[data_file] = rows
+        return self._datasets[data_file]
+
+    @staticmethod
+    def _resolve(value: str, row: Dict[str, str]) -> Optional[str]:
+        match = DATA_REFERENCE_PATTERN.match(value)
+        if match:
+            return row.get(match.group(1))
+        if "<%" in value:
+            # Other references are only known at run time
+            return None
+        return value
+
+    @staticmethod
+    def _get_path(directory: str, file_name: str) -> str:
+        if not file_name.lower().endswith(".xml"):
+            file_name = f"{file_name}.xml"
+        return os.path.join(os.getcwd(), directory, file_name)
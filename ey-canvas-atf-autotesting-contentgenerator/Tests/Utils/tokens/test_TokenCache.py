@@ -0,0 +1,66 @@
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from Tests.Utils.tokens.TokenCache import TokenCache
+from Tests.Utils.tokens.TokenNames import TokenNames
+from Tests.custom_methods.CommonMethods import CommonMethods
+from Tests.custom_methods.TokenMethods import TokenMethods
+from Tests.custom_methods.TokenMethodsV2 import TokenMethodsV2
+
+USER = "CanvasAutomationUser1"
+ENVIRONMENT = "UAT3"
+# Variables of the environment in env.xml, there is no CanvasURL
+ENV_VARIABLES = {
+    "universalAPIEndpoint": "https://eycgapp-uat3.eyua.net",
+    "cgTenent": "https://eygs.onmicrosoft.com/canvas-uat3-nor"
+}
+
+
+class TokenCacheTest(unittest.TestCase):
+    """
+    Tokens written by TokenMethodsV2 are read by TokenMethods.get_token, E.g: in the content cleanup of the runner.
+    Run from the repository root: python -m unittest Tests.Utils.tokens.test_TokenCache
+    """
+
+    def setUp(self):
+        self.token_cache = TokenCache(use_file_tier=False)
+        patches = [
+            mock.patch.object(TokenCache, "_instance", self.token_cache),
+            mock.patch.object(CommonMethods, "get_app_env_variable", return_value=dict(ENV_VARIABLES)),
+            mock.patch.object(TokenMethodsV2, "get_current_environment", return_value=ENVIRONMENT, create=True),
+            mock.patch.object(TokenMethodsV2, "_request_msal_token",
+                              return_value={"token": "msal-token", "resource_name": ENV_VARIABLES["cgTenent"]})
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_get_token_finds_the_token_created_by_v2(self):
+        TokenMethodsV2().create_token(TokenNames.TOKEN_NAME_UNIVERSAL, USER)
+
+        self.assertEqual(TokenMethods.get_token(USER, ENVIRONMENT), "msal-token")
+
+    def test_get_token_finds_the_token_requested_by_v2(self):
+        TokenMethodsV2().get_token(TokenNames.TOKEN_NAME_UNIVERSAL, USER, ENVIRONMENT)
+
+        self.assertEqual(TokenMethods.get_token(USER, ENVIRONMENT), "msal-token")
+
+    def test_get_token_falls_back_to_any_universal_token_of_the_user(self):
+        self.token_cache.put_token(USER, TokenNames.TOKEN_NAME_UNIVERSAL, "browser-token")
+
+        self.assertEqual(TokenMethods.get_token(USER, ENVIRONMENT), "browser-token")
+
+    def test_get_token_ignores_expired_tokens(self):
+        self.token_cache.put_token(USER, TokenNames.TOKEN_NAME_UNIVERSAL, "expired-token",
+                                   location_url=ENV_VARIABLES["universalAPIEndpoint"],
+                                   duration=timedelta(seconds=-1))
+
+        self.assertIsNone(TokenMethods.get_token(USER, ENVIRONMENT))
+
+    def test_get_token_without_tokens(self):
+        self.assertIsNone(TokenMethods.get_token(USER, ENVIRONMENT))
+
+
+if __name__ == "__main__":
+    unittest.main()
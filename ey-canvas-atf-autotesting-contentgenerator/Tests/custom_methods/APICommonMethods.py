@@ -1,3 +1,5 @@
+from Tests.Utils.BatchRequestExecutor import BatchRequestExecutor
+from Tests.Utils.ReferenceDataCache import ReferenceDataCache
 from Tests.Utils.decorators.HeadersDecorator import add_headers
 from Tests.Utils.tokens.TokenNames import TokenNames
 from Tests.custom_methods.BaseClass.BaseAPIClass import BaseAPIClass
@@ -19,8 +21,7 @@ class APICommonMethods(BaseAPIClass):
         base_uri = self.API_UNIVERSAL
         path_parameter = self.endpoints.SELECT_CHANNEL()
         url = base_uri + path_parameter
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers)
-        CM.validate_if_channel_language_file_already_exists(label="channel", response=response)
+        response = self._get_reference_data(url=url, headers=headers, user_name_token=user_name_token, label="channel")
         self.console_response_log(response=response)
         return response
 
@@ -41,9 +42,10 @@ class APICommonMethods(BaseAPIClass):
 
         }
 
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers)
-        CM.validate_if_channel_language_file_already_exists(label="language", response=response)
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers, params=params)
+        _, response = BatchRequestExecutor(self._get_reference_data).run([
+            {"url": url, "headers": headers, "user_name_token": user_name_token, "label": "language"},
+            {"url": url, "headers": headers, "user_name_token": user_name_token, "params": params}
+        ])
         self.console_response_log(response=response)
         return response
 
@@ -57,8 +59,8 @@ class APICommonMethods(BaseAPIClass):
         path_parameter = self.endpoints.SELECT_SERVICE_LINE()
         url = base_uri + path_parameter
 
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers)
-        CM.validate_if_channel_language_file_already_exists(label="service_line", response=response)
+        response = self._get_reference_data(url=url, headers=headers, user_name_token=user_name_token,
+                                            label="service_line")
         self.console_response_log(response=response)
         return response
 
@@ -72,8 +74,8 @@ class APICommonMethods(BaseAPIClass):
         path_parameter = self.endpoints.GET_SERVICE_ORGANIZATION()
         url = base_uri + path_parameter
 
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers)
-        CM.validate_if_channel_language_file_already_exists(label="service_org", response=response)
+        response = self._get_reference_data(url=url, headers=headers, user_name_token=user_name_token,
+                                            label="service_org")
         self.console_response_log(response=response)
         return response
 
@@ -214,8 +216,7 @@ class APICommonMethods(BaseAPIClass):
         path_parameter = self.endpoints.SELECT_SERVICE_MODULE()
         url = base_uri + path_parameter
 
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers)
-        CM.validate_if_channel_language_file_already_exists(label="module", response=response)
+        response = self._get_reference_data(url=url, headers=headers, user_name_token=user_name_token, label="module")
         self.console_response_log(response=response)
         return response
 
@@ -232,7 +233,7 @@ class APICommonMethods(BaseAPIClass):
             "Active": "true"
         }
 
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers, params=params)
+        response = self._get_reference_data(url=url, headers=headers, user_name_token=user_name_token, params=params)
         self.console_response_log(response=response)
         return response
 
@@ -249,7 +250,7 @@ class APICommonMethods(BaseAPIClass):
             "Active": "true"
         }
 
-        response = self.make_api_request(method=self.METHOD_GET, url=url, headers=headers, params=params)
+        response = self._get_reference_data(url=url, headers=headers, user_name_token=user_name_token, params=params)
         self.console_response_log(response=response)
         return response
 
@@ -450,3 +451,29 @@ class APICommonMethods(BaseAPIClass):
         response = self.make_api_request(method=self.METHOD_DELETE, url=url, headers=headers)
         self.console_response_log(response=response)
         return response
+
+    def _get_reference_data(self, url, headers, user_name_token, params=None, label=None):
+        """
+        GET request of a read-only reference endpoint through the ReferenceDataCache, the API is only called when the
+        response is not cached or expired
+
+        Args:
+                label                                          : channel_language_list.json label updated with the
+                                                                 response the first time it is used, E.g: channel
+
+        Returns:
+              Dict[str, any]                           : Dictionary containing the API response
+        """
+        on_change = None
+        if label:
+            on_change = lambda response: CM.validate_if_channel_language_file_already_exists(label=label,
+                                                                                              response=response)
+        return ReferenceDataCache.get_instance().get(
+            environment=self.custom_base.get_current_environment(),
+            url=url,
+            user=user_name_token,
+            params=params,
+            fetch=lambda extra_headers: self.make_api_request(method=self.METHOD_GET, url=url,
+                                                              headers={**headers, **extra_headers}, params=params),
+            on_change=on_change
+        )
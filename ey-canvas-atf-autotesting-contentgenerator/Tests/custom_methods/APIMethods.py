@@ -1,6 +1,8 @@
 import json
-import requests
 import urllib3
+from Tests.Utils.ApiCassette import ApiCassette, CassetteResponse
+from Tests.Utils.BatchRequestExecutor import BatchRequestExecutor
+from Tests.Utils.HttpSessionPool import HttpSessionPool
 from Tests.custom_methods.CommonMethods import CommonMethods as CM
 
 class APIMethods:
@@ -41,27 +43,46 @@ class APIMethods:
         }
         if body != None and body != "" and type(body) is not dict:
             body = APIMethods.string_to_dict(body)
-        environment = CM.get_value_in_temp_variable("Environment")
         verify = False
-        if environment == "uat3-univ-mx":
-            verify = False
-        env_variables = CM.get_app_env_variable(environment)
         urllib3.disable_warnings()
-        if method == 'GET':
-            response = requests.get(url=url, proxies=proxies, headers=headers, verify=verify)
-        if method == 'OPTIONS':
-            response = requests.options(url=url, proxies=proxies, headers=headers)
-        if method == 'POST':
-            response = requests.post(url=url, proxies=proxies, headers=headers, json=body, verify=verify)
-        if method == 'PUT':
-            response = requests.put(url=url, proxies=proxies, headers=headers, json=body, verify=verify)
-        if method == 'PATCH':
-            response = requests.patch(url=url, proxies=proxies, headers=headers, json=body, verify=verify)
-        if method == 'DELETE':
-            response = requests.delete(url=url, proxies=proxies, headers=headers, json=body, verify=verify)                    
+        response = ApiCassette.intercept(
+            method, url, None, body if method in ('POST', 'PUT', 'PATCH', 'DELETE') else None,
+            send=lambda: APIMethods._send_request(method, url, body, headers, proxies, verify),
+            to_record=lambda sent_response: {"status_code": sent_response.status_code, "text": sent_response.text},
+            from_record=lambda record: CassetteResponse(record["status_code"], record["text"])
+        )
         response_dict = APIMethods.generate_response_dict(method, url, params, body, headers, response)
         return response_dict
 
+    @staticmethod
+    def _send_request(method, url, body, headers, proxies, verify):
+        # Connections are kept alive and reused per host by the shared session pool
+        if method == 'GET':
+            response = HttpSessionPool.request('GET', url=url, proxies=proxies, headers=headers, verify=verify)
+        if method == 'OPTIONS':
+            response = HttpSessionPool.request('OPTIONS', url=url, proxies=proxies, headers=headers)
+        if method in ('POST', 'PUT', 'PATCH', 'DELETE'):
+            response = HttpSessionPool.request(method, url=url, proxies=proxies, headers=headers, json=body, verify=verify)
+        return response
+
+    @staticmethod
+    def batch_api_request(request_specs, max_workers=BatchRequestExecutor.DEFAULT_MAX_WORKERS):
+        """
+        Sends independent requests concurrently
+        Args:
+            request_specs: List of dicts with the arguments of api_request, only method and url are mandatory
+                           E.g: [{"method": "GET", "url": url, "auth": token}]
+            max_workers (int): Maximum number of requests in flight
+        Returns:
+            list with the response dict of api_request for every request, in the same order as request_specs
+        """
+        def send(method, url, params='', body='', headers='', auth=''):
+            return APIMethods.api_request(method, url, params, body, headers, cookies='', files='', auth=auth,
+                                          timeout='', allow_redirects='', proxies='', verify=False, stream='',
+                                          cert='')
+
+        return BatchRequestExecutor(send, max_workers=max_workers).run(request_specs)
+
     @staticmethod
     def add_params_to_url(url, params):
         if params != '' and params != None:
@@ -4,14 +4,18 @@ import sys
 from typing import Dict
 from robot.utils.asserts import assert_equal
 from scriptless.Core.library.common.CustomBase import CustomBase
+import requests
 import urllib3
 from scriptless.Core.framework.data_handler import Data_handler
+from Tests.Utils.ApiCassette import ApiCassette
+from Tests.Utils.BatchRequestExecutor import BatchRequestExecutor
+from Tests.Utils.HttpSessionPool import HttpSessionPool
 from Tests.Utils.TokensUsers import TokensUsers
 from Tests.Utils.tokens.TokenNames import TokenNames
-from Tests.Utils.decorators.RetryDecorators import retry, silent_retry_with_default
+from Tests.Utils.RetryPolicy import CircuitOpenError, RetriesExhaustedError, RetryPolicy
 from Tests.custom_methods.TokenMethods import TokenMethods
-from urllib.parse import urlencode
-from Tests.resources.constants.Endpoints import Endpoints
+from urllib.parse import urlencode, urlsplit
+from Tests.resources.constants.Endpoints import ENDPOINT_REGISTRY, Endpoints
 from Tests.resources.constants.api.artemis.ArtemisEndpoints import ArtemisEndpoints
 
 
@@ -34,56 +38,128 @@ class BaseAPIClass:
     STATUS_CODE_204 = 204
     STATUS_CODE_201 = 201
 
+    API_RETRY_POLICY = RetryPolicy(retries=3, base_delay=1, max_delay=10, deadline=30)
+
+    # Endpoint templates are parsed once per process and shared by every API class instance
+    endpoints = Endpoints()
+    artemis_endpoints = ArtemisEndpoints()
+    endpoint_registry = ENDPOINT_REGISTRY
+
     def __init__(self):
         self.custom_base = CustomBase()
-        self.endpoints = Endpoints()
-        self.artemis_endpoints = ArtemisEndpoints()
 
     def get_headers(self, token_name, user_name='CanvasAutomationUser1'):
         headers = self.HEADERS.copy()
+        if ApiCassette.is_replaying():
+            # The responses come from the cassette, no token is needed
+            headers["Authorization"] = "Bearer " + ApiCassette.REPLAY_TOKEN
+            return headers
         headers["Authorization"] = "Bearer " + TokensUsers.get_token(user_name, token_name)
         return headers
 
     def get_headers_v2(self, token_name: TokenNames, user_name_token='CanvasAutomationUser1'):
         from Tests.custom_methods.TokenMethodsV2 import TokenMethodsV2
         headers = self.HEADERS.copy()
+        if ApiCassette.is_replaying():
+            headers["Authorization"] = "Bearer " + ApiCassette.REPLAY_TOKEN
+            return headers
         headers["Authorization"] = "Bearer " + TokenMethodsV2().get_token(user_name_token=user_name_token,
                                                                           token_name=token_name)
 
         return headers
 
+    def build_url(self, endpoint_name: str, params: Dict = None, base_uri: str = None, **path_params) -> str:
+        """
+        Builds the url of a registered endpoint in one call
+        Args:
+            endpoint_name (str): Name of the endpoint in Endpoints, E.g: DELETE_FORM_BODY
+            params (dict): Query params of the request
+            base_uri (str): Base url of the API, API_UNIVERSAL by default
+            path_params: Values of the placeholders of the endpoint, E.g: body_id=123
+        Returns:
+            str: E.g: https://<universalAPIEndpoint>/api/v1/Bodies/123?includeDeleted=true
+        Raises:
+            ValueError: If a placeholder of the endpoint has no value or an unknown path param is provided
+        """
+        return self.endpoint_registry.build(endpoint_name, self.API_UNIVERSAL if base_uri is None else base_uri, params,
+                                            **path_params)
+
     def add_params_to_url(self, url, params):
         if params:
             query_string = urlencode(params)
             url = f"{url}?{query_string}"
         return url
 
-    @silent_retry_with_default(default_return_value=None, retries=3, retry_delay=2, exceptions=(Exception,), error_message="Max retries exceeded")
     def make_api_request(self, method, url, params=None, json=None, verify=False, headers=None):
-        response = None
-        try:
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            response = self.custom_base.get_restapi_instance().apirequest(
-                method=method,
-                url=url,
-                json=json,
-                verify=verify,
-                headers=headers,
-                params=params
-            )
-        except:
-            response = self.custom_base.get_restapi_instance().apirequest(
-                method=method,
-                url=url,
-                json=json,
-                verify=verify,
-                headers=headers,
-                params=params
-            )
-        finally:
-            pass
-
-        return response
+        rest_api = self.custom_base.get_restapi_instance()
+        self._use_pooled_connections(rest_api, url)
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        def send():
+            try:
+                return self.API_RETRY_POLICY.run(
+                    lambda: rest_api.apirequest(
+                        method=method,
+                        url=url,
+                        json=json,
+                        verify=verify,
+                        headers=headers,
+                        params=params
+                    ),
+                    host=urlsplit(url).netloc,
+                    method=method
+                )
+            except (RetriesExhaustedError, CircuitOpenError) as e:
+                print(f"{e}: {method} {url}")
+                return None
+
+        return ApiCassette.intercept(method, url, params, json, send, to_record=self._to_cassette_record,
+                                     from_record=lambda record: dict(record["response"]))
+
+    def batch(self, request_specs, max_workers=BatchRequestExecutor.DEFAULT_MAX_WORKERS, max_per_host=None):
+        """
+        Sends independent requests concurrently
+        Args:
+            request_specs: List of dicts with the arguments of make_api_request, E.g:
+                           [{"method": self.METHOD_GET, "url": url, "headers": headers, "params": {"ChannelId": 1}}]
+            max_workers (int): Maximum number of requests in flight
+            max_per_host (int): Maximum number of requests in flight to the same host
+        Returns:
+            list with the response of make_api_request for every request, in the same order as request_specs
+        """
+        return BatchRequestExecutor(self.make_api_request, max_workers=max_workers,
+                                    max_per_host=max_per_host).run(request_specs)
+
+    @staticmethod
+    def _use_pooled_connections(rest_api, url):
+        """
+        Mounts the shared keep-alive connection pool of the host on the requests session of the scriptless REST client
+        (when it exposes one), so its requests reuse the connections opened by the other tests
+        """
+        for attribute in ("session", "_session"):
+            session = getattr(rest_api, attribute, None)
+            if isinstance(session, requests.Session):
+                HttpSessionPool.mount(session, url)
+                ApiCassette.capture_responses(session)
+                return
+
+    @staticmethod
+    def _to_cassette_record(response):
+        """
+        Returns the cassette record of a make_api_request response: the status code and body text of the HTTP response,
+        and the scriptless response dict as pairs, so its integer keys survive the JSON file
+        """
+        raw_response = ApiCassette.pop_captured_response()
+        if raw_response is not None:
+            status_code, text = raw_response.status_code, raw_response.text
+        else:
+            # The REST client exposes no session, the body is rebuilt from the scriptless response dict
+            status_code = response.get("status_code", 200)
+            body = response[0] if 0 in response else {key: value for key, value in response.items()
+                                                      if key not in ("status_code", "headers")}
+            text = json.dumps(body, default=str)
+        return {"status_code": status_code, "text": text,
+                "response": [[key, value] for key, value in response.items()]}
 
     def validate_response_status_code(self, response, expected_status_code):
         self.custom_base.log_message(
@@ -4,31 +4,46 @@ import xml.etree.ElementTree as ET
 import json
 import pathlib
 from shutil import copyfile
-import tempfile
 from robot.utils.asserts import fail
 import threading
 
-from Tests.custom_methods.SystemActionExecutor import SystemActionExecutor
+from Tests.Utils.ConfigRegistry import ConfigRegistry
+from Tests.Utils.LazyImport import LazyImport
+from Tests.Utils.LabelLookup import LabelLookup
+from Tests.Utils.RunWorkspace import RunWorkspace
+from Tests.Utils.StateStore import StateStore
+from Tests.Utils.TestDependencyGraph import TestDependencyGraph
+
+# Loads pygetwindow, dotenv and the scriptless core, only needed to read credentials
+SystemActionExecutor = LazyImport("Tests.custom_methods.SystemActionExecutor", "SystemActionExecutor")
 
 
 class CommonMethods:
     _file_lock = threading.Lock()
+    # State files of the execution, kept in its RunWorkspace directory
+    _TEMP_FILE = "temp.json"
+    _TEMP_ENGAGEMENTS_FILE = "temp_engagements.json"
+    _TEMP_TEST_INFORMATION_FILE = "temp_test_information.json"
+    _test_dependency_graph = None
+
+    @staticmethod
+    def _get_state_file(name):
+        return RunWorkspace.get_instance().get_path(name)
 
     @staticmethod
     def update_engagement_information_in_config(engagement_type, engagement_property, value_to_update):
-        config_file = CommonMethods.read_json_file("Tests/filesForTests/temp_engagements.json")
-        config_file[engagement_type.strip()][engagement_property] = str(value_to_update)
-        CommonMethods.write_json_file("Tests/filesForTests/temp_engagements.json", config_file)
+        StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_ENGAGEMENTS_FILE)).update(
+            engagement_type.strip(),
+            lambda engagement: CommonMethods._set_property(engagement, engagement_type.strip(),
+                                                           engagement_property, str(value_to_update)))
 
     @staticmethod
     def get_engagements_information():
-        config_file = CommonMethods.read_json_file("Tests/filesForTests/temp_engagements.json")
-        return config_file
+        return StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_ENGAGEMENTS_FILE)).get_all()
 
     @staticmethod
     def get_engagement_information_from_config(engagement_type, engagement_property):
-        config_file = CommonMethods.read_json_file("Tests/filesForTests/temp_engagements.json")
-        return config_file[engagement_type][engagement_property]
+        return StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_ENGAGEMENTS_FILE)).get(engagement_type)[engagement_property]
 
     @staticmethod
     def set_engagement_information_in_config(engagement_type, engagement_property, value_to_set):
@@ -37,17 +52,15 @@ class CommonMethods:
 
     @staticmethod
     def get_test_status(test_name):
-        tests_config_file = CommonMethods.read_json_file("Tests/filesForTests/temp_test_information.json")
-        test_config = tests_config_file[test_name]
+        test_config = StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_TEST_INFORMATION_FILE)).get(test_name)
         return test_config["status"]
 
     @staticmethod
     def set_test_status(test_name, status):
         global_execution_type = CommonMethods.get_value_in_temp_variable("global_execution_type")
         if (global_execution_type == "testsuite"):
-            tests_config_file = CommonMethods.read_json_file("Tests/filesForTests/temp_test_information.json")
-            tests_config_file[test_name]["status"] = status
-            CommonMethods.write_json_file("Tests/filesForTests/temp_test_information.json", tests_config_file)
+            StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_TEST_INFORMATION_FILE)).update(
+                test_name, lambda test_config: CommonMethods._set_property(test_config, test_name, "status", status))
 
     @staticmethod
     def fail_test_case_if_dependency_not_met(test_name):
@@ -59,32 +72,25 @@ class CommonMethods:
 
     @staticmethod
     def are_test_dependencies_met(test_name):
-        tests_config_file = CommonMethods.read_json_file("Tests/filesForTests/temp_test_information.json")
-        test_config = tests_config_file[test_name]
-        required_flag = True
-        optional_flag = True
-        for required_test_case_id in test_config["requiredForExecution"]:
-            if CommonMethods.get_test_status_by_id(tests_config_file, required_test_case_id) == "RUNNING":
-                required_flag = False
-                break
-        for optional_test_cases_id in test_config["optionals"]:
-            combination_met = False
-            for optional_test_case_id in optional_test_cases_id:
-                teststatusbyid = CommonMethods.get_test_status_by_id(tests_config_file, optional_test_case_id)
-                if (teststatusbyid == "PASSED" or teststatusbyid == "NOT RUNNED"):
-                    combination_met = True
-            if combination_met == False:
-                optional_flag = False
-        if (required_flag == False) or (optional_flag == False):
-            return False
-        return True
+        test_information = StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_TEST_INFORMATION_FILE))
+        return CommonMethods.get_test_dependency_graph().are_dependencies_met(
+            test_name, lambda dependency_name: test_information.get(dependency_name)["status"])
 
     @staticmethod
     def get_test_status_by_id(tests_config_file, test_id):
-        for key, value in tests_config_file.items():
-            if value["id"] == test_id:
-                return value["status"]
-        raise Exception(f"Test with Id {test_id} was not found in the test_information file")
+        test_name = CommonMethods.get_test_dependency_graph().get_name_by_id(test_id)
+        return tests_config_file[test_name]["status"]
+
+    @staticmethod
+    def get_test_dependency_graph():
+        """
+        Returns the dependency graph of temp_test_information.json, built once per execution
+        """
+        with CommonMethods._file_lock:
+            if CommonMethods._test_dependency_graph is None:
+                test_information = StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_TEST_INFORMATION_FILE)).get_all()
+                CommonMethods._test_dependency_graph = TestDependencyGraph(test_information)
+            return CommonMethods._test_dependency_graph
 
     @staticmethod
     def throw_exception(message):
@@ -92,24 +98,7 @@ class CommonMethods:
 
     @staticmethod
     def get_app_env_variable(environment):
-        path_to_app_vars = os.path.join(os.getcwd(), "Tests", "resources", "env", "env.xml")
-        with open(path_to_app_vars) as f:
-            content = f.readlines()
-            content = [x.strip() for x in content]
-        parameters_for_environment = {}
-        correct_environment = False
-        for line in content:
-            if correct_environment == True:
-                if f'</parameters>' in line:
-                    break
-                if 'type="app"' in line:
-                    var_name = line.split(' name="')[1].split('" type=')[0]
-                    var_value = line.split(' value="')[1].split('"/>')[0]
-                    parameters_for_environment[var_name] = var_value
-            if correct_environment == False:
-                if f'<env envname="{environment}">' in line:
-                    correct_environment = True
-        return parameters_for_environment
+        return ConfigRegistry.get_environment_variables(environment)
 
     @staticmethod
     def value_plus_another_value(value1, value2):
@@ -167,15 +156,7 @@ class CommonMethods:
 
     @staticmethod
     def get_variable_value(variable_name):
-        path_to_app_vars = os.path.join(os.getcwd(), "Tests", "resources", "variable", "var.xml")
-        with open(path_to_app_vars) as f:
-            content = f.readlines()
-            content = [x.strip() for x in content]
-        for line in content:
-            if f'name="{variable_name}"' in line:
-                variable_value = line.split(f'value="')[1].split(f'" desc=')[0]
-                return variable_value
-        raise Exception(f"There was not a variable named {variable_name} in the variables file")
+        return ConfigRegistry.get_variable(variable_name)
 
     @staticmethod
     def create_empty_json_file(path):
@@ -186,20 +167,44 @@ class CommonMethods:
 
     @staticmethod
     def set_value_in_temp_variable(variable_name, value):
-        CommonMethods.create_empty_json_file("Tests/filesForTests/temp.json")
-        temp_file = CommonMethods.read_json_file("Tests/filesForTests/temp.json")
-        temp_file[variable_name] = value
-        CommonMethods.write_json_file("Tests/filesForTests/temp.json", temp_file)
+        StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_FILE)).set(variable_name, value, create=True)
         return value
 
     @staticmethod
     def create_temp_config_file(initial_path, final_path):
         copyfile(initial_path, final_path)
+        StateStore.invalidate_file(final_path)
+        if os.path.abspath(final_path) == os.path.abspath(CommonMethods._get_state_file(CommonMethods._TEMP_TEST_INFORMATION_FILE)):
+            CommonMethods._test_dependency_graph = None
+
+    @staticmethod
+    def create_temp_config_files():
+        """
+        Creates temp_engagements.json and temp_test_information.json from their templates in Tests/filesForTests/Config
+        """
+        CommonMethods.create_temp_config_file("Tests/filesForTests/Config/engagements.json",
+                                              CommonMethods._get_state_file(CommonMethods._TEMP_ENGAGEMENTS_FILE))
+        CommonMethods.create_temp_config_file("Tests/filesForTests/Config/test_information.json",
+                                              CommonMethods._get_state_file(CommonMethods._TEMP_TEST_INFORMATION_FILE))
 
     @staticmethod
     def get_value_in_temp_variable(variable_name):
-        temp_file = CommonMethods.read_json_file("Tests/filesForTests/temp.json")
-        return temp_file[variable_name]
+        return StateStore.for_file(CommonMethods._get_state_file(CommonMethods._TEMP_FILE)).get(variable_name)
+
+    @staticmethod
+    def flush_temp_files():
+        """
+        Writes the pending changes of the temp state files to disk.
+        Call it before starting another process that reads them (E.g: the robot execution launched by the runner)
+        """
+        StateStore.flush_all()
+
+    @staticmethod
+    def _set_property(config, config_name, property_name, value):
+        if config is None:
+            raise KeyError(config_name)
+        config[property_name] = value
+        return config
 
     @staticmethod
     def return_as_local_variable(variable_value):
@@ -260,12 +265,13 @@ class CommonMethods:
 
         try:
             original_file_path = "Tests\\filesForTests\\Config\\engagements.json"
-            temp_file_path = tempfile.gettempdir() + '\\'
-            temp_file = temp_file_path + filename + ".json"
+            workspace = RunWorkspace.get_instance()
+            temp_file = workspace.get_path(filename + ".json")
             if os.path.exists(temp_file):
                 print(f'[INFO] the file {filename}.json already existed')
             else:
-                copyfile(original_file_path, temp_file)
+                workspace.copy_template(original_file_path, filename + ".json")
+                StateStore.invalidate_file(temp_file)
                 CommonMethods._fill_json_config_file(filename)
         except:
             fail(f"The File {filename} doesn't be created, check the original file: {original_file_path} ")
@@ -279,15 +285,15 @@ class CommonMethods:
         engagement_property (str): engagement property that will be updated
         value_to_set (str): New value to be set in engagement_property
         """
+        temp_file_path = RunWorkspace.get_instance().get_path(filename + ".json")
         try:
-            with CommonMethods._file_lock:
-                temp_file_path = tempfile.gettempdir() + '\\'
-                config_file = CommonMethods.read_json_file(temp_file_path + filename + ".json")
-                config_file[engagement_type.strip()][engagement_property] = str(value_to_set)
-                CommonMethods.write_json_file(temp_file_path + filename + ".json", config_file)
+            StateStore.for_file(temp_file_path).update(
+                engagement_type.strip(),
+                lambda engagement: CommonMethods._set_property(engagement, engagement_type.strip(),
+                                                               engagement_property, str(value_to_set)))
         except Exception as e:
             fail(
-                f"The File {filename} couldn't be updated. Check File: {temp_file_path + filename}.json Error: {str(e)}")
+                f"The File {filename} couldn't be updated. Check File: {temp_file_path} Error: {str(e)}")
 
     @staticmethod
     def get_engagement_information_from_suite_config(filename, engagement_type, engagement_property):
@@ -299,28 +305,27 @@ class CommonMethods:
         value_to_set (str): New value to be seted in engagement_property
 
         """
+        temp_file_path = RunWorkspace.get_instance().get_path(filename + ".json")
         try:
-            temp_file_path = tempfile.gettempdir() + '\\' + filename + ".json"
-            config_file = CommonMethods.read_json_file(temp_file_path)
-            return config_file[engagement_type][engagement_property]
+            return StateStore.for_file(temp_file_path).get(engagement_type)[engagement_property]
         except:
             fail(f"The File {filename} dosen't exist, check the  path of: {temp_file_path}, or check the DataSheet ")
 
     @staticmethod
     def _delete_temp_files(prefix):
         """
-        This method remove all the files that have the "prefix" into the TEMP folder
+        This method remove all the files that have the "prefix" into the run workspace
         prefix(str): Prefix of the files that you need to be removed
         """
-        files = os.listdir(tempfile.gettempdir())
+        workspace = RunWorkspace.get_instance()
 
-        for file in files:
-            if file.startswith(prefix):
-                try:
-                    os.remove(tempfile.gettempdir() + "\\" + file)
-                    print(f"[INFO] {file}  Removed")
-                except:
-                    print(f"[INFO] {file} Doesn't be removed")
+        for file in workspace.get_files(prefix):
+            try:
+                StateStore.invalidate_file(workspace.get_path(file))
+                workspace.remove(file)
+                print(f"[INFO] {file}  Removed")
+            except:
+                print(f"[INFO] {file} Doesn't be removed")
 
     @staticmethod
     def _initialization_of_temp_engagement_information_json_file(temp_file_name, global_Id, local_Id):
@@ -415,14 +420,8 @@ class CommonMethods:
         :return          :  no returntype
         """
 
-        if os.path.exists("Tests/filesForTests/Config/channel_language_list.json"):
-            label_info = CommonMethods.read_json_file("Tests/filesForTests/Config/channel_language_list.json")
-
-            if label_info[label] == {}:
-                CommonMethods.create_channel_language_dictionary(label=label, response=response, label_info=label_info)
-        else:
-            label_info = {"channel": {}, "language": {}, "service_line": {}, "service_org": {}, "module": {}, "user": {}}
-            CommonMethods.create_empty_json_file("Tests/filesForTests/Config/channel_language_list.json")
+        if not LabelLookup.has_labels(label):
+            label_info = {name: {} for name in LabelLookup.LABELS}
             CommonMethods.create_channel_language_dictionary(label=label, response=response, label_info=label_info)
 
     @staticmethod
@@ -453,7 +452,7 @@ class CommonMethods:
                 var[index["id"]] = index["name"]
 
         label_info[label] = var
-        CommonMethods.write_json_file("Tests/filesForTests/Config/channel_language_list.json", label_info)
+        LabelLookup.set_labels(label, var)
 
     @staticmethod
     def get_channel_language_name(channel: str, language: str, service_line: str = '') -> str:
@@ -467,28 +466,42 @@ class CommonMethods:
         :return         : string which has channel language and service line names
         """
 
-        label_info = CommonMethods.read_json_file("Tests/filesForTests/Config/channel_language_list.json")
-        channel_name = label_info["channel"].get(channel)
-        language_name = label_info["language"].get(language)
-        service_line_name = label_info["service_line"].get(service_line)
+        channel_name = LabelLookup.get_name("channel", channel)
+        language_name = LabelLookup.get_name("language", language)
+        service_line_name = LabelLookup.get_name("service_line", service_line)
         response = f"[Channel: {channel_name}][Language: {language_name}][Service line: {service_line_name}]"
         return response
 
     @staticmethod
     def get_labels_from_config(label: str, label_name: str):
-        if os.path.exists("Tests/filesForTests/Config/channel_language_list.json"):
-            config_file = CommonMethods.read_json_file("Tests/filesForTests/Config/channel_language_list.json")
-            content = config_file[label]
+        if not LabelLookup.has_labels(label):
+            return None
 
-            if label=="user" and content!={}:
-                return content[label_name]
+        label_id = LabelLookup.get_id(label, label_name)
+        if label_id is None:
+            if label == "user":
+                raise KeyError(label_name)
+            raise IndexError(f"{label_name} was not found in the {label} labels")
+        return label_id
 
-            if content == {}:
-                return None
+    @staticmethod
+    def get_labels_ids_from_config(label: str, label_names: list) -> list:
+        """
+        Gets the ids of several names of a label at once, E.g: every language of a localization matrix
 
-            key = [id for id, value in content.items() if value == label_name]
-            label_id = key[0]
-            return label_id
+        :param label       : channel, language, service_line, service_org, module or user
+        :param label_names : names to translate
+        :return            : list with the id of every name, None for the names not in the file
+        """
+        return LabelLookup.get_ids(label, label_names)
 
-        else:
-            return None
\ No newline at end of file
+    @staticmethod
+    def get_labels_names_from_config(label: str, label_ids: list) -> list:
+        """
+        Gets the names of several ids of a label at once
+
+        :param label     : channel, language, service_line, service_org, module or user
+        :param label_ids : ids to translate
+        :return          : list with the name of every id, None for the ids not in the file
+        """
+        return LabelLookup.get_names(label, label_ids)
@@ -16,6 +16,8 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import ElementNotVisibleException, ElementNotSelectableException,StaleElementReferenceException, TimeoutException
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
+from Tests.Utils.DomQuery import DomQuery
+from Tests.Utils.WaitEngine import WaitEngine, WaitTimeoutError
 
 
 class CommonUtils(CustomBase):
@@ -397,13 +399,24 @@ class CommonUtils(CustomBase):
     driver = self.get_webdriver()
     CommonUtils().click_element_and_wait(dropdown_locator, None, time_out)
     element_list = CommonUtils()._get_web_element(driver, list_locator,time_out)
-    optionElements =  CommonUtils()._get_web_elements(driver,options_locators,time_out)
-    for optionElement in optionElements:
-      extendedSeleniumLibrary.wait_for_element_to_be_visible(optionElement)
-      text = extendedSeleniumLibrary.get_element_text(optionElement)
-      if text == option:
-        optionElement.click()
-        return
+    options_strategy = CommonUtils()._get_locator_strategy(options_locators)
+
+    def find_visible_option():
+      # The options are read again on every check, hidden or fading in options have no text until they are shown.
+      # Their texts are read in one round trip
+      optionElements = driver.find_elements(options_strategy['locator_type'], options_strategy['element_locator'])
+      for optionElement, option_data in zip(optionElements, DomQuery.describe(driver, optionElements)):
+        if option_data["text"] == option:
+          return optionElement
+      return None
+
+    try:
+      optionElement = WaitEngine.until(find_visible_option, int(time_out),
+                                       ignored_exceptions=(StaleElementReferenceException,))
+    except WaitTimeoutError:
+      fail(f"The option {option} was not visible in the dropdown {dropdown_locator} after {time_out} seconds")
+    extendedSeleniumLibrary.wait_for_element_to_be_visible(optionElement)
+    optionElement.click()
 
   def find_matching_element(self, list_locator: str, locator_to_find: str ,value_to_search: str, time_out: str) -> WebElement:
     """
@@ -418,21 +431,20 @@ class CommonUtils(CustomBase):
     Returns:
         element (WebElement): Found element matching the criteria or None if not found
     """
-    extendedSeleniumLibrary = ExtendedSeleniumLibrary()
     driver = self.get_webdriver()
     element_list = CommonUtils()._get_web_elements(driver,list_locator,time_out)   
-    sub_element_locator = CommonUtils()._get_locator_strategy(locator_to_find)
     
     if element_list is not  None:      
-      for element in element_list:
-        try:
-          sub_element = element.find_element(sub_element_locator['locator_type'],f".{sub_element_locator['element_locator']}")
-          text = extendedSeleniumLibrary.get_element_text(sub_element)
-          self.log_message(f'webelement text: {text}')
-          if value_to_search in text:
+      try:
+        # The sub-elements of the whole list are found and read in one round trip
+        labels = DomQuery.describe(driver, element_list, sub_locator=self._get_relative_locator(locator_to_find))
+      except Exception:
+        return None
+      for element, label in zip(element_list, labels):
+        if label["found"]:
+          self.log_message(f'webelement text: {label["text"]}')
+          if value_to_search in label["text"]:
             return element
-        except:
-          pass
     return None
 
     
@@ -468,11 +480,8 @@ class CommonUtils(CustomBase):
         Returns:
             str: Text of the sub-element if found, None otherwise.
     """
-    try:
-      sub_element = self._get_sub_web_element(webelement, sub_element_locator)
-    except:
-      self.log_error_message(f'Subelement {sub_element_locator} is not in the web element {webelement}')
-    return sub_element.text if sub_element is not None else None
+    sub_element = self._describe_sub_web_element(webelement, sub_element_locator)
+    return sub_element["text"] if sub_element is not None else None
 
 
   def is_webElement_displayed(self, webelement: WebElement, sub_element_locator: str) -> bool:
@@ -484,11 +493,39 @@ class CommonUtils(CustomBase):
     Returns:
           bool: True if the sub-element is displayed, False otherwise.
     """
+    sub_element = self._describe_sub_web_element(webelement, sub_element_locator)
+    return sub_element["visible"] if sub_element is not None else False
+
+
+  def _describe_sub_web_element(self, webelement: WebElement, sub_element_locator: str) -> dict:
+    """
+    Finds a sub-element within the given web element and reads its text and visibility in one round trip.
+    Args:
+         webelement (WebElement): Parent web element to find the sub-element within.
+         sub_element_locator (str): Locator to find the desired sub-element.
+
+    Returns:
+         dict: "text" and "visible" of the sub-element, None if it is not found.
+    """
     try:
-      sub_element = self._get_sub_web_element(webelement, sub_element_locator)
-    except:
-      self.log_error_message(f'Subelement {sub_element_locator} is not in the web element {webelement}')
-    return sub_element.is_displayed() if sub_element is not None else False
+      sub_element = DomQuery.describe(webelement.parent, [webelement],
+                                      sub_locator=self._get_relative_locator(sub_element_locator))[0]
+      if sub_element["found"]:
+        return sub_element
+    except Exception:
+      pass
+    self.log_error_message(f'Subelement {sub_element_locator} is not in the web element {webelement}')
+    return None
+
+
+  def _get_relative_locator(self, locator: str) -> str:
+    """
+    Returns the locator relative to a parent element, as _get_sub_web_element uses it ("xpath://span" -> "xpath:.//span")
+    """
+    locator_startergy = CommonUtils()._get_locator_strategy(locator)
+    if locator_startergy['locator_type'] == 'xpath':
+      return f"xpath:.{locator_startergy['element_locator']}"
+    return locator
 
 
   def _get_sub_web_element(self, webelement: WebElement, sub_element_locator : str) -> WebElement:
@@ -8,11 +8,25 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 import os
 from Tests.custom_methods.CommonMethods import CommonMethods as CM
+from Tests.Utils.BrowserSessionPool import BrowserSessionPool
+from Tests.Utils.LazyImport import LazyImport
+from Tests.Utils.WaitEngine import WaitEngine
+from Tests.Utils.tokens.AuthSnapshotStore import AuthSnapshotStore
 import datetime
 import urllib
+import uuid
+
+# Only needed to launch pooled browsers, imported on first use
+BuiltIn = LazyImport("robot.libraries.BuiltIn", "BuiltIn")
+SM = LazyImport("Tests.custom_methods.SeleniumMethods", "SeleniumMethods")
+Data_handler = LazyImport("scriptless.Core.framework.data_handler", "Data_handler")
 
 class LogInMethods:
 
+    # Keyword and options used by cg_login (Tests/app_modules/login.xml) to launch the browser
+    LAUNCH_BROWSER_KEYWORD = "Launch Browser"
+    LAUNCH_BROWSER_CHROME_OPTIONS = "add_experimental_option('prefs', {'profile.cookie_controls_mode':0})"
+
     @staticmethod
     def login_authPopup(username, password):
         if (LogInMethods.try_to_focus_on_window("Windows Security", 20) == False):
@@ -53,6 +67,10 @@ class LogInMethods:
     @staticmethod
     def SSO_login(driver, locator, timeout, username, password, retries):
         locator = locator.replace("xpath:", "").replace("\n", "")
+        if not LogInMethods.try_to_focus_on_window("Windows Security", 0):
+            webelement = LogInMethods._login_with_auth_snapshot(driver, username, locator, timeout)
+            if webelement is not None:
+                return webelement
         original_timeout_int = int(timeout)
         timeout_int = int(timeout)
         retries = int(retries)
@@ -81,6 +99,7 @@ class LogInMethods:
         if retries < 0:
             raise Exception("The login window was tried to be used many times, but it keeps appearring (maybe the credentials are expired)")
         if timeout_int == -1000:
+            LogInMethods._save_auth_snapshot_quietly(driver, username)
             return driver.find_element(By.XPATH, locator)
         raise Exception(f'Waited for {original_timeout_int} seconds, but neither the element with locator {locator} nor the windows security info were found.')
 
@@ -212,14 +231,8 @@ class LogInMethods:
     
     @staticmethod
     def try_to_focus_on_window(window_title, timeout):
-        while (timeout >= 0):
-            try:
-                ait.control_focus(window_title, "")
-                return True
-            except:
-                sleep(1)
-                timeout -= 1
-        return False
+        return WaitEngine.until_or_default(lambda: ait.control_focus(window_title, "") or True, timeout, default=False,
+                                           ignored_exceptions=(Exception,))
 
     @staticmethod
     def get_agent_id():
@@ -264,9 +277,13 @@ class LogInMethods:
         ait.win_kill(window_name)
 
     @staticmethod
-    def select_account_if_not_logged_or_continue_if_logged(driver, locator_expected_element_while_not_logged, locator_expected_element_while_logged, timeout):
+    def select_account_if_not_logged_or_continue_if_logged(driver, locator_expected_element_while_not_logged, locator_expected_element_while_logged, timeout, credential_user_name='CanvasAutomationUser1'):
         locator_expected_element_while_not_logged = locator_expected_element_while_not_logged.replace("xpath:", "").replace("\n", "")
         locator_expected_element_while_logged = locator_expected_element_while_logged.replace("xpath:", "").replace("\n", "")
+        webelement = LogInMethods._login_with_auth_snapshot(driver, credential_user_name,
+                                                            locator_expected_element_while_logged, timeout)
+        if webelement is not None:
+            return webelement
         original_timeout_int = int(timeout)
         timeout_int = int(timeout)
         while timeout_int >= 0:
@@ -292,6 +309,7 @@ class LogInMethods:
             WebDriverWait(driver, original_timeout_int).until(
                         EC.visibility_of_element_located((By.XPATH, locator_expected_element_while_logged))
             )
+            LogInMethods._save_auth_snapshot_quietly(driver, credential_user_name)
             return driver.find_element(By.XPATH, locator_expected_element_while_logged)      
         if timeout_int == -2000:
             return driver.find_element(By.XPATH, locator_expected_element_while_logged)
@@ -340,6 +358,126 @@ class LogInMethods:
     
     @staticmethod
     def delete_cache(driver):
+        """
+        Clears the cookies, cache and storage of the browser through CDP, or through the settings page on browsers
+        without CDP
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return LogInMethods._delete_cache_through_settings(driver)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        LogInMethods._clear_origin_data(driver, "all")
+
+    @staticmethod
+    def acquire_browser_session(url, credential_user_name='CanvasAutomationUser1'):
+        """
+        Returns a browser logged in with the user and opened on url, reusing a warm session of the worker if there is
+        one (see BrowserSessionPool). New browsers are launched with the Launch Browser keyword of the Selenium
+        library, like cg_login. Give it back with Release Browser Session at the end of the test instead of closing it
+        """
+        pool = BrowserSessionPool.get_instance()
+        driver = pool.acquire((url, credential_user_name),
+                              lambda: LogInMethods._launch_logged_in_browser(url, credential_user_name))
+        if driver.current_url != url:
+            driver.get(url)
+        return driver
+
+    @staticmethod
+    def release_browser_session(driver, test_failed='False'):
+        """
+        Gives back a browser of Acquire Browser Session. The browser of a failed test is closed instead of reused
+        """
+        if str(test_failed).lower() == 'true':
+            BrowserSessionPool.get_instance().discard(driver)
+        else:
+            BrowserSessionPool.get_instance().release(driver, LogInMethods._reset_browser_session)
+
+    @staticmethod
+    def _launch_logged_in_browser(url, credential_user_name):
+        timeout = Data_handler().get_env_var_value("veryLongTimeOut")
+        # Every pooled browser gets its own alias, so the library does not replace it when another one is launched
+        driver = BuiltIn().run_keyword(LogInMethods.LAUNCH_BROWSER_KEYWORD, url, f"pooled_{uuid.uuid4().hex[:8]}",
+                                       LogInMethods.LAUNCH_BROWSER_CHROME_OPTIONS)
+        try:
+            if AuthSnapshotStore.get_instance().restore(driver, credential_user_name, url):
+                return driver
+            credential = CM.get_automation_user_info_from_credential_manager(credential_user_name)
+            webelement = SM.wait_for_element_to_be_clickeable_by_xpath(driver, '//input[@type="email"]', timeout)
+            SM.input_text_on_webelement(webelement, credential['userName'])
+            webelement = SM.wait_for_element_to_be_clickeable_by_xpath(driver, '//input[@type="submit"]', timeout)
+            SM.click_webelement(webelement)
+            LogInMethods.authenticate_incognito_user(driver, credential_user_name)
+            CM.wait_page_to_load(driver)
+            LogInMethods._save_auth_snapshot_quietly(driver, credential_user_name)
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+
+    @staticmethod
+    def _reset_browser_session(driver):
+        """
+        Removes the state left by a test: other tabs, and the cookies, storage and cache of the application. The SSO
+        cookies of the identity provider are kept, so the next test is logged in without the login flow
+        """
+        SM.close_all_other_tabs(driver)
+        LogInMethods._clear_origin_data(driver, "cookies,local_storage,session_storage,indexeddb,cache_storage,"
+                                                "service_workers")
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.get("about:blank")
+
+    @staticmethod
+    def restore_auth_snapshot(driver, url, credential_user_name='CanvasAutomationUser1'):
+        """
+        Logs in a new browser with the auth snapshot of the user (see AuthSnapshotStore) and opens url
+        Returns:
+            bool: False if there is no valid snapshot, the SSO login is needed
+        """
+        return AuthSnapshotStore.get_instance().restore(driver, credential_user_name, url)
+
+    @staticmethod
+    def save_auth_snapshot(driver, credential_user_name='CanvasAutomationUser1'):
+        """
+        Saves the auth snapshot of a browser logged in with the user, call it after the SSO login
+        """
+        return AuthSnapshotStore.get_instance().capture(driver, credential_user_name)
+
+    @staticmethod
+    def _login_with_auth_snapshot(driver, credential_user_name, locator_expected_element_while_logged, timeout):
+        """
+        Logs in the browser with the auth snapshot of the user instead of the SSO flow, opening the application of the
+        current environment
+        Returns:
+            WebElement: the element expected while logged, None if the SSO flow is needed
+        """
+        try:
+            env_variables = CM.get_app_env_variable(CM.get_value_in_temp_variable("Environment"))
+            if not AuthSnapshotStore.get_instance().restore(driver, credential_user_name, env_variables["CanvasURL"]):
+                return None
+            return WebDriverWait(driver, int(timeout)).until(
+                EC.visibility_of_element_located((By.XPATH, locator_expected_element_while_logged)))
+        except Exception as error:
+            print(f"[WARN] The browser could not be logged in with the auth snapshot of {credential_user_name}, "
+                  f"using the SSO login: {error}")
+            AuthSnapshotStore.get_instance().invalidate(credential_user_name)
+            return None
+
+    @staticmethod
+    def _save_auth_snapshot_quietly(driver, credential_user_name):
+        # A snapshot that cannot be saved only means the next browser goes through the SSO login
+        try:
+            AuthSnapshotStore.get_instance().capture(driver, credential_user_name)
+        except Exception as error:
+            print(f"[WARN] The auth snapshot of {credential_user_name} could not be saved: {error}")
+
+    @staticmethod
+    def _clear_origin_data(driver, storage_types):
+        origin = driver.execute_script("return window.location.origin;")
+        if origin and origin != "null":
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": storage_types})
+
+    @staticmethod
+    def _delete_cache_through_settings(driver):
         driver.execute_script("window.open('');")
         sleep(2)
         driver.switch_to.window(driver.window_handles[-1])
@@ -370,6 +508,6 @@ class LogInMethods:
         url = driver.current_url
         domain_start = url.find("//") + 2
         new_url = url[:domain_start] + encoded_username + ":" + encoded_password + "@" + url[domain_start:]
-        sleep(5)
+        WaitEngine.until_or_default(lambda: driver.execute_script("return document.readyState") == "complete", 5)
         driver.get(new_url)
         return new_url
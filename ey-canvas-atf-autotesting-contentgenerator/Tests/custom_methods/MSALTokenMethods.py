@@ -1,5 +1,4 @@
 from Tests.custom_methods.CommonMethods import CommonMethods as CM
-from Tests.custom_methods.TokenMethods import TokenMethods as TM
 from Tests.filesForTests.Config.MSALTokenEnvironmentProperties import MSALTokenEnvironmentProperties as EnvironmentProperties
 
 from msal import PublicClientApplication
@@ -44,13 +43,7 @@ class MSALTokenMethods:
     def get_token(resource_name, token_name, user_name_token: str='CanvasAutomationUser1'):
         scopes_list = EnvironmentProperties.get_scopes_list(resource_name, user_name_token)
         logger.debug(f"trying to get the token from MSAL with the following scopes: {scopes_list}")
-        token = TM.get_token(user_name_token)
-
-        if token == None:
-            token = MSALTokenMethods._get_token(scopes_list)
-            TM._update_token_on_file(token_name=TM.TOKEN_NAME_UNIVERSAL, token_value=token, user_name_token=user_name_token)
-            return token
-        else:
-            return token
+        # Reuse and expiration of the token are handled by the TokenCache of the caller
+        return MSALTokenMethods._get_token(scopes_list)
 
 
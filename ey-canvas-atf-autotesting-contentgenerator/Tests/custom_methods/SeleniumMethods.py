@@ -1,19 +1,19 @@
 from scriptless.Core.library.common.ExtendedSeleniumLibrary import ExtendedSeleniumLibrary
 from scriptless.Core.library.common.CustomBase import CustomBase
 from selenium.webdriver.common.by import By
-import time
 from selenium.common.exceptions import NoSuchElementException, ElementNotVisibleException, \
     ElementNotSelectableException, StaleElementReferenceException
 from scriptless.Core.framework.page_object import PageObject
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import os
-from time import sleep
 from scriptless.Core.framework.data_handler import Data_handler
 from Tests.custom_methods.CommonMethods import CommonMethods as CM
+from Tests.Utils.DomQuery import DomQuery
+from Tests.Utils.NetworkWatcher import NetworkWatcher
+from Tests.Utils.WaitEngine import Condition, WaitEngine
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from robot.utils.asserts import assert_equal,fail
-import re
 
 class SeleniumMethods(CustomBase):
 
@@ -50,27 +50,20 @@ class SeleniumMethods(CustomBase):
     def wait_for_a_certain_amount_of_elements(driver, locator, amount_expected, timeout):
         #Trimming the locators to making them strings
         locator = locator.replace("xpath:", "").replace("\n", "")
-        timeout_to_use = int(timeout)
-        while (timeout_to_use>=0):
-            webelements = driver.find_elements(By.XPATH, locator)
-            if (len(webelements) == int(amount_expected)):
-                return True
-            timeout_to_use = timeout_to_use - 1
-            time.sleep(1)
-        raise Exception(f"After {timeout_to_use} seconds, there were not {amount_expected} elements for the locator xpath:{locator}")
+        WaitEngine.until(Condition.count(lambda: driver.find_elements(By.XPATH, locator), expected=int(amount_expected)),
+                         int(timeout),
+                         f"After {timeout} seconds, there were not {amount_expected} elements for the locator xpath:{locator}")
+        return True
 
     @staticmethod
     def wait_for_more_than_certain_amount_of_elements(driver, locator, amount_of_expected_elements, timeout):
         #Trimming the locators to making them strings
         locator = locator.replace("xpath:", "").replace("\n", "")
-        timeout_to_use = int(timeout)
-        while (timeout_to_use>=0):
-            webelements = driver.find_elements(By.XPATH, locator)
-            if (len(webelements) > int(amount_of_expected_elements)):
-                return True
-            timeout_to_use = timeout_to_use - 1
-            time.sleep(1)
-        raise Exception(f"After {timeout_to_use} seconds, there were not more than {amount_of_expected_elements} elements for the locator xpath:{locator}")
+        WaitEngine.until(Condition.count(lambda: driver.find_elements(By.XPATH, locator),
+                                         minimum=int(amount_of_expected_elements) + 1),
+                         int(timeout),
+                         f"After {timeout} seconds, there were not more than {amount_of_expected_elements} elements for the locator xpath:{locator}")
+        return True
 
 
     @staticmethod
@@ -123,50 +116,25 @@ class SeleniumMethods(CustomBase):
         #Trimming the locators to making them strings
         locator = locator.replace("xpath:", "").replace("\n", "")
         #Method logic
-        webelements_list = driver.find_elements(By.XPATH, locator)
-        return len(webelements_list)
+        return DomQuery.count(driver, locator)
 
     @staticmethod
     def wait_for_visibility_of_one_of_two_elements(driver, locator_first_element, locator_second_item, timeout):
         locator_first_element = locator_first_element.replace("xpath:", "").replace("\n", "")
         locator_second_item = locator_second_item.replace("xpath:", "").replace("\n", "")
-        timeout_int = int(timeout)
-        while timeout_int >= 0:
-            try:
-                WebDriverWait(driver, 2).until(
-                    EC.presence_of_element_located((By.XPATH, locator_first_element))
-                )
-                timeout_int = -1000
-            except Exception:
-                try:
-                    WebDriverWait(driver, 2).until(
-                        EC.presence_of_element_located((By.XPATH, locator_second_item))
-                    )
-                    timeout_int = -2000
-                except Exception:
-                    timeout_int = timeout_int - 4
-        if timeout_int == -1000:
-            return driver.find_element(By.XPATH, locator_first_element)      
-        if timeout_int == -2000:
-            return driver.find_element(By.XPATH, locator_second_item)
-        raise Exception(f'Waited for {timeout} seconds, but neither the element with locator {locator_first_element} not the element with locator {locator_second_item} were found.')
+        locators = [locator_first_element, locator_second_item]
+        index, _ = WaitEngine.until(
+            SeleniumMethods._presence_of_any(driver, locators), int(timeout),
+            f'Waited for {timeout} seconds, but neither the element with locator {locator_first_element} not the element with locator {locator_second_item} were found.')
+        return driver.find_element(By.XPATH, locators[index])
 
 
     @staticmethod
     def wait_for_visibility_of_multiple_elements(driver, locators, timeout):
         locators = locators.split("|")
-        timeout_int = int(timeout)
-        while timeout_int >= 0:
-            for index, locator in enumerate(locators):
-                locator = locator.replace("xpath:", "").replace("\n", "")
-                try:
-                    WebDriverWait(driver, 2).until(
-                        EC.presence_of_element_located((By.XPATH, locator))
-                    )
-                    return (index+1)
-                except:
-                    timeout_int = timeout_int - 2
-        raise Exception(f'Waited for {timeout} seconds, but no element in the locators {locators} were found.')
+        index, _ = WaitEngine.until(SeleniumMethods._presence_of_any(driver, locators), int(timeout),
+                                    f'Waited for {timeout} seconds, but no element in the locators {locators} were found.')
+        return (index+1)
 
     @staticmethod
     def wait_for_visibility_of_multiple_elements_with_status(driver, locators, timeout):
@@ -175,74 +143,54 @@ class SeleniumMethods(CustomBase):
             "element_index": 0
         }
         locators = locators.split("|")
-        timeout_int = int(timeout)
-        while timeout_int >= 0:
-            for index, locator in enumerate(locators):
-                locator = locator.replace("xpath:", "").replace("\n", "")
-                try:
-                    WebDriverWait(driver, 2).until(
-                        EC.presence_of_element_located((By.XPATH, locator))
-                    )
-                    return_dict["status"] = "PASS"
-                    return_dict["element_index"] = index+1
-                    return return_dict
-                except:
-                    timeout_int = timeout_int - 2
+        located = WaitEngine.until_or_default(SeleniumMethods._presence_of_any(driver, locators), int(timeout))
+        if located:
+            return_dict["status"] = "PASS"
+            return_dict["element_index"] = located[0]+1
         return return_dict
 
+    @staticmethod
+    def _presence_of_any(driver, locators):
+        """
+        Condition met when an element of one of the locators is present, the first locator found wins.
+        All the locators are checked in a single round trip
+        """
+        locators = [locator.replace("xpath:", "").replace("\n", "") for locator in locators]
+        def check():
+            index = DomQuery.first_present(driver, locators)
+            return (index, True) if index >= 0 else None
+        return Condition(check, f"presence of any of {locators}")
+
     @staticmethod
     def click_element_until_condition_is_met(driver, locator_element_to_click, locator_element_to_complete, timeout, time_between_clicks):
         locator_element_to_click = locator_element_to_click.replace("xpath:", "").replace("\n", "")
         locator_element_to_complete = locator_element_to_complete.replace("xpath:", "").replace("\n", "")
-        time_between_clicks_int = int(time_between_clicks)
-        timeout_int = int(timeout)
-        while timeout_int >= 0:
-            driver.find_element(By.XPATH, locator_element_to_click).click()
-            time.sleep(time_between_clicks_int)
-            try:
-                driver.find_element(By.XPATH, locator_element_to_complete)
-                timeout_int = -1000
-            except NoSuchElementException as e:
-                timeout_int = timeout_int - time_between_clicks_int
-        if timeout_int != -1000:
-            raise Exception(f"The button {locator_element_to_click} was clicked multiple times but the element {locator_element_to_complete} was never found")
+        WaitEngine.repeat_until(lambda: driver.find_element(By.XPATH, locator_element_to_click).click(),
+                                lambda: driver.find_elements(By.XPATH, locator_element_to_complete),
+                                int(timeout), int(time_between_clicks),
+                                f"The button {locator_element_to_click} was clicked multiple times but the element {locator_element_to_complete} was never found")
     
     @staticmethod
     def javascript_click_element_until_condition_is_met(driver, locator_element_to_click, locator_element_to_complete, timeout, time_between_clicks):
         locator_element_to_click = locator_element_to_click.replace("xpath:", "").replace("\n", "").replace("\"", "\'")
         locator_element_to_complete = locator_element_to_complete.replace("xpath:", "").replace("\n", "")
-        time_between_clicks_int = int(time_between_clicks)
-        timeout_int = int(timeout)
-        while timeout_int >= 0:
-            javaScript = f"document.evaluate(\"{locator_element_to_click}\", document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue.click();"           
-            driver.execute_script(javaScript)
-            time.sleep(time_between_clicks_int)
-            try:
-                driver.find_element(By.XPATH, locator_element_to_complete)
-                timeout_int = -1000
-            except NoSuchElementException as e:
-                timeout_int = timeout_int - time_between_clicks_int
-        if timeout_int != -1000:
-            raise Exception(f"The button {locator_element_to_click} was clicked multiple times but the element {locator_element_to_complete} was never found")
+        javaScript = f"document.evaluate(\"{locator_element_to_click}\", document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue.click();"
+        WaitEngine.repeat_until(lambda: driver.execute_script(javaScript),
+                                lambda: driver.find_elements(By.XPATH, locator_element_to_complete),
+                                int(timeout), int(time_between_clicks),
+                                f"The button {locator_element_to_click} was clicked multiple times but the element {locator_element_to_complete} was never found")
 
     @staticmethod
     def click_element_until_invisibility_of_element(driver, locator_element_to_click, timeout, time_between_clicks):
         locator_element_to_click = locator_element_to_click.replace("xpath:", "").replace("\n", "")
-        time_between_clicks_int = int(time_between_clicks)
-        timeout_int = int(timeout)
-        while timeout_int >= 0:
+        def click():
             try:
                 driver.find_element(By.XPATH, locator_element_to_click).click()
             except:
                 pass
-            time.sleep(time_between_clicks_int)
-            webelements_located = driver.find_elements(By.XPATH, locator_element_to_click)
-            if (len(webelements_located) == 0):
-                timeout_int = -1000
-            else:
-                timeout_int = timeout_int - time_between_clicks_int  
-        if timeout_int != -1000:
-            raise Exception(f"The button {locator_element_to_click} was clicked multiple times but the element {locator_element_to_complete} was never found")
+        WaitEngine.repeat_until(click, Condition.count(lambda: driver.find_elements(By.XPATH, locator_element_to_click), expected=0),
+                                int(timeout), int(time_between_clicks),
+                                f"The button {locator_element_to_click} was clicked multiple times but it is still visible")
 
     @staticmethod
     def refresh_until_function_is_met(driver, function_file, fuction_name, number_of_retries, *args):
@@ -303,18 +251,9 @@ class SeleniumMethods(CustomBase):
 
     @staticmethod
     def switch_to_next_tab(driver, timeout):
-        timeout_initial = timeout
-        timeout = int(timeout)
         current_tab = driver.current_window_handle
-        while timeout >= 0:
-            tabs = driver.window_handles
-            if len(tabs) > 1:
-                timeout = -1000
-            else:
-                timeout -= 1
-                time.sleep(1)
-        if timeout != -1000:
-            raise Exception(f"Waited for {timeout_initial} seconds, but there was no other tab opened")
+        tabs = WaitEngine.until(Condition.count(lambda: driver.window_handles, minimum=2), int(timeout),
+                                f"Waited for {timeout} seconds, but there was no other tab opened")
         for tab in tabs:
             if(tab!=current_tab):
                 driver.switch_to.window(tab)
@@ -429,35 +368,26 @@ class SeleniumMethods(CustomBase):
         driver (webdriver): current web driver
         name (str): complete name of the APPI (URL+ENDPONT) 
         """
-        logs = driver.execute_script("return window.performance.getEntries();")
         print(f'[INFO] get_network_log_by_name')
-        log = list(filter(lambda x: name in x["name"], logs))
-        return log
+        return NetworkWatcher.find(driver, name)
 
     @staticmethod
     def wait_network_log_by_name(driver, name, timeout = 20):
         print(f'[INFO] Wait_network_log_by_name!')
         driver.set_script_timeout(60)
-        log_entries = list()
-        while len(log_entries) == 0 and timeout > 0:
-            sleep(1)
-            log_entries = SeleniumMethods.get_network_log_by_name(driver, name)
-            timeout-=1
-        return  bool(log_entries)
+        return NetworkWatcher.wait_for(driver, name, timeout=timeout) is not None
 
 
     @staticmethod
     def wait_network_log_by_status(driver, name, expected_status, timeout=20):
-        log_entries = list()
-        response_status = 0 
-        
-        while len(log_entries) == 0 and response_status != expected_status and timeout > 0:
-            sleep(1)
-            log_entries = SeleniumMethods.get_network_log_by_name(driver, name)
-            if len(log_entries) != 0:
-                response_status = int(log_entries[0]["responseStatus"])
-            timeout -= 1
-        return  bool(log_entries)
+        """
+        Waits until a request matching the name is saved into the browser and checks its response status.
+        The status of a performance entry is final, so there is no point in waiting once the request is there
+        Returns:
+            bool: True if a matching request has the expected status, False if none has it or there is no request
+        """
+        entries = WaitEngine.until_or_default(lambda: NetworkWatcher.find(driver, name), timeout, default=[])
+        return any(int(entry.get("responseStatus", 0)) == int(expected_status) for entry in entries)
 
     def get_network_log_by_regex_name(driver, name_regex):
         """
@@ -465,10 +395,9 @@ class SeleniumMethods(CustomBase):
         driver (webdriver): current web driver
         name_regex (str): complete name of the APPI (URL+ENDPONT) or regex to perform the search in the browsers's network log
         """
-        logs = driver.execute_script("return window.performance.getEntries();")
-        for log in logs:
-            if re.search(name_regex, log["name"]) != None:
-                return log
+        logs = NetworkWatcher.find(driver, name_regex, regex=True)
+        if logs:
+            return logs[0]
 
     @staticmethod
     def wait_network_log_by_name_regex(driver, name_regex, timeout = 20):
@@ -478,11 +407,7 @@ class SeleniumMethods(CustomBase):
         name_regex (str): complete name of the APPI (URL+ENDPONT) or regex to perform the search in the browsers's network log
         timeout (int): Time in seconds that the automation wait
         """
-        response = None
-        while(response == None and timeout > 0 ):
-            sleep(1)
-            response = SeleniumMethods.get_network_log_by_regex_name(driver, name_regex)
-            timeout-=1
+        response = NetworkWatcher.wait_for(driver, name_regex, regex=True, timeout=timeout)
         if  (response == None):
             fail(f"The network log name: {name_regex} was not found")
 
@@ -515,13 +440,8 @@ class SeleniumMethods(CustomBase):
 
     @staticmethod
     def wait_for_jquery_idle(driver, time_out='300'):
-        start_time = time.time()
-        loader_completed = False
-        while not loader_completed and (time.time() - start_time) < int(time_out):
-            try:
-                loader_completed = SeleniumMethods.is_jquery_idle(driver)
-            except:
-                pass
+        WaitEngine.until_or_default(lambda: SeleniumMethods.is_jquery_idle(driver), int(time_out),
+                                    ignored_exceptions=(Exception,))
 
     def get_text_from_list_of_elements(self, locator: str, time_out: str = '30') -> list:
         """
@@ -536,6 +456,11 @@ class SeleniumMethods(CustomBase):
         """
         self.get_selenium_instance().wait_until_page_contains_element(locator=locator, timeout=time_out)
         elements = self.get_selenium_instance().get_elements(locator)
+        try:
+            return DomQuery.get_texts(self.get_webdriver(), elements)
+        except StaleElementReferenceException:
+            # The list changed while it was read, the elements still attached are read one by one
+            pass
         texts = []
         for element in elements:
             try:
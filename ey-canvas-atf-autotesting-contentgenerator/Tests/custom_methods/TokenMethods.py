@@ -1,19 +1,26 @@
 import json
 import threading
+from Tests.Utils.RunWorkspace import RunWorkspace
 from Tests.Utils.TokensUsers import TokensUsers
+from Tests.Utils.tokens.TokenCache import TokenCache
+from Tests.Utils.tokens.TokenNames import TokenNames
 from Tests.custom_methods.APIMethods import APIMethods
 from Tests.custom_methods.CommonMethods import CommonMethods as CM
 from datetime import datetime, timedelta
 import os
-from selenium.webdriver import Chrome, ChromeOptions
-from Tests.custom_methods.SeleniumMethods import SeleniumMethods as SM
-from Tests.custom_methods.LogInMethods import LogInMethods as LM
-from selenium.webdriver.common.keys import Keys
+from Tests.Utils.LazyImport import LazyImport
 from time import sleep
-from scriptless.Core.framework.data_handler import Data_handler
 import re
 import threading
 
+# Only needed to generate tokens in the browser, imported on first use
+Chrome = LazyImport("selenium.webdriver", "Chrome")
+ChromeOptions = LazyImport("selenium.webdriver", "ChromeOptions")
+SM = LazyImport("Tests.custom_methods.SeleniumMethods", "SeleniumMethods")
+LM = LazyImport("Tests.custom_methods.LogInMethods", "LogInMethods")
+Keys = LazyImport("selenium.webdriver.common.keys", "Keys")
+Data_handler = LazyImport("scriptless.Core.framework.data_handler", "Data_handler")
+
 class TokenMethods:
 
     TOKEN_NAME_UNIVERSAL = "CGTOKEN"
@@ -25,8 +32,7 @@ class TokenMethods:
     def get_token_from_Browser(driver,token_name, user_name_token ='CanvasAutomationUser1'):
         sleep(10)
         token_value = TokenMethods._get_correct_token_from_local_storage(driver, token_name)
-        country_code = ''
-        TokenMethods._update_token_on_file(token_name,token_value,country_code)
+        TokenMethods._update_token_on_file(token_name,token_value,user_name_token)
         TokensUsers.set_token(user_name_token,token_name,token_value)
         return token_value
 
@@ -35,29 +41,25 @@ class TokenMethods:
         TokensUsers.set_token(user_name_token, token_name, token_value)
     
     def _update_token_on_file(token_name,token_value,user_name_token):
-        
-        with TokenMethods._TOKEN_LOCK:
-            now = datetime.now()
-            
+        # Stored with the same key get_token reads, also from the processes started after the robot execution
+        TokenCache.get_instance().put_token(user=user_name_token, token_name=TokenMethods._get_cached_token_name(token_name),
+                                            token=token_value, location_url=TokenMethods.get_token_url(token_name),
+                                            duration=timedelta(seconds=3500))
 
-            if TokenMethods._validate_if_token_file_already_exists() == False:
-                TokenMethods._create_token_file()
-            now_string = now.strftime("%Y%m%d%H%M%S%f")
-            tokens_information = CM.read_json_file("Tests/filesForTests/temp_api/token_handler.json")
-            tokens_information[user_name_token] = {
-                    "duration": 3500,
-                    "creation_time": now_string,
-                    "value": token_value,
-            }
-            #if engagement_name != "" and engagement_name != None:
-            #    tokens_information[token_name]["country_code"] = country_code
-            #    tokens_information[token_name]["engagements"].append(engagement_name)
-            file_name = f"token_handler.json"
-            CM.write_json_file(f"Tests/filesForTests/temp_api/{file_name}", tokens_information)
+    @staticmethod
+    def _get_cached_token_name(token_name):
+        if "UNIVERSAL" == token_name:
+            return TokenNames.TOKEN_NAME_UNIVERSAL
+        return token_name
+
+    @staticmethod
+    def _get_token_file():
+        # In the directory of the execution, so concurrent executions do not share it
+        return RunWorkspace.get_instance().get_path("token_handler.json")
 
     @staticmethod
     def _validate_if_token_file_already_exists():
-        if os.path.exists("Tests/filesForTests/temp_api/token_handler.json"):
+        if os.path.exists(TokenMethods._get_token_file()):
             return True
         return False
     
@@ -65,17 +67,17 @@ class TokenMethods:
     def _create_token_file():
         empty_token_file = {}
         TokenMethods._create_dir_if_token_dir_already_exists()
-        CM.write_json_file("Tests/filesForTests/temp_api/token_handler.json", empty_token_file)
+        CM.write_json_file(TokenMethods._get_token_file(), empty_token_file)
 
     @staticmethod
     def _create_dir_if_token_dir_already_exists():
-        newpath = 'Tests/filesForTests/temp_api' 
+        newpath = os.path.dirname(TokenMethods._get_token_file())
         if not os.path.exists(newpath):
             os.makedirs(newpath)
 
     @staticmethod
     def _validate_if_valid_token_already_exists(token_name, engagement_name):
-        token_information = CM.read_json_file("Tests/filesForTests/temp_api/token_handler.json")
+        token_information = CM.read_json_file(TokenMethods._get_token_file())
         if engagement_name == "" or engagement_name == None:
             if token_name in token_information:
                 return True
@@ -88,7 +90,7 @@ class TokenMethods:
     
     @staticmethod
     def _get_token_information(token_name):
-        token_information = CM.read_json_file("Tests/filesForTests/temp_api/token_handler.json")
+        token_information = CM.read_json_file(TokenMethods._get_token_file())
 
         if token_name in token_information:
             return token_information[token_name]
@@ -111,10 +113,9 @@ class TokenMethods:
             token_name = token_name.split("-")[0] + "-" + engagement_country_code
             if TokenMethods._validate_if_valid_token_already_exists(token_name, "") == True:
                 if TokenMethods._check_if_token_is_expired(token_name, engagement_name) == False:
-                    tokens_information = CM.read_json_file("Tests/filesForTests/temp_api/token_handler.json")
+                    tokens_information = CM.read_json_file(TokenMethods._get_token_file())
                     tokens_information[token_name]["engagements"].append(engagement_name)
-                    file_name = f"token_handler.json"
-                    CM.write_json_file(f"Tests/filesForTests/temp_api/{file_name}", tokens_information)
+                    CM.write_json_file(TokenMethods._get_token_file(), tokens_information)
                     return None
         country_code = TokenMethods._get_country_code_from_token_name(token_name)
         TokenMethods._go_to_correct_url_for_token_generation(driver, token_name)
@@ -123,7 +124,7 @@ class TokenMethods:
         driver.quit()
         now = datetime.now()
         now_string = now.strftime("%Y%m%d%H%M%S%f")
-        tokens_information = CM.read_json_file("Tests/filesForTests/temp_api/token_handler.json")
+        tokens_information = CM.read_json_file(TokenMethods._get_token_file())
         tokens_information[token_name] = {
                 "duration": duration,
                 "creation_time": now_string,
@@ -134,8 +135,7 @@ class TokenMethods:
         if engagement_name != "" and engagement_name != None:
             tokens_information[token_name]["country_code"] = country_code
             tokens_information[token_name]["engagements"].append(engagement_name)
-        file_name = f"token_handler.json"
-        CM.write_json_file(f"Tests/filesForTests/temp_api/{file_name}", tokens_information)
+        CM.write_json_file(TokenMethods._get_token_file(), tokens_information)
 
     @staticmethod
     def _get_country_code_from_token_name(token_name):
@@ -156,14 +156,13 @@ class TokenMethods:
             token_value, expire_date = TokenMethods._generate_universal_token(driver, local_storage_key_query)
         now = datetime.now()
         now_string = now.strftime("%Y%m%d%H%M%S%f")
-        tokens_information = CM.read_json_file("Tests/filesForTests/temp_api/token_handler.json")
+        tokens_information = CM.read_json_file(TokenMethods._get_token_file())
         tokens_information[token_name] = {
                 "duration": duration,
                 "creation_time": now_string,
                 "value": token_value
             }
-        file_name = f"token_handler.json"
-        CM.write_json_file(f"Tests/filesForTests/temp_api/{file_name}", tokens_information)
+        CM.write_json_file(TokenMethods._get_token_file(), tokens_information)
 
     @staticmethod
     def _get_country_code_of_engagement(driver, engagement_name):
@@ -350,15 +349,28 @@ class TokenMethods:
         return incountryuri
 
     @staticmethod
-    def get_token(token_name):
-        with TokenMethods._TOKEN_LOCK:
-            try:
-                tokens_information = CM.read_json_file("Tests/filesForTests/temp_api/token_handler.json")
-                if TokenMethods._check_if_token_has_expired(tokens_information[token_name]):
-                    return tokens_information[token_name]['value']
-                return None
-            except:
-                print(f'There was no token with the name {token_name}')
+    def get_token(user_name_token, environment=None):
+        """
+        Returns the universal token obtained from the browser for the user, reading the persisted token store when
+        the token is not in the memory of the process (E.g: the runner after the robot execution)
+        Args:
+            user_name_token (str): user in the format of the .env file E.g: CanvasAutomationUser1
+            environment (str): Environment of the env.xml file E.g: UAT3, the current execution environment if not provided
+        Returns:
+            str: the token, None if there is no valid token
+        """
+        env_variables = CM.get_app_env_variable(environment or CM.get_value_in_temp_variable("Environment"))
+        token_cache = TokenCache.get_instance()
+        token = None
+        # TokenMethodsV2 stores the universal token for universalAPIEndpoint, the browser tokens have no url
+        for location_url in (env_variables.get("universalAPIEndpoint"), env_variables.get("CanvasURL")):
+            if location_url and token is None:
+                token = token_cache.find_token(user_name_token, TokenNames.TOKEN_NAME_UNIVERSAL, location_url)
+        if token is None:
+            token = token_cache.find_any_token(user_name_token, TokenNames.TOKEN_NAME_UNIVERSAL)
+        if token is None:
+            print(f'There was no valid token for {user_name_token}')
+        return token
             
     @staticmethod
     def _check_if_token_has_expired(token_information):
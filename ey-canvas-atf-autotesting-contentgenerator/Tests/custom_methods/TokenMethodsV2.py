@@ -1,16 +1,19 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from scriptless.Core.library.common.CustomBase import CustomBase
 from Tests.Utils.tokens.TokenNames import TokenNames
-from Tests.Utils.tokens.TokenAPI import TokenAPI
+from Tests.Utils.tokens.TokenCache import TokenCache
 from Tests.custom_methods.CommonMethods import CommonMethods
-from Tests.custom_methods.MSALTokenMethods import MSALTokenMethods
+from Tests.Utils.LazyImport import LazyImport
 from Tests.Utils.logging.LoggerFactory import Logger
 logger = Logger(__name__).get_logger()
 
+# msal is only imported when a token has to be requested
+MSALTokenMethods = LazyImport("Tests.custom_methods.MSALTokenMethods", "MSALTokenMethods")
+
 class TokenMethodsV2(CustomBase):
 
     def get_token(self, token_name: TokenNames,
-                  user_name_token='CanvasAutomationUser1'):
+                  user_name_token='CanvasAutomationUser1', environment=None):
         """
 
         Args:
@@ -26,43 +29,27 @@ class TokenMethodsV2(CustomBase):
                              Note:A method called get_engagement_full_data in Tests/Utils/EngagementData.py exist and will return the needed data in the format this method is expecting
 
             user_name_token: user_name in the forma of the .env file E.g: CanvasAutomationUser1
+            environment: Environment of the env.xml file E.g: UAT3, the current execution environment if not provided
 
         Returns:
             Bearer token
         """
 
-        token_api = TokenAPI()
-
-        urls_for_msal = self.get_url_for_msal_request_for_a_token_name(token_name=token_name)
-
-        body = {
-            "user": user_name_token,
-            "token_name": str(token_name),
-            "location_url": urls_for_msal["location_url"]
-            }
-        logger.info("urls")
-        logger.info(urls_for_msal)
-
-        token_info = token_api.get_token(body)
-
-        if token_info is None:
-            logger.info(f"Token not found, trying to get a new one... using this information: {body}")
-            token_info=self.create_token(token_name=token_name,user_name_token=user_name_token)
-        else:
-            logger.info(f"Token found, checking if expired")
-            token_info = self.refresh_token_if_expired(token_info=token_info)
-
-        return token_info["token"]
-
+        urls_for_msal = self.get_url_for_msal_request_for_a_token_name(token_name=token_name, environment=environment)
 
+        return TokenCache.get_instance().get_token(
+            user=user_name_token,
+            token_name=token_name,
+            location_url=urls_for_msal["location_url"],
+            provider=lambda: self._request_msal_token(token_name, user_name_token, urls_for_msal)
+        )
 
     def create_token(self, token_name: TokenNames,
                   user_name_token='CanvasAutomationUser1'):
         """
-        Create the token doing the API call to MSAL and save the token in pysondb
+        Create the token doing the API call to MSAL and save the token in the token cache (memory and pysondb)
         Args:
             token_name: One of the values of the enum TokenNames
-            engagement_data: dict with the following keys: location_url and resource name
             user_name_token: username in the .env E.g CanvasAutomationUser1
 
         Returns:
@@ -75,22 +62,24 @@ class TokenMethodsV2(CustomBase):
                 "token":token
             }
         """
-        token_api = TokenAPI()
         urls_for_msal = self.get_url_for_msal_request_for_a_token_name(token_name=token_name)
-        token = MSALTokenMethods().get_token(resource_name=urls_for_msal["resource_name"],token_name=token_name,user_name_token=user_name_token)
+        token_info = self._request_msal_token(token_name, user_name_token, urls_for_msal)
         body = {
             "user": user_name_token,
             "token_name": str(token_name),
             "location_url": urls_for_msal["location_url"],
-            "resource_name":urls_for_msal["resource_name"],
-            "token":token
+            "resource_name": urls_for_msal["resource_name"],
+            "token": token_info["token"]
         }
-        token_api.post_token(body)
+        # The enum member, str() of it is not the token name the cache is keyed by
+        TokenCache.get_instance().put_token(user=body["user"], token_name=token_name, token=body["token"],
+                                            location_url=body["location_url"], resource_name=body["resource_name"])
         return body
 
     def refresh_token_if_expired(self, token_info):
         """
-        check token_expiration_time in pyson and if it is greater than the actual time, will generate a new one and update the token in pyson
+        check token_expiration_time and if it is greater than the actual time, will get a valid token from the token cache,
+        that requests a new one from MSAL only once even if several tests are asking for it
         Args:
             token_info: dictionary with the following keys:
                         user
@@ -98,34 +87,46 @@ class TokenMethodsV2(CustomBase):
                         location_url
                         resource_name
                         token
+                        expiration_time
 
         Returns:
-            None
+            token_info with a valid token
         """
-        token_api = TokenAPI()
         token_expiration_time = datetime.strptime(token_info["expiration_time"], "%m/%d/%Y, %H:%M:%S")
         now = datetime.now()
 
         if now > token_expiration_time:
             logger.info(f"Token expired, getting a new one from MSAL")
-            token = MSALTokenMethods().get_token(token_info["resource_name"], token_info["user"])
-            body = {
+            urls_for_msal = {"location_url": token_info["location_url"],
+                             "resource_name": token_info.get("resource_name", "")}
+            token = TokenCache.get_instance().get_token(
+                user=token_info["user"],
+                token_name=token_info["token_name"],
+                location_url=token_info["location_url"],
+                provider=lambda: self._request_msal_token(token_info["token_name"], token_info["user"], urls_for_msal)
+            )
+            token_info = {
                 "user": token_info["user"],
                 "token_name": token_info["token_name"],
                 "location_url": token_info["location_url"],
                 "token": token,
                 "creation_time": now.strftime("%m/%d/%Y, %H:%M:%S"),
-                "expiration_time": (now + timedelta(minutes=40)).strftime("%m/%d/%Y, %H:%M:%S")
+                "expiration_time": (now + TokenCache.DEFAULT_DURATION).strftime("%m/%d/%Y, %H:%M:%S")
             }
-            token_api.put_token(body)
-            token_info =body
         else:
             logger.info(f"Token is not expired")
         return token_info
 
+    def _request_msal_token(self, token_name, user_name_token, urls_for_msal):
+        """
+        Token provider for the token cache, gets a new token from MSAL
+        """
+        logger.info(f"Getting a new token {token_name} for {user_name_token} from MSAL")
+        token = MSALTokenMethods().get_token(resource_name=urls_for_msal["resource_name"], token_name=token_name,
+                                             user_name_token=user_name_token)
+        return {"token": token, "resource_name": urls_for_msal["resource_name"]}
 
-
-    def get_url_for_msal_request_for_a_token_name(self, token_name: TokenNames):
+    def get_url_for_msal_request_for_a_token_name(self, token_name: TokenNames, environment=None):
         """
 
         Args:
@@ -139,6 +140,7 @@ class TokenMethodsV2(CustomBase):
 
                              Not mandatory for tokens that are having static tenant url, E.g: UNIVERSAL
                              Note:A method called get_engagement_full_data in Tests/Utils/EngagementData.py exist and will return the needed data in the format this method is expecting
+            environment: Environment of the env.xml file E.g: UAT3, the current execution environment if not provided
         Returns:
             dictionary with the needed urls for get the MSAL token E.g
             {
@@ -147,7 +149,7 @@ class TokenMethodsV2(CustomBase):
             }
         """
         logger.info("getting tenant urls for get msal token")
-        env_variables = CommonMethods().get_app_env_variable(self.get_current_environment())
+        env_variables = CommonMethods().get_app_env_variable(environment or self.get_current_environment())
         try:
             if token_name == TokenNames.TOKEN_NAME_UNIVERSAL:
                 location_url = env_variables["universalAPIEndpoint"]
@@ -1,13 +1,26 @@
 import os
 import shutil
-import tempfile
 
-from Tests.Utils.ContentCleanup import APIDeleteContentById
+from Tests.Utils.BrowserSessionPool import BrowserSessionPool
+from Tests.Utils.HttpSessionPool import HttpSessionPool
+from Tests.Utils.LazyImport import LazyImport
+from Tests.Utils.ReferenceDataCache import ReferenceDataCache
+from Tests.Utils.RetryPolicy import RetryStats
+from Tests.Utils.RunWorkspace import RunWorkspace
+from Tests.Utils.TestStats import TestStats
+from Tests.Utils.WaitEngine import WaitStats
 from Tests.Utils.logging.LoggerFactory import Logger
+from Tests.Utils.tokens.TokenCache import TokenCache
 
 from Tests.custom_methods.CommonMethods import CommonMethods as CM
 from scriptless.internal.runner import Runner
 
+# Imported on first use: the content cleanup loads APIMethods and TokenMethods, and the prewarmer and the cassette
+# are only needed by the runs using them
+APIDeleteContentById = LazyImport("Tests.Utils.ContentCleanup", "APIDeleteContentById")
+ApiCassette = LazyImport("Tests.Utils.ApiCassette", "ApiCassette")
+TokenPrewarmer = LazyImport("Tests.Utils.tokens.TokenPrewarmer", "TokenPrewarmer")
+
 
 class UserListener:
     """
@@ -24,7 +37,9 @@ class UserListener:
     """
 
     ROBOT_LISTENER_API_VERSION = 2
-    _TEMP_FILE_NAME = "Tests/filesForTests/temp.json"
+
+    # True when the listener created the RunWorkspace, E.g: robot started without the runner
+    _owns_workspace = False
 
     @staticmethod
     def before_run():
@@ -35,6 +50,8 @@ class UserListener:
         args = Runner().argument_parser("run")
         args.mode = args.mode.lower()
 
+        # A workspace created by the runner (in this process or the one that started it) is removed by the runner
+        UserListener._owns_workspace = RunWorkspace.RUN_ID_VARIABLE not in os.environ
         UserListener._remove_temp_files()
         UserListener._create_temp_files()
 
@@ -48,8 +65,17 @@ class UserListener:
         # Set global execution type
         CM.set_value_in_temp_variable("global_execution_type", args.mode)
 
+        # Record or replay the API calls of the suite when API_CASSETTE_MODE is set
+        ApiCassette.configure(name=args.name or args.file)
+
+        # One keep-alive connection per parallel test and host
+        HttpSessionPool.configure(pool_maxsize=max(int(args.thread_count or 0), 1))
+
         # create temp file for engagement information
         UserListener._initialize_temp_engagement_file(args)
+        CM.flush_temp_files()
+
+        UserListener._prewarm_tokens(args)
 
     @staticmethod
     def after_run():
@@ -57,19 +83,29 @@ class UserListener:
         Called after the test run ends (Only Python code should be executed here, scriptless keywords will not be accessible).
         """
         args = Runner().argument_parser("run")
+        print(f"[INFO] Token cache metrics: {TokenCache.get_instance().get_metrics()}")
+        print(f"[INFO] HTTP connection pool stats: {HttpSessionPool.get_stats()}")
+        print(f"[INFO] Reference data cache metrics: {ReferenceDataCache.get_instance().get_metrics()}")
+        print(f"[INFO] Retries of the execution: {RetryStats.get_totals()}")
+        print(f"[INFO] UI waits of the execution: {WaitStats.get_totals()}")
+        print(f"[INFO] Browser session pool stats: {BrowserSessionPool.get_instance().get_stats()}")
+        BrowserSessionPool.get_instance().close_all()
+        ApiCassette.get_instance().save()
+        HttpSessionPool.close()
         UserListener()._move_log_file_to_the_report_folder()
         app_variables = CM.get_app_env_variable(args.environment)
         if app_variables["deleteEntity"].lower() == 'true':
             APIDeleteContentById(environment=args.environment, prefix_file_name='Scriptless Execution.')
         CM._delete_directory_files()
-        file = tempfile.gettempdir() + '\\' + UserListener._generate_temp_file_name(args) + '.json'
-        try:
-            os.remove(file)
+        workspace = RunWorkspace.get_instance()
+        file = UserListener._generate_temp_file_name(args) + '.json'
+        if workspace.remove(file):
             print(f"File {file} removed successfully.")
-        except FileNotFoundError:
+        else:
             print(f"File {file} not found, skipping.")
-        except Exception as e:
-            print(f"Error occurred while removing {file}: {e}")
+        # The runner that created the workspace removes it when the execution ends
+        if UserListener._owns_workspace and workspace.owner:
+            workspace.teardown()
 
 
     def start_suite(self, name, attrs):
@@ -86,36 +122,44 @@ class UserListener:
         Called when test starts.
         """
         print(f"Test {name} started.")
+        TestStats.start_test(name)
 
     def end_test(self, name, attrs):
-        pass
+        retry_stats = RetryStats.get_test_stats(name)
+        if retry_stats["retries"]:
+            print(f"[INFO] Test {name} retried {retry_stats['retries']} times, "
+                  f"{retry_stats['sleep_time']:.1f} seconds waiting")
+        wait_stats = WaitStats.get_test_stats(name)
+        if wait_stats["waits"]:
+            print(f"[INFO] Test {name} waited {wait_stats['wait_time']:.1f} seconds in {wait_stats['waits']} UI waits, "
+                  f"{wait_stats['timeouts']} timed out")
 
     @staticmethod
     def _remove_temp_files():
-        files_to_remove = [
-            "Tests/filesForTests/temp.json",
-            "Tests/filesForTests/temp_engagements.json",
-            "Tests/filesForTests/temp_test_information.json",
-            "Tests/filesForTests/temp_api/token_handler.json",
-            "Tests/resources/local_db/Token.json"
-        ]
-        for file in files_to_remove:
-            try:
-                os.remove(file)
-                print(f"File {file} removed successfully.")
-            except FileNotFoundError:
-                print(f"File {file} not found, skipping.")
-            except Exception as e:
-                print(f"Error occurred while removing {file}: {e}")
+        RunWorkspace.get_instance().remove_state_files()
 
     @staticmethod
     def _create_temp_files():
-        CM.create_temp_config_file("Tests/filesForTests/Config/engagements.json",
-                                   "Tests/filesForTests/temp_engagements.json")
-        CM.create_temp_config_file("Tests/filesForTests/Config/test_information.json",
-                                   "Tests/filesForTests/temp_test_information.json")
+        CM.create_temp_config_files()
+
 
 
+    @staticmethod
+    def _prewarm_tokens(args):
+        """
+        Gets the tokens used by the selected suite or test case before the tests start, so the first test of every
+        worker finds them in the token cache instead of waiting for MSAL
+        """
+        try:
+            prewarmer = TokenPrewarmer()
+            if args.mode == "testcase":
+                token_requests = prewarmer.collect_from_test_case(args.file, args.name, args.dataindex)
+            else:
+                token_requests = prewarmer.collect_from_suite(args.file, args.name)
+            result = prewarmer.prewarm(token_requests, environment=args.environment)
+            print(f"[INFO] Tokens pre-warmed: {result['acquired']}, failed: {result['failed']}")
+        except Exception as e:
+            print(f"[WARN] Token pre-warming skipped, tokens will be requested by the tests: {e}")
 
     @staticmethod
     def _initialize_temp_engagement_file(args):
@@ -0,0 +1,109 @@
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+
+class EndpointTemplate:
+    """
+    Path template of an endpoint parsed once, E.g: '/api/v1/Bodies/{body_id}?'.
+
+    The template is split into literal segments and placeholders when it is registered, so building a path only joins
+    the segments with the values, and a missing or unknown path param is reported before sending any request.
+    """
+    __slots__ = ("name", "template", "placeholders", "_segments")
+
+    def __init__(self, name: str, template: str):
+        segments = []
+        placeholders = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is not None and (not field_name.isidentifier() or format_spec or conversion):
+                raise ValueError(f"Endpoint {name} has an unsupported placeholder in '{template}'")
+            segments.append((literal, field_name))
+            if field_name is not None and field_name not in placeholders:
+                placeholders.append(field_name)
+        self.name = name
+        self.template = template
+        self.placeholders: Tuple[str, ...] = tuple(placeholders)
+        self._segments: Tuple[Tuple[str, Optional[str]], ...] = tuple(segments)
+
+    def path(self, **path_params) -> str:
+        """
+        Returns the path with the placeholders replaced, E.g: path(body_id=123) -> '/api/v1/Bodies/123?'
+        Raises:
+            ValueError: If a placeholder has no value or a param is not a placeholder of the template
+        """
+        if len(path_params) != len(self.placeholders) or not all(name in path_params for name in self.placeholders):
+            missing = [name for name in self.placeholders if name not in path_params]
+            unexpected = [name for name in path_params if name not in self.placeholders]
+            raise ValueError(f"Endpoint {self.name} expects the params {list(self.placeholders)}, "
+                             f"missing: {missing}, unexpected: {unexpected}")
+        return "".join(literal if field_name is None else literal + str(path_params[field_name])
+                       for literal, field_name in self._segments)
+
+    def build(self, base_uri: str = "", params: Optional[dict] = None, **path_params) -> str:
+        """
+        Returns the full url of the endpoint
+        Args:
+            base_uri (str): Base url of the API, E.g: BaseAPIClass.API_UNIVERSAL
+            params (dict): Query params, appended to the query already in the template if any
+            path_params: Values of the placeholders of the template
+        Returns:
+            str, E.g: https://host/api/v1/Bodies/123?includeDeleted=true
+        """
+        url = base_uri + self.path(**path_params)
+        if not params:
+            return url
+        if url.endswith(("?", "&")):
+            separator = ""
+        elif "?" in url:
+            separator = "&"
+        else:
+            separator = "?"
+        return url + separator + urlencode(params)
+
+    def __repr__(self):
+        return f"EndpointTemplate({self.name!r}, {self.template!r})"
+
+
+class EndpointRegistry:
+    """
+    Read only collection of the endpoint templates of an API, created once per process and shared by every API class.
+    """
+
+    def __init__(self, templates: Iterable[Tuple[str, str]]):
+        self._templates: Mapping[str, EndpointTemplate] = MappingProxyType(
+            {name: EndpointTemplate(name, template) for name, template in templates})
+
+    @classmethod
+    def from_class(cls, constants_class: type, prefix: str = "_") -> 'EndpointRegistry':
+        """
+        Registers the string class attributes starting with prefix, registered without it
+        E.g: Endpoints._DELETE_FORM_BODY -> DELETE_FORM_BODY
+        """
+        return cls((name[len(prefix):], value) for name, value in vars(constants_class).items()
+                   if name.startswith(prefix) and not name.startswith("__") and isinstance(value, str))
+
+    def get(self, name: str) -> EndpointTemplate:
+        try:
+            return self._templates[name]
+        except KeyError:
+            raise KeyError(f"Endpoint {name} is not registered") from None
+
+    def path(self, name: str, **path_params) -> str:
+        return self.get(name).path(**path_params)
+
+    def build(self, name: str, base_uri: str = "", params: Optional[dict] = None, **path_params) -> str:
+        return self.get(name).build(base_uri, params, **path_params)
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._templates)
+
+    def as_dict(self) -> Dict[str, str]:
+        return {name: template.template for name, template in self._templates.items()}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._templates
+
+    def __len__(self) -> int:
+        return len(self._templates)
@@ -18,7 +18,7 @@ Example:
 """
 
 from typing import List, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 __version__ = "2.0.0"
@@ -55,16 +55,30 @@ class AnalysisReport:
         total_errors: Total number of errors across all checks
         total_warnings: Total number of warnings across all checks
         execution_time: Time taken to run all checks in seconds
+        parse_stats: Per-file XML parse hit/miss counters from the shared artifact store
+        cache_stats: File reuse counters from the persistent findings cache
     """
     results: List[AnalysisResult]
     total_errors: int
     total_warnings: int
     execution_time: float
+    parse_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    cache_stats: Dict[str, int] = field(default_factory=dict)
     
     @property
     def success(self) -> bool:
         """True if no errors were found in any check."""
         return self.total_errors == 0
+    
+    @property
+    def parse_summary(self) -> Dict[str, int]:
+        """Aggregated XML parse counters across all files."""
+        return {
+            "files": len(self.parse_stats),
+            "misses": sum(counters.get("misses", 0) for counters in self.parse_stats.values()),
+            "hits": sum(counters.get("hits", 0) for counters in self.parse_stats.values()),
+            "streams": sum(counters.get("streams", 0) for counters in self.parse_stats.values())
+        }
 
 
 # Re-export key classes and functions for easier imports
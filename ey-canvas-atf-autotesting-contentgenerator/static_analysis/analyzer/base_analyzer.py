@@ -5,12 +5,15 @@ analyzers should implement, following the Template Method pattern.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pathlib import Path
 import logging
 import time
 from dataclasses import dataclass
 
+from ..parser.xml_parser import XMLParser
+from ..parser.symbol_index import SymbolIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,12 +32,14 @@ class AnalyzerContext:
         files_processed: Number of files processed
         total_files: Total number of files to process
         metadata: Additional context data
+        xml_store: Shared XML artifact store for the current run (if any)
     """
     config: Any  # AnalysisConfig - avoiding circular import
     start_time: float
     files_processed: int = 0
     total_files: int = 0
     metadata: Dict[str, Any] = None
+    xml_store: Any = None  # XMLArtifactStore
     
     def __post_init__(self):
         if self.metadata is None:
@@ -47,8 +52,13 @@ class BaseAnalyzer(ABC):
     This class provides common functionality and defines the interface
     that all analyzers must implement. It follows the Template Method
     pattern to ensure consistent behavior across analyzers.
+    
+    Subclasses that cache per-file findings must bump ANALYZER_VERSION
+    whenever the shape or meaning of those findings changes.
     """
     
+    ANALYZER_VERSION = "2"
+    
     def __init__(self, config):
         """Initialize the analyzer with configuration.
         
@@ -75,7 +85,8 @@ class BaseAnalyzer(ABC):
         start_time = time.time()
         context = AnalyzerContext(
             config=self.config,
-            start_time=start_time
+            start_time=start_time,
+            xml_store=getattr(self.config, "xml_store", None)
         )
         
         self.logger.info(f"Starting {self.get_analyzer_name()} analysis")
@@ -172,6 +183,62 @@ class BaseAnalyzer(ABC):
         """
         return {}
     
+    def _get_xml_parser(self) -> XMLParser:
+        """Get the XML parser this analyzer should use.
+        
+        Returns the shared artifact store from the configuration when one is
+        set, so every analyzer reuses the same parsed trees. Falls back to a
+        private parser for analyzers created outside of run_all_checks.
+        
+        Returns:
+            XML parser instance
+        """
+        xml_store = getattr(self.config, "xml_store", None)
+        return xml_store if xml_store is not None else XMLParser()
+    
+    def _get_symbol_index(self) -> SymbolIndex:
+        """Get the cross-file symbol index for this run.
+        
+        Returns the index from the configuration when one is set; otherwise
+        builds a private index for analyzers created outside of run_all_checks.
+        
+        Returns:
+            Up-to-date symbol index
+        """
+        symbol_index = getattr(self.config, "symbol_index", None)
+        if symbol_index is None:
+            symbol_index = SymbolIndex(self.config.directories)
+            symbol_index.update(self._get_xml_parser())
+        return symbol_index
+    
+    def _get_cached_file_result(self, file_path: Path, compute: Callable[[], Any],
+                                key: str = "") -> Any:
+        """Get per-file findings from the incremental cache, computing them on a miss.
+        
+        Args:
+            file_path: File the findings belong to
+            compute: Callable producing JSON-serializable findings for the file
+            key: Optional sub-key when an analyzer caches several result kinds per file
+            
+        Returns:
+            Cached or freshly computed findings
+        """
+        findings_cache = getattr(self.config, "findings_cache", None)
+        if findings_cache is None:
+            return compute()
+        
+        namespace = f"{self.__class__.__name__}-v{self.ANALYZER_VERSION}"
+        if key:
+            namespace = f"{namespace}-{key}"
+        
+        cached = findings_cache.get(namespace, file_path)
+        if cached is not findings_cache.MISSING:
+            return cached
+        
+        result = compute()
+        findings_cache.put(namespace, file_path, result)
+        return result
+    
     def _get_files_to_analyze(self, directory: Path, pattern: str = "*.xml") -> List[Path]:
         """Get list of files to analyze in a directory.
         
@@ -10,7 +10,7 @@ from collections import defaultdict
 import logging
 
 from .base_analyzer import BaseAnalyzer, AnalyzerContext
-from ..parser.xml_parser import XMLParser, XMLParseError
+from ..parser.xml_parser import XMLParseError
 from ..parser.endpoint_parser import EndpointParser, EndpointParseError
 
 logger = logging.getLogger(__name__)
@@ -32,7 +32,7 @@ class DuplicateAnalyzer(BaseAnalyzer):
             config: Analysis configuration
         """
         super().__init__(config)
-        self.xml_parser = XMLParser()
+        self.xml_parser = self._get_xml_parser()
         self.endpoint_parser = EndpointParser()
     
     def get_analyzer_name(self) -> str:
@@ -178,8 +178,10 @@ class DuplicateAnalyzer(BaseAnalyzer):
                 for xml_file in xml_files:
                     try:
                         # Extract element names for this tag
-                        element_names = self.xml_parser.extract_attribute_values(
-                            xml_file, tag_name, "name"
+                        element_names = self._get_cached_file_result(
+                            xml_file,
+                            lambda: self.xml_parser.extract_attribute_values(xml_file, tag_name, "name"),
+                            key=tag_name
                         )
                         
                         # Find duplicates within this file
@@ -250,7 +252,11 @@ class DuplicateAnalyzer(BaseAnalyzer):
             for xml_file in xml_files:
                 try:
                     # Get structured data from XML
-                    data_dicts = self.xml_parser.get_element_data_as_dict(xml_file)
+                    data_dicts = self._get_cached_file_result(
+                        xml_file,
+                        lambda: self.xml_parser.get_element_data_as_dict(xml_file),
+                        key="dataset"
+                    )
                     
                     if not data_dicts:
                         continue
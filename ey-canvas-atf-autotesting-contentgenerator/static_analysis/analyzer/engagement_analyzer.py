@@ -69,7 +69,10 @@ class EngagementAnalyzer(BaseAnalyzer):
         all_findings = []
         for file_path in python_files:
             try:
-                findings = self._scan_python_file(file_path)
+                findings = self._get_cached_file_result(
+                    file_path,
+                    lambda: self._scan_python_file(file_path)
+                )
                 all_findings.extend(findings)
                 context.files_processed += 1
                 
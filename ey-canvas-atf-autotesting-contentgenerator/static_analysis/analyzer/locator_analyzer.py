@@ -6,12 +6,12 @@ Tests/app_modules or Tests/test_cases are flagged as violations.
 """
 
 import re
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Set, Tuple, Iterable
 from pathlib import Path
 import logging
 
 from .base_analyzer import BaseAnalyzer, AnalyzerContext
-from ..parser.xml_parser import XMLParser, XMLParseError
+from ..parser.xml_parser import XMLParseError
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +55,7 @@ class LocatorAnalyzer(BaseAnalyzer):
             config: Analysis configuration
         """
         super().__init__(config)
-        self.xml_parser = XMLParser()
+        self.xml_parser = self._get_xml_parser()
     
     def get_analyzer_name(self) -> str:
         """Get the name of this analyzer."""
@@ -165,11 +165,14 @@ class LocatorAnalyzer(BaseAnalyzer):
         self.logger.debug(f"Analyzing XML file: {file_path}")
         
         try:
-            # Parse the XML file
-            parsed_xml = self.xml_parser.parse_file(file_path)
-            
-            # Find all parameter elements that might contain locators
-            locator_violations = self._find_locator_violations(parsed_xml, file_path)
+            # Stream the XML file and check all parameter elements that might contain locators
+            locator_violations = self._get_cached_file_result(
+                file_path,
+                lambda: self._find_locator_violations(
+                    self.xml_parser.iter_elements(file_path, {"parameter"}, {"name", "value"}),
+                    file_path
+                )
+            )
             
             # Convert violations to error messages
             for violation in locator_violations:
@@ -185,11 +188,11 @@ class LocatorAnalyzer(BaseAnalyzer):
             
         return errors
     
-    def _find_locator_violations(self, xml_element, file_path: Path) -> List[Dict[str, str]]:
-        """Recursively find parameter elements with direct locator violations.
+    def _find_locator_violations(self, parameter_elements: Iterable, file_path: Path) -> List[Dict[str, str]]:
+        """Find parameter elements with direct locator violations.
         
         Args:
-            xml_element: Parsed XML element to search
+            parameter_elements: Streamed parameter elements to check
             file_path: Path to source file for context
             
         Returns:
@@ -197,10 +200,9 @@ class LocatorAnalyzer(BaseAnalyzer):
         """
         violations = []
         
-        # Check if this is a parameter element with a locator-related name
-        if (xml_element.tag == 'parameter' and 
-            'name' in xml_element.attributes and
-            'value' in xml_element.attributes):
+        for xml_element in parameter_elements:
+            if 'name' not in xml_element.attributes or 'value' not in xml_element.attributes:
+                continue
             
             param_name = xml_element.attributes['name'].lower()
             param_value = xml_element.attributes['value']
@@ -212,11 +214,6 @@ class LocatorAnalyzer(BaseAnalyzer):
                         'parameter_name': xml_element.attributes['name'],
                         'value': param_value
                     })
-        
-        # Recursively check child elements
-        for child in xml_element.children:
-            child_violations = self._find_locator_violations(child, file_path)
-            violations.extend(child_violations)
             
         return violations
     
@@ -4,13 +4,12 @@ This module provides analysis capabilities for validating that test case referen
 in test suites actually exist and can be resolved correctly.
 """
 
-from typing import List, Dict, Any, Tuple, Set, Optional, Union
+from typing import List, Dict, Any, Tuple
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
 from .base_analyzer import BaseAnalyzer, AnalyzerContext
-from ..parser.xml_parser import XMLParser, XMLParseError
+from ..parser.symbol_index import KIND_TEST_CASE
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +35,7 @@ class ReferenceAnalyzer(BaseAnalyzer):
             config: Analysis configuration
         """
         super().__init__(config)
-        self.xml_parser = XMLParser()
-        self._test_file_cache: Dict[Path, Set[str]] = {}
+        self.symbol_index = self._get_symbol_index()
     
     def get_analyzer_name(self) -> str:
         """Get the name of this analyzer."""
@@ -83,25 +81,16 @@ class ReferenceAnalyzer(BaseAnalyzer):
                 warnings.append("No test suite files found to analyze")
                 return errors, warnings
             
-            # Analyze each test suite (can be parallelized for large codebases)
+            # Resolve every reference against the cross-file symbol index
             all_results = []
             
-            # Use ThreadPoolExecutor for concurrent processing
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                future_to_suite = {
-                    executor.submit(self._analyze_test_suite, suite_file): suite_file
-                    for suite_file in suite_files
-                }
-                
-                for future in as_completed(future_to_suite):
-                    suite_file = future_to_suite[future]
-                    try:
-                        suite_results = future.result()
-                        all_results.extend(suite_results)
-                        context.files_processed += 1
-                    except Exception as e:
-                        logger.error(f"Failed to analyze suite {suite_file}: {e}")
-                        errors.append(f"Failed to analyze test suite {suite_file.name}: {str(e)}")
+            for suite_file in suite_files:
+                try:
+                    all_results.extend(self._analyze_test_suite(suite_file))
+                    context.files_processed += 1
+                except Exception as e:
+                    logger.error(f"Failed to analyze suite {suite_file}: {e}")
+                    errors.append(f"Failed to analyze test suite {suite_file.name}: {str(e)}")
             
             # Process results and generate errors/warnings
             reference_errors, reference_warnings = self._process_validation_results(all_results)
@@ -130,46 +119,19 @@ class ReferenceAnalyzer(BaseAnalyzer):
         Returns:
             List of tuples (suite_file, test_file, test_case, status)
         """
-        results = []
+        parse_error = self.symbol_index.get_file_error(suite_file)
+        if parse_error:
+            logger.warning(f"Failed to parse test suite {suite_file}: {parse_error}")
+            return [(str(suite_file), "", "", self.STATUS_XML_PARSE_ERROR)]
         
-        try:
-            # Parse test suite and extract test case references
-            test_cases = self._extract_test_case_references(suite_file)
-            
-            for test_file, test_case_name in test_cases:
-                # Validate each test case reference
-                status = self._validate_test_case_exists(test_file, test_case_name)
-                results.append((str(suite_file), test_file, test_case_name, status))
-                
-        except XMLParseError as e:
-            logger.warning(f"Failed to parse test suite {suite_file}: {e}")
-            results.append((str(suite_file), "", "", self.STATUS_XML_PARSE_ERROR))
+        results = []
+        for reference in self.symbol_index.get_references(suite_file, KIND_TEST_CASE):
+            # Validate each test case reference
+            status = self._validate_test_case_exists(reference.file_key, reference.name)
+            results.append((str(suite_file), reference.file_key, reference.name, status))
         
         return results
     
-    def _extract_test_case_references(self, suite_file: Path) -> List[Tuple[str, str]]:
-        """Extract test case references from a test suite XML file.
-        
-        Args:
-            suite_file: Path to the test suite XML file
-            
-        Returns:
-            List of tuples (test_file, test_case_name)
-        """
-        test_cases = []
-        
-        # Parse the XML and look for test-case elements
-        elements = self.xml_parser.extract_elements_by_tag(suite_file, "test-case")
-        
-        for element in elements:
-            test_file = element.attributes.get("test-case-file", "")
-            test_case_name = element.attributes.get("test-case-name", "")
-            
-            if test_file and test_case_name:
-                test_cases.append((test_file, test_case_name))
-        
-        return test_cases
-    
     def _validate_test_case_exists(self, test_file: str, test_case_name: str) -> str:
         """Validate that a specific test case exists in the referenced file.
         
@@ -180,53 +142,15 @@ class ReferenceAnalyzer(BaseAnalyzer):
         Returns:
             Status string indicating the validation result
         """
-        # Load test cases from the file (with caching)
-        test_cases = self._load_test_cases_from_file(test_file)
-        
-        if isinstance(test_cases, str):
-            # Error status returned from loading
-            return test_cases
-        
-        # Check if the test case exists
-        return self.STATUS_FOUND if test_case_name in test_cases else self.STATUS_NOT_FOUND
-    
-    def _load_test_cases_from_file(self, test_file: str) -> Union[Set[str], str]:
-        """Load test cases from a test case XML file with caching.
-        
-        Args:
-            test_file: Name of the test case file
-            
-        Returns:
-            Set of test case names or error status string
-        """
-        cases_dir = self.config.directories.test_cases_dir
-        
-        # Try as given first
-        full_path = cases_dir / test_file
-        
-        # If file doesn't exist and doesn't end with .xml, try adding .xml
-        if not full_path.exists() and not test_file.lower().endswith('.xml'):
-            full_path = cases_dir / f"{test_file}.xml"
-        
-        # Check cache first
-        if full_path in self._test_file_cache:
-            return self._test_file_cache[full_path]
-        
-        if not full_path.exists():
+        if not self.symbol_index.has_file(KIND_TEST_CASE, test_file):
             return self.STATUS_FILE_NOT_FOUND
         
-        try:
-            # Extract test case names
-            test_case_names = set(
-                self.xml_parser.extract_attribute_values(full_path, "test-case", "name")
-            )
-            
-            # Cache the result
-            self._test_file_cache[full_path] = test_case_names
-            return test_case_names
-            
-        except XMLParseError:
+        if self.symbol_index.get_parse_error(KIND_TEST_CASE, test_file):
             return self.STATUS_XML_PARSE_ERROR
+        
+        if self.symbol_index.resolve(KIND_TEST_CASE, test_file, test_case_name):
+            return self.STATUS_FOUND
+        return self.STATUS_NOT_FOUND
     
     def _process_validation_results(self, results: List[Tuple[str, str, str, str]]) -> Tuple[List[str], List[str]]:
         """Process validation results and generate error/warning messages.
@@ -315,7 +239,7 @@ class ReferenceAnalyzer(BaseAnalyzer):
         return summary
     
     def _finalize_analysis(self, context: AnalyzerContext) -> Dict[str, Any]:
-        """Finalize reference analysis and clear caches.
+        """Finalize reference analysis and return metadata.
         
         Args:
             context: Analysis context
@@ -323,12 +247,8 @@ class ReferenceAnalyzer(BaseAnalyzer):
         Returns:
             Metadata dictionary with analysis summary
         """
-        # Clear the test file cache to free memory
-        cache_size = len(self._test_file_cache)
-        self._test_file_cache.clear()
-        
         return {
             "total_files_analyzed": context.files_processed,
             "analysis_type": "test_references",
-            "cache_entries_cleared": cache_size
-        }
\ No newline at end of file
+            "indexed_test_cases": len(self.symbol_index.get_definitions(KIND_TEST_CASE))
+        }
@@ -9,7 +9,7 @@ from pathlib import Path
 import logging
 
 from .base_analyzer import BaseAnalyzer, AnalyzerContext
-from ..parser.xml_parser import XMLParser, XMLParseError
+from ..parser.xml_parser import XMLParseError
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class SkipAnalyzer(BaseAnalyzer):
             config: Analysis configuration
         """
         super().__init__(config)
-        self.xml_parser = XMLParser()
+        self.xml_parser = self._get_xml_parser()
     
     def get_analyzer_name(self) -> str:
         """Get the name of this analyzer."""
@@ -180,29 +180,21 @@ class SkipAnalyzer(BaseAnalyzer):
         Raises:
             XMLParseError: If the file cannot be parsed
         """
-        root_element = self.xml_parser.parse_file(file_path)
-        return self._count_skips_recursive(root_element)
+        return self._get_cached_file_result(
+            file_path,
+            lambda: self._count_skips(self.xml_parser.iter_elements(file_path, attributes={"skip"}))
+        )
     
-    def _count_skips_recursive(self, element) -> int:
-        """Recursively count skip="true" attributes in an XML element tree.
+    def _count_skips(self, elements) -> int:
+        """Count skip="true" attributes in a stream of XML elements.
         
         Args:
-            element: XMLElement to analyze
+            elements: Iterable of XMLElement objects to analyze
             
         Returns:
-            Total count of skip="true" attributes in this element and its children
+            Total count of elements with a skip="true" attribute
         """
-        skip_count = 0
-        
-        # Check if this element has skip="true"
-        if element.attributes.get("skip") == "true":
-            skip_count += 1
-        
-        # Recursively check children
-        for child in element.children:
-            skip_count += self._count_skips_recursive(child)
-        
-        return skip_count
+        return sum(1 for element in elements if element.attributes.get("skip") == "true")
     
     def _finalize_analysis(self, context: AnalyzerContext) -> Dict[str, Any]:
         """Finalize skip analysis and return metadata.
@@ -9,7 +9,7 @@ from pathlib import Path
 import logging
 
 from .base_analyzer import BaseAnalyzer, AnalyzerContext
-from ..parser.xml_parser import XMLParser, XMLParseError
+from ..parser.xml_parser import XMLParseError
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class VariableAnalyzer(BaseAnalyzer):
             config: Analysis configuration
         """
         super().__init__(config)
-        self.xml_parser = XMLParser()
+        self.xml_parser = self._get_xml_parser()
     
     def get_analyzer_name(self) -> str:
         """Get the name of this analyzer."""
@@ -88,8 +88,14 @@ class VariableAnalyzer(BaseAnalyzer):
         warnings = []
         
         try:
-            # Parse the XML file and extract variable elements
-            variable_elements = self.xml_parser.extract_elements_by_tag(file_path, "variable")
+            # Parse the XML file and extract variable element attributes
+            variable_elements = self._get_cached_file_result(
+                file_path,
+                lambda: [
+                    element.attributes
+                    for element in self.xml_parser.extract_elements_by_tag(file_path, "variable")
+                ]
+            )
             
             if not variable_elements:
                 warnings.append(f"No variable elements found in {file_path.name}")
@@ -100,9 +106,9 @@ class VariableAnalyzer(BaseAnalyzer):
             invalid_variables = []
             
             for variable in variable_elements:
-                var_name = variable.attributes.get("name", "")
-                var_value = variable.attributes.get("value", "")
-                var_vtype = variable.attributes.get("vtype", "")
+                var_name = variable.get("name", "")
+                var_value = variable.get("value", "")
+                var_vtype = variable.get("vtype", "")
                 
                 # Validate variable structure
                 if not var_name:
@@ -6,7 +6,7 @@ package, replacing hard-coded values with configurable settings.
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
 
 
@@ -21,6 +21,7 @@ class DirectoryConfig:
     test_suites_dir: Path = Path("Tests/test_suites")
     api_constants_dir: Path = Path("Tests/resources/constants/api")
     dataset_dir: Path = Path("Tests/resources/dataset")
+    page_object_dir: Path = Path("Tests/page_object")
     variables_file: Path = Path("Tests/resources/variable/var.xml")
     custom_methods_dir: Path = Path("Tests/custom_methods")
     
@@ -30,7 +31,8 @@ class DirectoryConfig:
             self.base_path = Path.cwd() / self.base_path
             
         for field_name in ["test_cases_dir", "app_modules_dir", "test_suites_dir", 
-                          "api_constants_dir", "dataset_dir", "variables_file", "custom_methods_dir"]:
+                          "api_constants_dir", "dataset_dir", "page_object_dir",
+                          "variables_file", "custom_methods_dir"]:
             current_path = getattr(self, field_name)
             if not current_path.is_absolute():
                 setattr(self, field_name, self.base_path / current_path)
@@ -88,6 +90,26 @@ class AnalysisConfig:
     # Dataset file exclusions
     dataset_exclusions: List[str] = None
     
+    # Shared XML artifact store (XMLArtifactStore), created per run when unset
+    xml_store: Optional[Any] = None
+    
+    # Persistent incremental findings cache
+    cache_enabled: bool = True
+    rebuild_cache: bool = False
+    cache_dir: Path = Path(".static_analysis_cache")
+    
+    # Findings cache instance (FindingsCache), created per run when unset
+    findings_cache: Optional[Any] = None
+    
+    # Cross-file symbol index (SymbolIndex), created per run when unset
+    symbol_index: Optional[Any] = None
+    
+    # Analyzer scheduling: max_workers <= 1 runs analyzers sequentially,
+    # executor_type selects a "thread" pool (sharing xml_store) or a
+    # "process" pool (workers get a copy of the pre-parsed xml_store)
+    max_workers: int = 4
+    executor_type: str = "thread"
+    
     def __post_init__(self):
         """Set default values for optional fields."""
         if self.xml_file_patterns is None:
@@ -167,6 +189,26 @@ def load_config_from_env() -> AnalysisConfig:
             except ValueError:
                 pass  # Ignore invalid values, keep default
                 
+    # Override incremental cache settings from environment
+    if os.getenv("STATIC_ANALYSIS_NO_CACHE", "").lower() in ("1", "true", "yes"):
+        config.cache_enabled = False
+        
+    cache_dir = os.getenv("STATIC_ANALYSIS_CACHE_DIR")
+    if cache_dir:
+        config.cache_dir = Path(cache_dir)
+        
+    # Override analyzer scheduling from environment
+    max_workers = os.getenv("STATIC_ANALYSIS_MAX_WORKERS")
+    if max_workers is not None:
+        try:
+            config.max_workers = int(max_workers)
+        except ValueError:
+            pass  # Ignore invalid values, keep default
+            
+    executor_type = os.getenv("STATIC_ANALYSIS_EXECUTOR")
+    if executor_type:
+        config.executor_type = executor_type.lower()
+        
     # Override logging from environment
     log_level = os.getenv("STATIC_ANALYSIS_LOG_LEVEL")
     if log_level:
@@ -4,16 +4,20 @@ This module provides the primary interface for running static analysis
 checks on the Canvas automation framework.
 """
 
+import argparse
 import time
 import logging
 import sys
 from typing import List, Optional
 from pathlib import Path
 
-from . import AnalysisResult, AnalysisReport
+from . import AnalysisReport, __version__
 from .config import load_default_config, load_config_from_env, AnalysisConfig
 from .analyzer import DuplicateAnalyzer, SkipAnalyzer, ReferenceAnalyzer, VariableAnalyzer, EngagementAnalyzer, GitignoreAnalyzer, LocatorAnalyzer, ReadmeAnalyzer
+from .parser import XMLArtifactStore, SymbolIndex
 from .reporter import ConsoleReporter
+from .scheduler import AnalyzerScheduler, EXECUTOR_PROCESS, EXECUTOR_THREAD
+from .utils import FindingsCache
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +80,111 @@ def create_analyzers(config: AnalysisConfig) -> List:
     return analyzers
 
 
+def get_cache_dir(config: AnalysisConfig) -> Path:
+    """Get the absolute incremental cache directory.
+    
+    Args:
+        config: Analysis configuration
+        
+    Returns:
+        Cache directory (relative paths are resolved against the base path)
+    """
+    cache_dir = config.cache_dir
+    if not cache_dir.is_absolute():
+        cache_dir = config.directories.base_path / cache_dir
+    return cache_dir
+
+
+def create_findings_cache(config: AnalysisConfig) -> FindingsCache:
+    """Create the persistent findings cache based on configuration.
+    
+    Args:
+        config: Analysis configuration
+        
+    Returns:
+        Findings cache instance (disabled if caching is turned off)
+    """
+    return FindingsCache(
+        get_cache_dir(config),
+        tool_version=__version__,
+        enabled=config.cache_enabled,
+        rebuild=config.rebuild_cache
+    )
+
+
+def create_symbol_index(config: AnalysisConfig) -> SymbolIndex:
+    """Create the cross-file symbol index and bring it up to date.
+    
+    When caching is enabled the previously saved index is loaded from the
+    cache directory, so only changed files are rescanned.
+    
+    Args:
+        config: Analysis configuration
+        
+    Returns:
+        Up-to-date symbol index
+    """
+    if config.cache_enabled and not config.rebuild_cache:
+        symbol_index = SymbolIndex.load(get_symbol_index_path(config), config.directories)
+    else:
+        symbol_index = SymbolIndex(config.directories)
+    
+    stats = symbol_index.update(config.xml_store)
+    logger.info(f"Symbol index: {stats['scanned']} files scanned, {stats['reused']} reused")
+    return symbol_index
+
+
+def get_symbol_index_path(config: AnalysisConfig) -> Path:
+    """Get the file the symbol index is persisted to.
+    
+    Args:
+        config: Analysis configuration
+        
+    Returns:
+        Path of the serialized symbol index
+    """
+    return get_cache_dir(config) / "symbol_index.json"
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m static_analysis.main",
+        description="Run static analysis checks on the Canvas automation framework"
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyze every file and do not read or write the incremental cache"
+    )
+    cache_group.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Ignore existing cached findings and rebuild the incremental cache"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of analyzers to run concurrently (1 runs them sequentially)"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=[EXECUTOR_PROCESS, EXECUTOR_THREAD],
+        default=None,
+        help="Pool type used when running analyzers concurrently"
+    )
+    return parser.parse_args(argv)
+
+
 def run_all_checks(config: Optional[AnalysisConfig] = None) -> AnalysisReport:
     """Run all available static analysis checks.
     
@@ -96,6 +205,19 @@ def run_all_checks(config: Optional[AnalysisConfig] = None) -> AnalysisReport:
     
     logger.info("Starting static analysis")
     
+    # Share one XML artifact store across all analyzers for this run
+    if config.xml_store is None:
+        config.xml_store = XMLArtifactStore()
+    config.xml_store.reset_stats()
+    
+    # Reuse per-file findings from previous runs for unchanged files
+    if config.findings_cache is None:
+        config.findings_cache = create_findings_cache(config)
+    
+    # Index all definitions and references once for every reference check
+    if config.symbol_index is None:
+        config.symbol_index = create_symbol_index(config)
+    
     # Create reporter
     reporter = ConsoleReporter()
     
@@ -114,29 +236,12 @@ def run_all_checks(config: Optional[AnalysisConfig] = None) -> AnalysisReport:
     
     # Run analysis
     start_time = time.time()
-    results = []
+    results = AnalyzerScheduler(config).run(analyzers, reporter)
     
-    for analyzer in analyzers:
-        try:
-            reporter.report_check_start(analyzer.get_analyzer_name())
-            result = analyzer.analyze()
-            results.append(result)
-            reporter.report_check_result(result)
-            
-        except Exception as e:
-            error_msg = f"Analysis failed for {analyzer.get_analyzer_name()}: {str(e)}"
-            logger.error(error_msg)
-            
-            # Create a failed result
-            failed_result = AnalysisResult(
-                check_name=analyzer.get_analyzer_name(),
-                success=False,
-                errors=[error_msg],
-                warnings=[],
-                metadata={"execution_time": 0.0, "files_processed": 0}
-            )
-            results.append(failed_result)
-            reporter.report_check_result(failed_result)
+    # Persist findings and the symbol index for the next run
+    config.findings_cache.save()
+    if config.cache_enabled:
+        config.symbol_index.save(get_symbol_index_path(config))
     
     # Create final report
     execution_time = time.time() - start_time
@@ -147,7 +252,9 @@ def run_all_checks(config: Optional[AnalysisConfig] = None) -> AnalysisReport:
         results=results,
         total_errors=total_errors,
         total_warnings=total_warnings,
-        execution_time=execution_time
+        execution_time=execution_time,
+        parse_stats=config.xml_store.get_stats(),
+        cache_stats=config.findings_cache.get_stats()
     )
     
     # Report final results
@@ -158,15 +265,28 @@ def run_all_checks(config: Optional[AnalysisConfig] = None) -> AnalysisReport:
     return report
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for command-line execution.
     
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    args = parse_arguments(argv)
+    
     try:
         # Load configuration
         config = load_config_from_env()
+        if args.no_cache:
+            config.cache_enabled = False
+        if args.rebuild_cache:
+            config.rebuild_cache = True
+        if args.workers is not None:
+            config.max_workers = args.workers
+        if args.executor is not None:
+            config.executor_type = args.executor
         
         # Run analysis
         report = run_all_checks(config)
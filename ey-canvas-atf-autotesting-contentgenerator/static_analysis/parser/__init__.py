@@ -5,11 +5,17 @@ used in the Canvas automation framework.
 """
 
 from .xml_parser import XMLParser, XMLParseError
+from .artifact_store import XMLArtifactStore
+from .symbol_index import SymbolIndex, Symbol, SymbolReference
 from .endpoint_parser import EndpointParser, EndpointParseError
 
 __all__ = [
     "XMLParser",
     "XMLParseError", 
+    "XMLArtifactStore",
+    "SymbolIndex",
+    "Symbol",
+    "SymbolReference",
     "EndpointParser",
     "EndpointParseError"
 ]
\ No newline at end of file
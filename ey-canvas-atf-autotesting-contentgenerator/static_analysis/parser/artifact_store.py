@@ -0,0 +1,264 @@
+"""Shared store of parsed XML artifacts for a static analysis run.
+
+This module provides a process-wide XML artifact store that parses each file
+at most once per run and hands the same parsed tree to every analyzer that
+asks for it, while keeping per-file hit/miss counters for reporting.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Tuple, Union, Optional, Iterable, Iterator
+from threading import Lock
+import logging
+
+from .xml_parser import XMLParser, XMLElement, XMLParseError
+
+logger = logging.getLogger(__name__)
+
+# File, tags, attributes and line numbers of a streaming query
+StreamKey = Tuple[Path, Optional[FrozenSet[str]], Optional[FrozenSet[str]], bool]
+
+
+class XMLArtifactStore(XMLParser):
+    """XML parser shared by all analyzers in a single analysis run.
+
+    The store exposes the same interface as XMLParser so analyzers can use it
+    as a drop-in replacement. Concurrent requests for the same file are
+    serialized on a per-file lock so the file is only parsed once, and parse
+    failures are remembered until the file changes on disk.
+    
+    Streaming queries (iter_elements) are served from the parsed tree when a
+    file is already materialized. Otherwise the file is streamed from disk and
+    the elements are yielded as they are read. The elements of a query are
+    kept for the next identical query (same file, tags, attributes and line
+    numbers), as long as all the kept elements stay under
+    stream_cache_max_elements; least recently used queries are dropped first.
+    """
+
+    def __init__(self, cache_max_size: int = 10000, stream_cache_max_elements: int = 100000):
+        """Initialize the artifact store.
+
+        Args:
+            cache_max_size: Maximum number of parsed files to keep in memory
+            stream_cache_max_elements: Maximum number of streamed elements to keep in memory
+        """
+        super().__init__(cache_enabled=True, cache_max_size=cache_max_size)
+        self._file_locks: Dict[Path, Lock] = {}
+        self._file_locks_lock = Lock()
+        self._failures: Dict[Path, Tuple[float, XMLParseError]] = {}
+        self._stream_cache_max_elements = stream_cache_max_elements
+        self._streamed: "OrderedDict[StreamKey, Tuple[Optional[float], List[XMLElement]]]" = OrderedDict()
+        self._streamed_elements = 0
+        self._stats: Dict[Path, Dict[str, int]] = {}
+        self._stats_lock = Lock()
+
+    def parse_file(self, file_path: Union[str, Path], encoding: str = "utf-8") -> XMLElement:
+        """Parse an XML file once and return the shared parsed tree.
+
+        Args:
+            file_path: Path to the XML file to parse
+            encoding: File encoding to use
+
+        Returns:
+            Parsed XML element tree
+
+        Raises:
+            XMLParseError: If the file cannot be parsed
+            FileNotFoundError: If the file does not exist
+        """
+        file_path = Path(file_path).resolve()
+
+        with self._get_file_lock(file_path):
+            if file_path.exists():
+                cached_element = self._get_from_cache(file_path)
+                if cached_element is not None:
+                    self._record(file_path, "hits")
+                    return cached_element
+
+                cached_failure = self._get_failure(file_path)
+                if cached_failure is not None:
+                    self._record(file_path, "hits")
+                    raise cached_failure
+
+            self._record(file_path, "misses")
+
+            try:
+                return super().parse_file(file_path, encoding)
+            except XMLParseError as e:
+                self._failures[file_path] = (file_path.stat().st_mtime, e)
+                raise
+
+    def iter_elements(self, file_path: Union[str, Path], tags: Optional[Iterable[str]] = None,
+                      attributes: Optional[Iterable[str]] = None,
+                      line_numbers: bool = False) -> Iterator[XMLElement]:
+        """Stream elements from a file, reusing its parsed tree or a kept identical query when available.
+
+        Parsed trees carry no line numbers, so requests for line numbers are
+        always streamed from the file (or served from a kept query).
+
+        Args:
+            file_path: Path to the XML file
+            tags: Tag names to yield (None yields every element)
+            attributes: Attribute names to keep on yielded elements (None keeps all)
+            line_numbers: Whether to fill in line_number on yielded elements
+
+        Yields:
+            Matching elements; children are only populated when served from a parsed tree
+        """
+        file_path = Path(file_path).resolve()
+
+        cached_element = None
+        if not line_numbers and file_path.exists():
+            with self._get_file_lock(file_path):
+                cached_element = self._get_from_cache(file_path)
+
+        tags = set(tags) if tags is not None else None
+
+        if cached_element is not None:
+            self._record(file_path, "hits")
+            for element in self._walk(cached_element):
+                if tags is None or element.tag in tags:
+                    yield element
+            return
+
+        attributes = frozenset(attributes) if attributes is not None else None
+        key = (file_path, frozenset(tags) if tags is not None else None, attributes, line_numbers)
+        mtime = file_path.stat().st_mtime if file_path.exists() else None
+
+        cached_elements = self._get_streamed(key, mtime)
+        if cached_elements is not None:
+            self._record(file_path, "hits")
+            yield from cached_elements
+            return
+
+        self._record(file_path, "streams")
+        # Elements are kept while they fit in the cache and only stored once the whole file was streamed
+        elements: Optional[List[XMLElement]] = []
+        for element in super().iter_elements(file_path, tags, attributes, line_numbers):
+            if elements is not None:
+                if len(elements) < self._stream_cache_max_elements:
+                    elements.append(element)
+                else:
+                    elements = None
+            yield element
+        if elements is not None:
+            self._put_streamed(key, mtime, elements)
+
+    def _get_streamed(self, key: "StreamKey", mtime: Optional[float]) -> Optional[List[XMLElement]]:
+        """Get the kept elements of a streaming query if the file has not changed since."""
+        with self._cache_lock:
+            streamed = self._streamed.get(key)
+            if streamed is None:
+                return None
+            if streamed[0] != mtime:
+                self._streamed_elements -= len(self._streamed.pop(key)[1])
+                return None
+            self._streamed.move_to_end(key)
+            return streamed[1]
+
+    def _put_streamed(self, key: "StreamKey", mtime: Optional[float], elements: List[XMLElement]) -> None:
+        """Keep the elements of a streaming query, dropping the least recently used ones over the element bound."""
+        with self._cache_lock:
+            if key in self._streamed:
+                self._streamed_elements -= len(self._streamed.pop(key)[1])
+            while self._streamed and self._streamed_elements + len(elements) > self._stream_cache_max_elements:
+                _, (_, dropped) = self._streamed.popitem(last=False)
+                self._streamed_elements -= len(dropped)
+            self._streamed[key] = (mtime, elements)
+            self._streamed_elements += len(elements)
+
+    def preload(self, file_paths: Iterable[Union[str, Path]]) -> None:
+        """Parse files ahead of the analyzers, e.g. before handing the store to worker processes.
+
+        Files that cannot be parsed are skipped; the failure is remembered and
+        raised again to the analyzer that requests the file.
+
+        Args:
+            file_paths: Paths of the XML files to parse
+        """
+        for file_path in file_paths:
+            try:
+                self.parse_file(file_path)
+            except (XMLParseError, OSError):
+                continue
+
+    def __getstate__(self) -> Dict:
+        """Drop the locks so the store, with its parsed trees, can be sent to worker processes."""
+        state = self.__dict__.copy()
+        for name in ("_cache_lock", "_file_locks", "_file_locks_lock", "_stats_lock"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore a store received by a worker process with fresh locks."""
+        self.__dict__.update(state)
+        self._cache_lock = Lock()
+        self._file_locks = {}
+        self._file_locks_lock = Lock()
+        self._stats_lock = Lock()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-file hit/miss/stream counters.
+
+        Returns:
+            Dictionary mapping file paths to their hit, miss and stream counts
+        """
+        with self._stats_lock:
+            return {
+                str(file_path): dict(counters)
+                for file_path, counters in sorted(self._stats.items())
+            }
+
+    def merge_stats(self, stats: Dict[str, Dict[str, int]]) -> None:
+        """Merge hit/miss counters collected by another store (e.g. a worker process).
+
+        Args:
+            stats: Per-file counters as returned by get_stats()
+        """
+        with self._stats_lock:
+            for file_path, counters in stats.items():
+                merged = self._stats.setdefault(Path(file_path), {"hits": 0, "misses": 0, "streams": 0})
+                for counter, value in counters.items():
+                    merged[counter] = merged.get(counter, 0) + value
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters without dropping parsed artifacts."""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def clear_cache(self) -> None:
+        """Clear parsed artifacts, remembered failures and counters."""
+        super().clear_cache()
+        self._failures.clear()
+        with self._cache_lock:
+            self._streamed.clear()
+            self._streamed_elements = 0
+        self.reset_stats()
+
+    def _get_file_lock(self, file_path: Path) -> Lock:
+        """Get the lock guarding parsing of a single file."""
+        with self._file_locks_lock:
+            if file_path not in self._file_locks:
+                self._file_locks[file_path] = Lock()
+            return self._file_locks[file_path]
+
+    def _get_failure(self, file_path: Path) -> Union[XMLParseError, None]:
+        """Get a remembered parse failure if the file has not changed since."""
+        if file_path not in self._failures:
+            return None
+
+        failed_mtime, error = self._failures[file_path]
+        try:
+            if file_path.stat().st_mtime == failed_mtime:
+                return error
+        except OSError:
+            pass
+
+        del self._failures[file_path]
+        return None
+
+    def _record(self, file_path: Path, counter: str) -> None:
+        """Increment a hit/miss/stream counter for a file."""
+        with self._stats_lock:
+            counters = self._stats.setdefault(file_path, {"hits": 0, "misses": 0, "streams": 0})
+            counters[counter] += 1
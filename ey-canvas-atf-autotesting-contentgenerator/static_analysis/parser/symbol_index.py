@@ -0,0 +1,507 @@
+"""Cross-file symbol index for the Canvas automation framework.
+
+This module builds an index of every test case, app module, page object element
+and dataset row defined in the framework's XML files, together with every
+reference to them, so reference checks become dictionary lookups instead of
+on-demand file loads. The index is serializable and updated incrementally
+based on file content hashes.
+"""
+
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Union
+from collections import defaultdict
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+
+from .xml_parser import XMLParser, XMLElement, XMLParseError
+
+logger = logging.getLogger(__name__)
+
+# Symbol kinds
+KIND_TEST_CASE = "test-case"
+KIND_APP_MODULE = "app-module"
+KIND_PAGE_OBJECT = "page-object"
+KIND_DATASET_ROW = "dataset-row"
+
+# Directory roles
+ROLE_TEST_SUITES = "test_suites"
+ROLE_TEST_CASES = "test_cases"
+ROLE_APP_MODULES = "app_modules"
+ROLE_PAGE_OBJECTS = "page_objects"
+ROLE_DATASETS = "datasets"
+
+# <%elm:PageObjectFile:ElementName%> reference inside a parameter value
+ELEMENT_REFERENCE_PATTERN = re.compile(r"<%elm:([^:%]+):([^%]+)%>")
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A named definition in the framework.
+
+    Attributes:
+        kind: Symbol kind (test-case, app-module, page-object, dataset-row)
+        file_key: Key of the defining file as used by references: its path relative to the directory of its
+            kind (e.g. 'login.xml', 'reports/dashboard')
+        name: Symbol name
+        file_path: Defining file, relative to the base path
+        line: Line number of the definition
+    """
+    kind: str
+    file_key: str
+    name: str
+    file_path: str
+    line: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SymbolReference:
+    """A reference from one file to a symbol.
+
+    Attributes:
+        kind: Kind of the referenced symbol
+        file_key: Key of the file the symbol is expected in
+        name: Referenced symbol name
+        source_file: Referencing file, relative to the base path
+        line: Line number of the reference
+    """
+    kind: str
+    file_key: str
+    name: str
+    source_file: str
+    line: Optional[int] = None
+
+
+class SymbolIndex:
+    """Index of symbol definitions and references across framework XML files.
+
+    The index covers test suites, test cases, app modules, page objects and
+    datasets. Each file is scanned in a single streaming pass; on update only
+    files whose content hash changed are rescanned. All lookups are O(1).
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, directories):
+        """Initialize an empty symbol index.
+
+        Args:
+            directories: DirectoryConfig with the framework directories
+        """
+        self.directories = directories
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._definitions: Dict[Tuple[str, str, str], List[Symbol]] = {}
+        self._file_keys: Dict[Tuple[str, str], str] = {}
+        self._usages: Dict[Tuple[str, str, str], List[SymbolReference]] = {}
+        self._references_by_source: Dict[str, List[SymbolReference]] = {}
+
+    def normalize_file_key(self, kind: str, file_name: str) -> str:
+        """Normalize a file name the way references to a symbol kind use it.
+
+        References are relative to the directory of the symbol kind, and may
+        start with that directory (e.g. 'app_modules/login.xml'), which is
+        dropped. Subdirectories are kept, so files with the same name in
+        different folders get different keys.
+
+        Args:
+            kind: Symbol kind
+            file_name: File name or path as written in the referencing file
+
+        Returns:
+            Normalized file key
+        """
+        parts = [part for part in file_name.replace("\\", "/").split("/") if part not in ("", ".")]
+        directory = self._get_kind_directory(kind)
+        if len(parts) > 1 and directory is not None and parts[0] == directory.name:
+            parts = parts[1:]
+        file_name = "/".join(parts)
+
+        if kind == KIND_PAGE_OBJECT:
+            return file_name[:-4] if file_name.lower().endswith(".xml") else file_name
+
+        if kind == KIND_TEST_CASE and not file_name.lower().endswith(".xml"):
+            return f"{file_name}.xml"
+
+        return file_name
+
+    def update(self, xml_parser: Optional[XMLParser] = None) -> Dict[str, int]:
+        """Bring the index up to date with the files on disk.
+
+        Args:
+            xml_parser: Parser used to stream changed files (defaults to a new XMLParser)
+
+        Returns:
+            Dictionary with scanned, reused and removed file counts
+        """
+        xml_parser = xml_parser or XMLParser()
+        stats = {"scanned": 0, "reused": 0, "removed": 0}
+        seen = set()
+
+        for role, directory in self._get_role_directories():
+            if not directory.exists():
+                continue
+
+            for file_path in sorted(directory.rglob("*.xml")):
+                relative_path = self._relative_path(file_path)
+                seen.add(relative_path)
+
+                content_hash = self._hash_file(file_path)
+                record = self._files.get(relative_path)
+
+                if record and record["hash"] == content_hash and record["role"] == role:
+                    stats["reused"] += 1
+                    continue
+
+                self._files[relative_path] = self._scan_file(file_path, relative_path, role,
+                                                             content_hash, xml_parser)
+                stats["scanned"] += 1
+
+        for relative_path in list(self._files):
+            if relative_path not in seen:
+                del self._files[relative_path]
+                stats["removed"] += 1
+
+        self._rebuild_lookups()
+        logger.debug(f"Symbol index updated: {stats}")
+        return stats
+
+    def resolve(self, kind: str, file_key: str, name: str) -> List[Symbol]:
+        """Find the definitions of a symbol.
+
+        Args:
+            kind: Symbol kind
+            file_key: File key as written in the reference (normalized automatically)
+            name: Symbol name
+
+        Returns:
+            Matching definitions (more than one means a duplicate definition)
+        """
+        file_key = self.normalize_file_key(kind, file_key)
+        return self._definitions.get((kind, file_key, name), [])
+
+    def has_file(self, kind: str, file_key: str) -> bool:
+        """Check whether a file defining symbols of a kind exists.
+
+        Args:
+            kind: Symbol kind
+            file_key: File key as written in the reference
+
+        Returns:
+            True if the file is part of the index
+        """
+        return (kind, self.normalize_file_key(kind, file_key)) in self._file_keys
+
+    def get_parse_error(self, kind: str, file_key: str) -> Optional[str]:
+        """Get the parse error recorded for a defining file, if any.
+
+        Args:
+            kind: Symbol kind
+            file_key: File key as written in the reference
+
+        Returns:
+            Parse error message, or None if the file parsed (or is unknown)
+        """
+        relative_path = self._file_keys.get((kind, self.normalize_file_key(kind, file_key)))
+        return self.get_file_error(relative_path) if relative_path else None
+
+    def get_file_error(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Get the parse error recorded for an indexed file.
+
+        Args:
+            file_path: File path (strings are taken as relative to the base path)
+
+        Returns:
+            Parse error message, or None
+        """
+        if isinstance(file_path, Path):
+            file_path = self._relative_path(file_path)
+        record = self._files.get(file_path)
+        return record["error"] if record else None
+
+    def find_usages(self, kind: str, file_key: str, name: str) -> List[SymbolReference]:
+        """Find all references to a symbol.
+
+        Args:
+            kind: Symbol kind
+            file_key: File key of the symbol (normalized automatically)
+            name: Symbol name
+
+        Returns:
+            References to the symbol in scan order
+        """
+        file_key = self.normalize_file_key(kind, file_key)
+        return self._usages.get((kind, file_key, name), [])
+
+    def get_references(self, source_file: Optional[Path] = None,
+                       kind: Optional[str] = None) -> List[SymbolReference]:
+        """Get references, optionally restricted to one source file or kind.
+
+        Args:
+            source_file: Referencing file (absolute or relative to the base path)
+            kind: Symbol kind to filter on
+
+        Returns:
+            Matching references
+        """
+        if source_file is not None:
+            references = self._references_by_source.get(self._relative_path(Path(source_file)), [])
+        else:
+            references = [ref for refs in self._references_by_source.values() for ref in refs]
+
+        return [ref for ref in references if kind is None or ref.kind == kind]
+
+    def get_unresolved_references(self, kind: Optional[str] = None) -> List[SymbolReference]:
+        """Get references whose target symbol is not defined.
+
+        Args:
+            kind: Symbol kind to filter on
+
+        Returns:
+            Unresolved references
+        """
+        return [
+            ref for ref in self.get_references(kind=kind)
+            if (ref.kind, ref.file_key, ref.name) not in self._definitions
+        ]
+
+    def get_definitions(self, kind: Optional[str] = None) -> List[Symbol]:
+        """Get all definitions, optionally restricted to one kind.
+
+        Args:
+            kind: Symbol kind to filter on
+
+        Returns:
+            Matching definitions
+        """
+        return [
+            symbol
+            for (symbol_kind, _, _), symbols in self._definitions.items()
+            if kind is None or symbol_kind == kind
+            for symbol in symbols
+        ]
+
+    def save(self, file_path: Path) -> None:
+        """Serialize the index to a JSON file.
+
+        Args:
+            file_path: Destination file
+        """
+        file_path = Path(file_path)
+        payload = {
+            "format_version": self.FORMAT_VERSION,
+            "base_path": str(self.directories.base_path),
+            "files": self._files
+        }
+
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = file_path.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as file:
+                json.dump(payload, file)
+            os.replace(temp_file, file_path)
+        except OSError as e:
+            logger.warning(f"Failed to save symbol index to {file_path}: {e}")
+
+    @classmethod
+    def load(cls, file_path: Path, directories) -> "SymbolIndex":
+        """Load a serialized index, falling back to an empty one.
+
+        The loaded index still has to be brought up to date with update().
+
+        Args:
+            file_path: Serialized index file
+            directories: DirectoryConfig with the framework directories
+
+        Returns:
+            Symbol index
+        """
+        index = cls(directories)
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            return index
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                payload = json.load(file)
+
+            if (payload.get("format_version") == cls.FORMAT_VERSION and
+                    payload.get("base_path") == str(directories.base_path)):
+                index._files = payload.get("files", {})
+                index._rebuild_lookups()
+            else:
+                logger.debug(f"Discarding outdated symbol index {file_path}")
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable symbol index {file_path}: {e}")
+            index._files = {}
+            index._rebuild_lookups()
+
+        return index
+
+    def _get_role_directories(self) -> List[Tuple[str, Path]]:
+        """Get the directories covered by the index and their roles."""
+        return [
+            (ROLE_TEST_SUITES, self.directories.test_suites_dir),
+            (ROLE_TEST_CASES, self.directories.test_cases_dir),
+            (ROLE_APP_MODULES, self.directories.app_modules_dir),
+            (ROLE_PAGE_OBJECTS, self.directories.page_object_dir),
+            (ROLE_DATASETS, self.directories.dataset_dir)
+        ]
+
+    def _scan_file(self, file_path: Path, relative_path: str, role: str,
+                   content_hash: Optional[str], xml_parser: XMLParser) -> Dict[str, Any]:
+        """Scan one file for definitions and references in a single pass."""
+        definitions: List[Symbol] = []
+        references: List[SymbolReference] = []
+        error = None
+
+        try:
+            for element in xml_parser.iter_elements(file_path, line_numbers=True):
+                self._collect_symbols(element, role, file_path, relative_path, definitions, references)
+        except (XMLParseError, OSError) as e:
+            logger.warning(f"Failed to index {file_path}: {e}")
+            error = str(e)
+
+        return {
+            "role": role,
+            "hash": content_hash,
+            "file_key": self._file_key_for_role(role, file_path),
+            "error": error,
+            "definitions": [asdict(symbol) for symbol in definitions],
+            "references": [asdict(reference) for reference in references]
+        }
+
+    def _collect_symbols(self, element: XMLElement, role: str, file_path: Path, relative_path: str,
+                         definitions: List[Symbol], references: List[SymbolReference]) -> None:
+        """Extract definitions and references from a single streamed element."""
+        attributes = element.attributes
+        file_key = self._file_key_for_role(role, file_path)
+
+        def define(kind: str, name: Optional[str]) -> None:
+            if name:
+                definitions.append(Symbol(kind, file_key, name, relative_path, element.line_number))
+
+        def refer(kind: str, target_file: Optional[str], name: Optional[str]) -> None:
+            if target_file and name:
+                references.append(SymbolReference(
+                    kind, self.normalize_file_key(kind, target_file), name,
+                    relative_path, element.line_number
+                ))
+
+        if role == ROLE_TEST_SUITES:
+            if element.tag == "test-case":
+                refer(KIND_TEST_CASE, attributes.get("test-case-file"), attributes.get("test-case-name"))
+            return
+
+        if role == ROLE_PAGE_OBJECTS:
+            if element.tag == "element":
+                define(KIND_PAGE_OBJECT, attributes.get("element_keyword"))
+            return
+
+        if role == ROLE_DATASETS:
+            if element.tag == "ID":
+                define(KIND_DATASET_ROW, element.text)
+            return
+
+        # Test cases and app modules
+        if role == ROLE_TEST_CASES and element.tag == "test-case":
+            define(KIND_TEST_CASE, attributes.get("name"))
+            for data_index in self._parse_data_index(attributes.get("data_index", "")):
+                refer(KIND_DATASET_ROW, attributes.get("data_file"), data_index)
+
+        if element.tag == "app-module":
+            if "module-name" in attributes:
+                refer(KIND_APP_MODULE, attributes.get("file-name"), attributes.get("module-name"))
+            elif role == ROLE_APP_MODULES:
+                define(KIND_APP_MODULE, attributes.get("name"))
+
+        for value in attributes.values():
+            if "<%elm:" in value:
+                for page_object, element_name in ELEMENT_REFERENCE_PATTERN.findall(value):
+                    refer(KIND_PAGE_OBJECT, page_object, element_name)
+
+    def _parse_data_index(self, data_index: str) -> List[str]:
+        """Parse a test case data_index attribute (e.g. "['Row_1', 'Row_2']")."""
+        data_index = data_index.strip()
+        if not data_index:
+            return []
+
+        try:
+            parsed = ast.literal_eval(data_index)
+            if isinstance(parsed, (list, tuple)):
+                return [str(item) for item in parsed if item]
+            return [str(parsed)] if parsed else []
+        except (ValueError, SyntaxError):
+            return [item.strip(" '\"") for item in data_index.strip("[]").split(",") if item.strip(" '\"")]
+
+    def _file_key_for_role(self, role: str, file_path: Path) -> str:
+        """Get the key references use for a file in a given directory role."""
+        directory = dict(self._get_role_directories())[role]
+        try:
+            relative_path = file_path.resolve().relative_to(Path(directory).resolve())
+        except ValueError:
+            relative_path = Path(file_path.name)
+        if role == ROLE_PAGE_OBJECTS:
+            relative_path = relative_path.with_suffix("")
+        return relative_path.as_posix()
+
+    def _get_kind_directory(self, kind: str) -> Optional[Path]:
+        """Get the directory holding the files that define a symbol kind."""
+        return {
+            KIND_TEST_CASE: self.directories.test_cases_dir,
+            KIND_APP_MODULE: self.directories.app_modules_dir,
+            KIND_PAGE_OBJECT: self.directories.page_object_dir,
+            KIND_DATASET_ROW: self.directories.dataset_dir
+        }.get(kind)
+
+    def _rebuild_lookups(self) -> None:
+        """Rebuild the in-memory lookup tables from per-file records."""
+        definitions = defaultdict(list)
+        file_keys = {}
+        usages = defaultdict(list)
+        references_by_source = {}
+
+        role_kinds = {
+            ROLE_TEST_CASES: KIND_TEST_CASE,
+            ROLE_APP_MODULES: KIND_APP_MODULE,
+            ROLE_PAGE_OBJECTS: KIND_PAGE_OBJECT,
+            ROLE_DATASETS: KIND_DATASET_ROW
+        }
+
+        for relative_path, record in self._files.items():
+            kind = role_kinds.get(record["role"])
+            if kind:
+                file_keys[(kind, record["file_key"])] = relative_path
+
+            for symbol_data in record["definitions"]:
+                symbol = Symbol(**symbol_data)
+                definitions[(symbol.kind, symbol.file_key, symbol.name)].append(symbol)
+
+            source_references = [SymbolReference(**data) for data in record["references"]]
+            references_by_source[relative_path] = source_references
+            for reference in source_references:
+                usages[(reference.kind, reference.file_key, reference.name)].append(reference)
+
+        self._definitions = dict(definitions)
+        self._file_keys = file_keys
+        self._usages = dict(usages)
+        self._references_by_source = references_by_source
+
+    def _relative_path(self, file_path: Path) -> str:
+        """Get a file path relative to the base path, in POSIX form."""
+        try:
+            return file_path.resolve().relative_to(Path(self.directories.base_path).resolve()).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def _hash_file(self, file_path: Path) -> Optional[str]:
+        """Get the SHA-256 content hash of a file."""
+        try:
+            return hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
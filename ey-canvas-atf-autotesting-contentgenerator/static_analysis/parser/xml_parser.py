@@ -5,8 +5,9 @@ caching, and support for various XML structures used in the Canvas automation fr
 """
 
 import xml.etree.ElementTree as ET
+from xml.parsers import expat
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Any, Union
+from typing import List, Dict, Set, Optional, Any, Union, Iterator, Iterable
 import logging
 from dataclasses import dataclass
 from threading import Lock
@@ -122,6 +123,92 @@ class XMLParser:
         root_element = self.parse_file(file_path)
         return self._find_elements_by_tag(root_element, tag_name)
     
+    def iter_elements(self, file_path: Union[str, Path], tags: Optional[Iterable[str]] = None,
+                      attributes: Optional[Iterable[str]] = None,
+                      line_numbers: bool = False) -> Iterator[XMLElement]:
+        """Stream elements from an XML file without building the full tree.
+        
+        Elements are yielded as their closing tags are read, as childless
+        XMLElement objects, and cleared from the underlying parser as soon as
+        they have been copied, so memory use stays flat regardless of file size.
+        
+        ElementTree does not expose source positions, so when line numbers are
+        requested the file is streamed with the underlying expat parser instead.
+        
+        Args:
+            file_path: Path to the XML file
+            tags: Tag names to yield (None yields every element)
+            attributes: Attribute names to copy onto yielded elements (None copies all)
+            line_numbers: Whether to fill in line_number on yielded elements
+            
+        Yields:
+            Matching elements without children
+            
+        Raises:
+            XMLParseError: If the file cannot be parsed
+            FileNotFoundError: If the file does not exist
+        """
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"XML file not found: {file_path}")
+        
+        tags = set(tags) if tags is not None else None
+        attributes = set(attributes) if attributes is not None else None
+        
+        logger.debug(f"Streaming XML file: {file_path}")
+        
+        if line_numbers:
+            yield from self._iter_elements_with_line_numbers(file_path, tags, attributes)
+            return
+        
+        try:
+            depth = 0
+            root = None
+            
+            for event, element in ET.iterparse(file_path, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = element
+                    depth += 1
+                    continue
+                
+                depth -= 1
+                
+                if tags is None or element.tag in tags:
+                    yield self._copy_element(element, file_path, attributes)
+                
+                # Drop the element's content, and the emptied siblings once a
+                # top-level child of the root is complete
+                element.clear()
+                if depth == 1:
+                    del root[:]
+                    
+        except ET.ParseError as e:
+            raise XMLParseError(file_path, str(e))
+    
+    def collect_elements(self, file_path: Union[str, Path], tags: Iterable[str],
+                         attributes: Optional[Iterable[str]] = None,
+                         line_numbers: bool = False) -> Dict[str, List[XMLElement]]:
+        """Collect elements for several tags in a single streaming pass.
+        
+        Args:
+            file_path: Path to the XML file
+            tags: Tag names to collect
+            attributes: Attribute names to copy onto collected elements (None copies all)
+            line_numbers: Whether to fill in line_number on collected elements
+            
+        Returns:
+            Dictionary mapping each requested tag to its elements
+        """
+        tags = set(tags)
+        collected: Dict[str, List[XMLElement]] = {tag: [] for tag in tags}
+        
+        for element in self.iter_elements(file_path, tags, attributes, line_numbers):
+            collected[element.tag].append(element)
+            
+        return collected
+    
     def extract_attribute_values(self, file_path: Union[str, Path], 
                                 tag_name: str, attribute_name: str) -> List[str]:
         """Extract attribute values from elements with a specific tag.
@@ -134,7 +221,7 @@ class XMLParser:
         Returns:
             List of attribute values found
         """
-        elements = self.extract_elements_by_tag(file_path, tag_name)
+        elements = self.iter_elements(file_path, {tag_name}, {attribute_name})
         return [
             element.attributes.get(attribute_name, "")
             for element in elements
@@ -233,17 +320,94 @@ class XMLParser:
             line_number=parent_line  # Line numbers not easily available in ET
         )
     
-    def _find_elements_by_tag(self, element: XMLElement, tag_name: str) -> List[XMLElement]:
-        """Recursively find all elements with a specific tag name."""
-        found_elements = []
+    def _iter_elements_with_line_numbers(self, file_path: Path, tags: Optional[Set[str]],
+                                         attributes: Optional[Set[str]]) -> Iterator[XMLElement]:
+        """Stream elements with their starting line numbers using expat directly."""
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
         
-        if element.tag == tag_name:
-            found_elements.append(element)
-            
-        for child in element.children:
-            found_elements.extend(self._find_elements_by_tag(child, tag_name))
+        # Open element frames: [XMLElement or None, text parts, has child]
+        stack: List[list] = []
+        ready: List[XMLElement] = []
+        
+        def start_element(tag, attrib):
+            if stack:
+                stack[-1][2] = True
             
-        return found_elements
+            element = None
+            if tags is None or tag in tags:
+                if attributes is not None:
+                    attrib = {name: value for name, value in attrib.items() if name in attributes}
+                element = XMLElement(
+                    tag=tag,
+                    attributes=attrib,
+                    text=None,
+                    children=[],
+                    file_path=file_path,
+                    line_number=parser.CurrentLineNumber
+                )
+            stack.append([element, [], False])
+        
+        def character_data(data):
+            frame = stack[-1]
+            if frame[0] is not None and not frame[2]:
+                frame[1].append(data)
+        
+        def end_element(tag):
+            element, text_parts, _ = stack.pop()
+            if element is not None:
+                element.text = "".join(text_parts).strip() if text_parts else None
+                ready.append(element)
+        
+        parser.StartElementHandler = start_element
+        parser.CharacterDataHandler = character_data
+        parser.EndElementHandler = end_element
+        
+        try:
+            with open(file_path, "rb") as file:
+                for chunk in iter(lambda: file.read(65536), b""):
+                    parser.Parse(chunk, False)
+                    yield from ready
+                    ready.clear()
+                parser.Parse(b"", True)
+                yield from ready
+                
+        except expat.ExpatError as e:
+            raise XMLParseError(file_path, str(e))
+    
+    def _copy_element(self, element: ET.Element, file_path: Path,
+                      attributes: Optional[Set[str]] = None) -> XMLElement:
+        """Copy a single element (without children) into our XMLElement format."""
+        if attributes is None:
+            element_attributes = dict(element.attrib)
+        else:
+            element_attributes = {
+                name: value for name, value in element.attrib.items() if name in attributes
+            }
+        
+        return XMLElement(
+            tag=element.tag,
+            attributes=element_attributes,
+            text=element.text.strip() if element.text else None,
+            children=[],
+            file_path=file_path
+        )
+    
+    def _find_elements_by_tag(self, element: XMLElement, tag_name: str) -> List[XMLElement]:
+        """Find all elements with a specific tag name in document order."""
+        return [
+            descendant for descendant in self._walk(element)
+            if descendant.tag == tag_name
+        ]
+    
+    def _walk(self, element: XMLElement) -> Iterator[XMLElement]:
+        """Iterate over an element and all its descendants in document order."""
+        stack = [element]
+        
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(reversed(current.children))
     
     def _get_from_cache(self, file_path: Path) -> Optional[XMLElement]:
         """Get parsed XML from cache if available and fresh."""
@@ -195,21 +195,38 @@ class ConsoleReporter:
         summary_table.add_column("Errors", justify="center", style="red")
         summary_table.add_column("Warnings", justify="center", style="yellow")
         summary_table.add_column("Time (s)", justify="right", style="dim")
+        summary_table.add_column("CPU (s)", justify="right", style="dim")
         
         for result in report.results:
             status = "[green]✅ PASS[/green]" if result.success else "[red]❌ FAIL[/red]"
             execution_time = result.metadata.get("execution_time", 0)
+            cpu_time = result.metadata.get("cpu_time", 0)
             
             summary_table.add_row(
                 result.check_name,
                 status,
                 str(len(result.errors)),
                 str(len(result.warnings)),
-                f"{execution_time:.2f}"
+                f"{execution_time:.2f}",
+                f"{cpu_time:.2f}"
             )
         
         self.console.print(summary_table)
         
+        if report.parse_stats:
+            parse_summary = report.parse_summary
+            self.console.print(
+                f"[dim]🗂️ XML artifacts: {parse_summary['files']} files, "
+                f"{parse_summary['misses']} parses, {parse_summary['streams']} streamed reads, "
+                f"{parse_summary['hits']} cache hits[/dim]"
+            )
+        
+        if report.cache_stats.get("enabled"):
+            self.console.print(
+                f"[dim]♻️ Incremental cache: reused {report.cache_stats['reused']} of "
+                f"{report.cache_stats['files']} files[/dim]"
+            )
+        
         # Overall status panel
         if report.success:
             status_panel = Panel(
@@ -245,6 +262,16 @@ class ConsoleReporter:
         print(f"Total warnings: {report.total_warnings}")
         print(f"Execution time: {report.execution_time:.2f}s")
         
+        if report.parse_stats:
+            parse_summary = report.parse_summary
+            print(f"XML artifacts: {parse_summary['files']} files, "
+                  f"{parse_summary['misses']} parses, {parse_summary['streams']} streamed reads, "
+                  f"{parse_summary['hits']} cache hits")
+        
+        if report.cache_stats.get("enabled"):
+            print(f"Incremental cache: reused {report.cache_stats['reused']} of "
+                  f"{report.cache_stats['files']} files")
+        
         if report.success:
             print("\n✅ All checks passed!")
         else:
@@ -0,0 +1,215 @@
+"""Analyzer execution scheduler for static analysis.
+
+This module runs analyzers either sequentially or concurrently on a thread or
+process pool, while keeping reporter callbacks in the original analyzer order
+so console output stays deterministic regardless of completion order.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Type
+import logging
+import time
+
+from . import AnalysisResult
+from .config import AnalysisConfig
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_PROCESS = "process"
+EXECUTOR_THREAD = "thread"
+
+# Artifact store pre-parsed by the parent, received once per worker process
+_worker_xml_store = None
+
+
+def _init_worker(xml_store) -> None:
+    """Keep the parent's pre-parsed artifact store for the analyzers of this worker.
+
+    Args:
+        xml_store: Copy of the parent's XMLArtifactStore
+    """
+    global _worker_xml_store
+    _worker_xml_store = xml_store
+
+
+def _run_analyzer_in_process(analyzer_class: Type, config: AnalysisConfig) -> Tuple[AnalysisResult, Dict[str, Any]]:
+    """Run a single analyzer inside a worker process.
+
+    The worker reads the XML trees pre-parsed by the parent, so files are not
+    parsed again per analyzer. The findings cache cannot be shared across
+    processes, so each worker builds its own and sends the counters of both
+    back to the parent. Analyzers cache findings in their own namespaces, so
+    workers can persist their cache entries without overwriting each other.
+
+    Args:
+        analyzer_class: Analyzer class to instantiate
+        config: Analysis configuration without runtime objects
+
+    Returns:
+        Tuple of (analysis result, worker usage statistics)
+    """
+    from .main import create_findings_cache
+    from .parser import XMLArtifactStore
+
+    config.xml_store = _worker_xml_store if _worker_xml_store is not None else XMLArtifactStore()
+    config.xml_store.reset_stats()
+    config.findings_cache = create_findings_cache(config)
+
+    result = _run_timed(analyzer_class(config), time.process_time)
+    config.findings_cache.save()
+
+    usage = {
+        "parse_stats": config.xml_store.get_stats(),
+        "cache_usage": config.findings_cache.get_usage()
+    }
+    return result, usage
+
+
+def _run_timed(analyzer, cpu_clock) -> AnalysisResult:
+    """Run an analyzer and record its wall-clock and CPU time.
+
+    Args:
+        analyzer: Analyzer instance to run
+        cpu_clock: CPU clock matching the execution context (thread or process)
+
+    Returns:
+        Analysis result with wall_time and cpu_time metadata
+    """
+    wall_start = time.perf_counter()
+    cpu_start = cpu_clock()
+
+    result = analyzer.analyze()
+
+    result.metadata["wall_time"] = time.perf_counter() - wall_start
+    result.metadata["cpu_time"] = cpu_clock() - cpu_start
+    return result
+
+
+class AnalyzerScheduler:
+    """Scheduler that runs independent analyzers with bounded concurrency.
+
+    With max_workers <= 1 analyzers run sequentially in the calling thread.
+    Otherwise they are submitted to a thread pool (default), where every
+    analyzer shares the run's artifact store, or to a process pool, whose
+    workers receive the XML files pre-parsed by the parent. Results are
+    reported in submission order as they become available, so total time
+    approaches that of the slowest analyzer.
+    """
+
+    def __init__(self, config: AnalysisConfig):
+        """Initialize the scheduler.
+
+        Args:
+            config: Analysis configuration with max_workers and executor_type
+        """
+        self.config = config
+        self.max_workers = max(1, config.max_workers)
+        self.executor_type = config.executor_type
+
+        if self.executor_type not in (EXECUTOR_PROCESS, EXECUTOR_THREAD):
+            raise ValueError(f"Unknown executor type: {self.executor_type}")
+
+    def run(self, analyzers: List, reporter) -> List[AnalysisResult]:
+        """Run all analyzers and report their results in order.
+
+        Args:
+            analyzers: Analyzer instances to run
+            reporter: Reporter receiving check start/result callbacks
+
+        Returns:
+            Analysis results in the same order as the analyzers
+        """
+        if self.max_workers == 1 or len(analyzers) <= 1:
+            return self._run_sequential(analyzers, reporter)
+
+        workers = min(self.max_workers, len(analyzers))
+        logger.info(f"Running {len(analyzers)} analyzers on {workers} {self.executor_type} workers")
+
+        if self.executor_type == EXECUTOR_PROCESS:
+            xml_store = self.config.xml_store
+            if xml_store is not None:
+                xml_store.preload(self._get_xml_files())
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(xml_store,))
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+        with executor:
+            futures = [self._submit(executor, analyzer) for analyzer in analyzers]
+            return [
+                self._collect(analyzer, future, reporter)
+                for analyzer, future in zip(analyzers, futures)
+            ]
+
+    def _run_sequential(self, analyzers: List, reporter) -> List[AnalysisResult]:
+        """Run analyzers one after another in the calling thread."""
+        results = []
+
+        for analyzer in analyzers:
+            reporter.report_check_start(analyzer.get_analyzer_name())
+            try:
+                result = _run_timed(analyzer, time.thread_time)
+            except Exception as e:
+                result = self._create_failed_result(analyzer, e)
+            results.append(result)
+            reporter.report_check_result(result)
+
+        return results
+
+    def _get_xml_files(self) -> List[Path]:
+        """Get the XML files read by the analyzers, to pre-parse them once in the parent."""
+        directories = self.config.directories
+        files = [directories.variables_file] if directories.variables_file.exists() else []
+        for directory in (directories.test_cases_dir, directories.app_modules_dir, directories.test_suites_dir,
+                          directories.page_object_dir, directories.dataset_dir):
+            if directory.is_dir():
+                files.extend(
+                    path for path in sorted(directory.rglob("*.xml"))
+                    if not any(part in self.config.excluded_dirs for part in path.parts)
+                )
+        return files
+
+    def _submit(self, executor: Executor, analyzer) -> Future:
+        """Submit an analyzer to the executor."""
+        if self.executor_type == EXECUTOR_PROCESS:
+            worker_config = replace(self.config, xml_store=None, findings_cache=None)
+            return executor.submit(_run_analyzer_in_process, type(analyzer), worker_config)
+        return executor.submit(_run_timed, analyzer, time.thread_time)
+
+    def _collect(self, analyzer, future: Future, reporter) -> AnalysisResult:
+        """Wait for an analyzer's result and report it."""
+        reporter.report_check_start(analyzer.get_analyzer_name())
+
+        try:
+            outcome = future.result()
+            if self.executor_type == EXECUTOR_PROCESS:
+                result, usage = outcome
+                self._merge_usage(usage)
+            else:
+                result = outcome
+        except Exception as e:
+            result = self._create_failed_result(analyzer, e)
+
+        reporter.report_check_result(result)
+        return result
+
+    def _merge_usage(self, usage: Dict[str, Any]) -> None:
+        """Merge a worker process's counters into the parent's runtime objects."""
+        if self.config.xml_store is not None:
+            self.config.xml_store.merge_stats(usage["parse_stats"])
+        if self.config.findings_cache is not None:
+            self.config.findings_cache.merge_usage(usage["cache_usage"])
+
+    def _create_failed_result(self, analyzer, error: Exception) -> AnalysisResult:
+        """Create a failed result for an analyzer that raised an exception."""
+        error_msg = f"Analysis failed for {analyzer.get_analyzer_name()}: {str(error)}"
+        logger.error(error_msg)
+
+        return AnalysisResult(
+            check_name=analyzer.get_analyzer_name(),
+            success=False,
+            errors=[error_msg],
+            warnings=[],
+            metadata={"execution_time": 0.0, "files_processed": 0}
+        )
@@ -6,8 +6,10 @@ the static analysis framework.
 
 from .file_utils import FileUtils
 from .validation_utils import ValidationUtils
+from .findings_cache import FindingsCache
 
 __all__ = [
     "FileUtils",
-    "ValidationUtils"
+    "ValidationUtils",
+    "FindingsCache"
 ]
\ No newline at end of file
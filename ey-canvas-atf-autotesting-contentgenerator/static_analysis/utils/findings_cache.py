@@ -0,0 +1,241 @@
+"""Persistent incremental cache for per-file analysis findings.
+
+This module stores each analyzer's per-file findings on disk, keyed by the
+file content hash, so that a rerun only re-analyzes files that changed since
+the previous run and reuses cached findings for everything else.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple
+import hashlib
+import json
+import logging
+import os
+import re
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+class FindingsCache:
+    """On-disk cache of per-file analyzer findings.
+
+    Findings are grouped in namespaces (one per analyzer and analyzer version)
+    and stored as one JSON file per namespace in the cache directory. An entry
+    is only reused when the content hash of the file still matches, so edits,
+    renames and checkouts are picked up automatically.
+    """
+
+    CACHE_FORMAT_VERSION = 1
+    MISSING = object()
+
+    def __init__(self, cache_dir: Path, tool_version: str = "",
+                 enabled: bool = True, rebuild: bool = False):
+        """Initialize the findings cache.
+
+        Args:
+            cache_dir: Directory where cache files are stored
+            tool_version: Version of the static analysis package; a mismatch invalidates the cache
+            enabled: Whether cached findings should be read and written at all
+            rebuild: Ignore existing cache contents and write a fresh cache
+        """
+        self.cache_dir = Path(cache_dir)
+        self.tool_version = tool_version
+        self.enabled = enabled
+        self.rebuild = rebuild
+
+        self._namespaces: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._touched: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._hashes: Dict[Path, Tuple[float, int, str]] = {}
+        self._reused_files: Set[Path] = set()
+        self._analyzed_files: Set[Path] = set()
+        self._lock = Lock()
+
+    def get(self, namespace: str, file_path: Path) -> Any:
+        """Get cached findings for a file.
+
+        Args:
+            namespace: Cache namespace (analyzer name and version)
+            file_path: File the findings belong to
+
+        Returns:
+            Cached findings, or FindingsCache.MISSING if unavailable or stale
+        """
+        if not self.enabled:
+            return self.MISSING
+
+        file_path = Path(file_path).resolve()
+        content_hash = self.get_file_hash(file_path)
+        if content_hash is None:
+            return self.MISSING
+
+        with self._lock:
+            entries = self._load_namespace(namespace)
+            entry = entries.get(str(file_path))
+
+            if entry is None or entry.get("hash") != content_hash:
+                return self.MISSING
+
+            self._touched.setdefault(namespace, {})[str(file_path)] = entry
+            self._reused_files.add(file_path)
+            return entry["value"]
+
+    def put(self, namespace: str, file_path: Path, value: Any) -> None:
+        """Store findings for a file.
+
+        Args:
+            namespace: Cache namespace (analyzer name and version)
+            file_path: File the findings belong to
+            value: JSON-serializable findings
+        """
+        file_path = Path(file_path).resolve()
+
+        with self._lock:
+            self._analyzed_files.add(file_path)
+
+        if not self.enabled:
+            return
+
+        content_hash = self.get_file_hash(file_path)
+        if content_hash is None:
+            return
+
+        with self._lock:
+            self._touched.setdefault(namespace, {})[str(file_path)] = {
+                "hash": content_hash,
+                "value": value
+            }
+
+    def save(self) -> None:
+        """Write all findings used or produced in this run to disk.
+
+        Entries that were not touched during the run (deleted or no longer
+        referenced files) are dropped so the cache does not grow unbounded.
+        """
+        if not self.enabled:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Cannot create cache directory {self.cache_dir}: {e}")
+            return
+
+        with self._lock:
+            touched = {namespace: dict(entries) for namespace, entries in self._touched.items()}
+
+        for namespace, entries in touched.items():
+            cache_file = self._get_cache_file(namespace)
+            payload = {
+                "format_version": self.CACHE_FORMAT_VERSION,
+                "tool_version": self.tool_version,
+                "namespace": namespace,
+                "entries": entries
+            }
+            temp_file = cache_file.with_suffix(".tmp")
+
+            try:
+                with open(temp_file, "w", encoding="utf-8") as file:
+                    json.dump(payload, file)
+                os.replace(temp_file, cache_file)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Failed to write cache file {cache_file}: {e}")
+
+    def get_file_hash(self, file_path: Path) -> Optional[str]:
+        """Get the SHA-256 content hash of a file, memoized per file state.
+
+        Args:
+            file_path: File to hash
+
+        Returns:
+            Hex digest of the file content, or None if the file cannot be read
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._hashes.get(file_path)
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                return cached[2]
+
+        try:
+            content_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+        with self._lock:
+            self._hashes[file_path] = (stat.st_mtime, stat.st_size, content_hash)
+        return content_hash
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get file reuse statistics for this run.
+
+        A file counts as reused only if no analyzer had to re-analyze it.
+
+        Returns:
+            Dictionary with total, reused and analyzed file counts
+        """
+        with self._lock:
+            all_files = self._reused_files | self._analyzed_files
+            reused_files = self._reused_files - self._analyzed_files
+            return {
+                "enabled": int(self.enabled),
+                "files": len(all_files),
+                "reused": len(reused_files),
+                "analyzed": len(self._analyzed_files)
+            }
+
+    def get_usage(self) -> Dict[str, List[str]]:
+        """Get the files reused and analyzed in this run.
+
+        Returns:
+            Dictionary with 'reused' and 'analyzed' lists of file paths
+        """
+        with self._lock:
+            return {
+                "reused": sorted(str(file_path) for file_path in self._reused_files),
+                "analyzed": sorted(str(file_path) for file_path in self._analyzed_files)
+            }
+
+    def merge_usage(self, usage: Dict[str, List[str]]) -> None:
+        """Merge file usage recorded by another cache instance (e.g. a worker process).
+
+        Args:
+            usage: File usage as returned by get_usage()
+        """
+        with self._lock:
+            self._reused_files.update(Path(file_path) for file_path in usage.get("reused", []))
+            self._analyzed_files.update(Path(file_path) for file_path in usage.get("analyzed", []))
+
+    def _load_namespace(self, namespace: str) -> Dict[str, Dict[str, Any]]:
+        """Load a namespace from disk on first use (caller holds the lock)."""
+        if namespace in self._namespaces:
+            return self._namespaces[namespace]
+
+        entries = {}
+        cache_file = self._get_cache_file(namespace)
+
+        if not self.rebuild and cache_file.exists():
+            try:
+                with open(cache_file, "r", encoding="utf-8") as file:
+                    payload = json.load(file)
+
+                if (payload.get("format_version") == self.CACHE_FORMAT_VERSION and
+                        payload.get("tool_version") == self.tool_version and
+                        payload.get("namespace") == namespace):
+                    entries = payload.get("entries", {})
+                else:
+                    logger.debug(f"Discarding outdated cache file {cache_file}")
+
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+
+        self._namespaces[namespace] = entries
+        return entries
+
+    def _get_cache_file(self, namespace: str) -> Path:
+        """Get the cache file path for a namespace."""
+        safe_name = re.sub(r"[^\w.-]", "_", namespace)
+        return self.cache_dir / f"{safe_name}.json"